@@ -1,10 +1,55 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+
 from voice_assistant.assistant import VoiceAssistant
 
 
-def main() -> None:
+def _replay(path: str, data_dir: str | None, show_replies: bool) -> int:
+    from voice_assistant.config import Settings
+    from voice_assistant.replay import format_report, isolated_settings, read_utterances, replay
+
+    with tempfile.TemporaryDirectory(prefix="nova-replay-") as scratch:
+        # Replays write to a scratch copy of the state unless --data-dir says otherwise.
+        settings = isolated_settings(Settings(), data_dir or scratch)
+        assistant = VoiceAssistant(settings=settings, headless=True)
+        try:
+            report = replay(assistant, read_utterances(path))
+        finally:
+            assistant.close()
+    if show_replies:
+        for command, replies in report.replies:
+            print(f"> {command}")
+            for reply in replies:
+                print(f"  {reply}")
+    print(format_report(report))
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Nova voice assistant.")
+    parser.add_argument("--replay", metavar="FILE", help="run the commands in FILE (text or JSONL) headless and report latency")
+    parser.add_argument("--data-dir", help="state directory for --replay (default: a temporary directory)")
+    parser.add_argument("--show-replies", action="store_true", help="print every reply captured during --replay")
+    parser.add_argument("--serve", action="store_true", help="serve text commands for many users over HTTP")
+    parser.add_argument("--host", help="address for --serve (default: SERVER_HOST)")
+    parser.add_argument("--port", type=int, help="port for --serve (default: SERVER_PORT)")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        return _replay(args.replay, args.data_dir, args.show_replies)
+    if args.serve:
+        from voice_assistant.config import Settings
+        from voice_assistant.server import serve
+
+        serve(Settings(), host=args.host, port=args.port)
+        return 0
     assistant = VoiceAssistant()
     assistant.run()
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Micro-benchmarks for assistant hot paths."""
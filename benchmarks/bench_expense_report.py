@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import argparse
+from datetime import date, timedelta
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_persistence import _store
+from voice_assistant.skills.expenses import month_range, monthly_expense_report_text
+
+
+def _ledger(size: int, today: date) -> list[dict[str, object]]:
+    # Spread over roughly ten years, so the current month holds a small slice.
+    return [
+        {"amount": float(idx % 500), "category": f"cat{idx % 12}", "date": (today - timedelta(days=idx % 3650)).isoformat()}
+        for idx in range(size)
+    ]
+
+
+def _per_report_ms(size: int, reports: int) -> tuple[float, float]:
+    today = date.today()
+    expenses = _ledger(size, today)
+    start, end = month_range(today)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = _store(Path(tmp))
+        store.save_expenses(expenses)
+        before = time.perf_counter()
+        for _ in range(reports):
+            monthly_expense_report_text(expenses)
+        in_memory = (time.perf_counter() - before) / reports * 1000
+        before = time.perf_counter()
+        for _ in range(reports):
+            store.expense_total(start, end)
+            store.top_expense_categories(start, end)
+        in_sql = (time.perf_counter() - before) / reports * 1000
+        store.close()
+    return in_memory, in_sql
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Monthly expense report: Python scan of the ledger vs SQL aggregates.")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated ledger sizes")
+    parser.add_argument("--reports", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'python scan ms':>15} {'sql ms':>8}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        in_memory, in_sql = _per_report_ms(size, args.reports)
+        print(f"{size:>8} {in_memory:>15.2f} {in_sql:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+import json
+from pathlib import Path
+import random
+import re
+import sys
+import time
+
+from voice_assistant.intents import (
+    INTENT_RULES,
+    _normalize_text,
+    disable_intent_cache,
+    normalization_tables,
+    parse_intent,
+)
+from voice_assistant.perf import summarize
+
+
+_OBJECTS = ("drink water", "github", "python decorators", "finish the portfolio", "mom", "binary search")
+_FILLERS = ("", "please ", "hey nova ", "can you ")
+_NAMES = ("ravi", "anita", "maria", "john")
+_REWRITES, _PHRASES, _TOKENS = normalization_tables()
+_SLANG = tuple(_TOKENS)
+
+
+def _phone(rng: random.Random) -> str:
+    digits = "".join(rng.choice("0123456789") for _ in range(10))
+    return rng.choice((digits, f"+91 {digits[:5]} {digits[5:]}", f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"))
+
+
+def _rewrite_prefix(pattern: str) -> str:
+    prefix = pattern.lstrip("^").replace(r"\s+(.+)$", "").rstrip("$")
+    return re.sub(r"\[(.)[^\]]*\]", r"\1", prefix)
+
+
+def _english(rng: random.Random) -> str:
+    rule = rng.choice(INTENT_RULES)
+    filler = rng.choice(_FILLERS)
+    if rule.phrases:
+        return f"{filler}{rng.choice(rule.phrases)}{rng.choice(_OBJECTS)}"
+    if rule.exact:
+        return rng.choice(rule.exact)
+    if rule.extract is None:
+        return f"{filler}{rng.choice(rule.keywords).strip()}"
+    return f"{filler}{rng.choice(rule.keywords).strip()} {rng.choice(_OBJECTS)}"
+
+
+def _multilingual(rng: random.Random) -> str:
+    if rng.random() < 0.5:
+        return rng.choice(list(_PHRASES))
+    pattern, _ = rng.choice(_REWRITES)
+    prefix = _rewrite_prefix(pattern)
+    return prefix if pattern.endswith("$") and r"(.+)" not in pattern else f"{prefix} {rng.choice(_OBJECTS)}"
+
+
+def _slang(rng: random.Random) -> str:
+    words = [rng.choice(_SLANG) for _ in range(rng.randint(1, 3))]
+    return " ".join(words + [rng.choice(("remind me to call mom", "open github", "wyd", "how r u"))])
+
+
+def _structured(rng: random.Random) -> str:
+    name = rng.choice(_NAMES)
+    templates = (
+        f"call {_phone(rng)}",
+        f"dial {name}",
+        f"send to {_phone(rng)} message i will be late",
+        f"text {name} saying running late",
+        f"whatsapp {name} message see you soon",
+        f"add contact {name} number {_phone(rng)}",
+        f"spent {rng.randint(10, 999)} on {rng.choice(('food', 'travel', 'books'))}",
+        f"add expense {rng.randint(10, 999)}.{rng.randint(0, 99)} groceries",
+        f"add event exam revision at 2026-0{rng.randint(1, 9)}-1{rng.randint(0, 9)} 18:00",
+        f"schedule event standup on 2026-03-0{rng.randint(1, 9)}",
+        f"what is {rng.randint(1, 99)} * {rng.randint(1, 99)}",
+        f"translate good morning to {rng.choice(('hindi', 'telugu', 'spanish'))}",
+    )
+    return rng.choice(templates)
+
+
+_GENERATORS = ((_english, 0.45), (_multilingual, 0.2), (_slang, 0.1), (_structured, 0.25))
+
+
+def build_corpus(size: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    generators = [gen for gen, _ in _GENERATORS]
+    weights = [weight for _, weight in _GENERATORS]
+    corpus = []
+    for _ in range(size):
+        text = rng.choices(generators, weights)[0](rng)
+        if rng.random() < 0.1:
+            text = text.upper() + rng.choice(("!", "?", " ."))
+        corpus.append(text)
+    return corpus
+
+
+def _time_us(func, text: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    return (time.perf_counter() - start) / repeat * 1_000_000
+
+
+def run(corpus: list[str], repeat: int) -> dict[str, dict[str, dict[str, float]]]:
+    disable_intent_cache()
+    samples: dict[str, dict[str, list[float]]] = defaultdict(lambda: {"normalize": [], "parse": []})
+    for text in corpus:
+        intent = parse_intent(text)
+        bucket = samples[intent.intent_type.value]
+        bucket["normalize"].append(_time_us(_normalize_text, text, repeat))
+        bucket["parse"].append(_time_us(parse_intent, text, repeat))
+    everything = {
+        stage: [value for bucket in samples.values() for value in bucket[stage]] for stage in ("normalize", "parse")
+    }
+    report = {name: {stage: summarize(values) for stage, values in bucket.items()} for name, bucket in samples.items()}
+    report["ALL"] = {stage: summarize(values) for stage, values in everything.items()}
+    return report
+
+
+def regressions(
+    report: dict[str, dict[str, dict[str, float]]],
+    baseline: dict[str, dict[str, dict[str, float]]],
+    threshold: float,
+    min_count: int = 20,
+    tail_min_count: int = 100,
+) -> list[str]:
+    """List every intent/stage/percentile that got slower than ``baseline`` by more than ``threshold``.
+
+    p99 is gated too once both runs have ``tail_min_count`` samples; below that
+    it is just the slowest sample.
+    """
+    found = []
+    for name, stages in report.items():
+        for stage, summary in stages.items():
+            previous = baseline.get(name, {}).get(stage)
+            if not previous:
+                continue
+            count = min(summary["count"], previous["count"])
+            if count < min_count:
+                continue
+            keys = ("p50", "p95", "p99") if count >= tail_min_count else ("p50", "p95")
+            for key in keys:
+                if previous.get(key, 0) > 0 and summary[key] > previous[key] * (1 + threshold):
+                    found.append(f"{name} {stage} {key}: {previous[key]:.1f}us -> {summary[key]:.1f}us")
+    return found
+
+
+def _print_report(report: dict[str, dict[str, dict[str, float]]]) -> None:
+    print(f"{'intent':<24}{'n':>6}  {'norm p50':>9}{'p95':>8}{'p99':>8}  {'parse p50':>10}{'p95':>8}{'p99':>8}")
+    for name in sorted(report, key=lambda key: (key == "ALL", key)):
+        norm = report[name]["normalize"]
+        parse = report[name]["parse"]
+        print(
+            f"{name:<24}{int(parse['count']):>6}  {norm['p50']:>9.1f}{norm['p95']:>8.1f}{norm['p99']:>8.1f}"
+            f"  {parse['p50']:>10.1f}{parse['p95']:>8.1f}{parse['p99']:>8.1f}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time intent normalization and parsing per intent type (microseconds).")
+    parser.add_argument("--size", type=int, default=5000, help="number of generated utterances")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=5, help="timed calls per utterance")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write the report as a JSON baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown, e.g. 0.25 for 25%%")
+    args = parser.parse_args()
+
+    report = run(build_corpus(args.size, args.seed), max(1, args.repeat))
+    _print_report(report)
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"Baseline saved to {args.save_baseline}")
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        found = regressions(report, baseline, args.threshold)
+        if found:
+            print(f"Regressions beyond {args.threshold:.0%}:")
+            for line in found:
+                print(f"  {line}")
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
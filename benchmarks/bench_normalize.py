@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from voice_assistant.intents import _normalize_text, normalization_tables
+from voice_assistant.normalizer import normalize_reference
+
+
+SAMPLES = (
+    "what time is it",
+    "show tasks",
+    "plz open github",
+    "gud mrng bro",
+    "remind me to submit resume",
+    "recuerdame beber agua",
+    "నాకు గుర్తు చేయి నీళ్లు తాగు",
+    "खोलो github",
+    "ela unav",
+    "add event exam revision at 2026-02-20 18:00",
+    "send to 9876543210 message I will be late!",
+    "what is this life brooo",
+)
+
+
+_TABLES = normalization_tables()
+
+
+def _reference(text: str) -> str:
+    return normalize_reference(text, *_TABLES)
+
+
+def _per_call_us(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for sample in SAMPLES:
+            func(sample)
+    elapsed = time.perf_counter() - start
+    return elapsed / (iterations * len(SAMPLES)) * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare the compiled normalizer with the sequential reference.")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    for sample in SAMPLES:
+        assert _normalize_text(sample) == _reference(sample), sample
+
+    reference_us = _per_call_us(_reference, args.iterations)
+    compiled_us = _per_call_us(_normalize_text, args.iterations)
+    print(f"sequential reference: {reference_us:8.2f} us/utterance")
+    print(f"compiled normalizer:  {compiled_us:8.2f} us/utterance")
+    print(f"speedup:              {reference_us / compiled_us:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from voice_assistant.storage.sqlite_store import MigrationSources, SQLiteStore
+from voice_assistant.storage.tracking import TrackedList
+
+
+def _store(directory: Path) -> SQLiteStore:
+    names = ("reminders", "tasks", "profile", "expenses", "habits", "contacts", "events")
+    files = {f"{name}_file": str(directory / f"{name}.json") for name in names}
+    return SQLiteStore(
+        str(directory / "state.db"),
+        MigrationSources(history_file=str(directory / "history.jsonl"), **files),
+    )
+
+
+def _expense(idx: int) -> dict[str, object]:
+    return {"amount": float(idx % 500), "category": f"cat{idx % 12}", "date": "2026-02-18"}
+
+
+def _per_mutation_ms(size: int, mutations: int, incremental: bool) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = _store(Path(tmp))
+        store.save_expenses([_expense(idx) for idx in range(size)])
+        expenses = TrackedList.from_rows(store.expense_rows())
+        start = time.perf_counter()
+        for idx in range(mutations):
+            expenses.append(_expense(size + idx))
+            if incremental:
+                store.apply_expense_changes(expenses.drain_changes())
+            else:
+                store.save_expenses(expenses)
+        elapsed = time.perf_counter() - start
+        assert len(store.load_expenses()) == size + mutations
+    return elapsed / mutations * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cost of saving one new expense as the ledger grows.")
+    parser.add_argument("--sizes", default="100,1000,10000,50000", help="comma-separated ledger sizes")
+    parser.add_argument("--mutations", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'full rewrite ms':>16} {'delta ms':>10}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        full = _per_mutation_ms(size, args.mutations, incremental=False)
+        delta = _per_mutation_ms(size, args.mutations, incremental=True)
+        print(f"{size:>8} {full:>16.2f} {delta:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
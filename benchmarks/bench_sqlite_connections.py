@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from voice_assistant.storage.sqlite_store import MigrationSources, SQLiteStore
+from voice_assistant.storage.tracking import TrackedList
+
+
+class _ConnectPerCallStore(SQLiteStore):
+    """The previous behaviour: a fresh default-mode connection for every call."""
+
+    def __init__(self, db_path: str, sources: MigrationSources) -> None:
+        super().__init__(db_path, sources, persistent_connections=False)
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+
+def _store(directory: Path, mode: str) -> SQLiteStore:
+    names = ("reminders", "tasks", "profile", "expenses", "habits", "contacts", "events")
+    files = {f"{name}_file": str(directory / f"{name}.json") for name in names}
+    sources = MigrationSources(history_file=str(directory / "history.jsonl"), **files)
+    db_path = str(directory / "state.db")
+    if mode == "per-call":
+        return _ConnectPerCallStore(db_path, sources)
+    return SQLiteStore(db_path, sources, persistent_connections=True)
+
+
+def _workloads(store: SQLiteStore) -> dict[str, Callable[[int], None]]:
+    tasks = TrackedList.from_rows(store.task_rows())
+
+    def add_task(idx: int) -> None:
+        tasks.append({"text": f"task {idx}", "done": False})
+        store.apply_task_changes(tasks.drain_changes())
+
+    return {
+        "append_history": lambda idx: store.append_history("user", f"command {idx}"),
+        "add_task": add_task,
+        "load_tasks": lambda idx: store.load_tasks(),
+        "history_text": lambda idx: store.history_text(),
+    }
+
+
+def _ops_per_second(job: Callable[[int], None], ops: int) -> float:
+    start = time.perf_counter()
+    for idx in range(ops):
+        job(idx)
+    return ops / (time.perf_counter() - start)
+
+
+def _reads_while_writing(store: SQLiteStore, seconds: float) -> float:
+    """Dashboard-style reads per second on one thread while another thread keeps writing."""
+    stop = threading.Event()
+
+    def writer() -> None:
+        idx = 0
+        while not stop.is_set():
+            store.append_history("assistant", f"reply {idx}")
+            idx += 1
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    reads = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        store.history_entries()
+        reads += 1
+    stop.set()
+    thread.join()
+    return reads / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SQLiteStore throughput: connect per call vs persistent WAL connections.")
+    parser.add_argument("--ops", type=int, default=500, help="operations per workload")
+    parser.add_argument("--seconds", type=float, default=1.0, help="duration of the concurrent read test")
+    args = parser.parse_args()
+
+    results: dict[str, dict[str, float]] = {}
+    for mode in ("per-call", "persistent"):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = _store(Path(tmp), mode)
+            results[mode] = {name: _ops_per_second(job, args.ops) for name, job in _workloads(store).items()}
+            results[mode]["reads during writes"] = _reads_while_writing(store, args.seconds)
+            store.close()
+
+    print(f"{'workload':<22} {'per-call ops/s':>15} {'persistent ops/s':>17} {'speed-up':>9}")
+    for name, before in results["per-call"].items():
+        after = results["persistent"][name]
+        print(f"{name:<22} {before:>15.0f} {after:>17.0f} {after / before:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
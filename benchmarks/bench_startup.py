@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+
+def import_times(module: str) -> dict[str, float]:
+    """Import ``module`` in a fresh interpreter; return cumulative ms per imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def measure(module: str, runs: int) -> dict[str, object]:
+    samples = [import_times(module) for _ in range(runs)]
+    totals = [sample.get(module, 0.0) for sample in samples]
+    median_run = samples[totals.index(sorted(totals)[len(totals) // 2])]
+    return {
+        "module": module,
+        "runs": runs,
+        "total_ms": statistics.median(totals),
+        "modules": dict(sorted(median_run.items(), key=lambda item: item[1], reverse=True)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report cold-start import time of the assistant.")
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=12, help="slowest imported modules to list")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write the report as a JSON baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against a saved baseline")
+    args = parser.parse_args()
+
+    report = measure(args.module, max(1, args.runs))
+    print(f"import {args.module}: {report['total_ms']:.1f} ms (median of {args.runs} cold starts)")
+    modules: dict[str, float] = report["modules"]  # type: ignore[assignment]
+    for name, elapsed in list(modules.items())[1 : args.top + 1]:
+        print(f"  {elapsed:8.1f} ms  {name}")
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Baseline saved to {args.save_baseline}")
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        before = float(baseline["total_ms"])
+        print(f"baseline: {before:.1f} ms -> now: {report['total_ms']:.1f} ms ({before / report['total_ms']:.1f}x)")
+        loaded_before = set(baseline["modules"])
+        no_longer = sorted(loaded_before - set(modules), key=lambda name: -baseline["modules"][name])
+        if no_longer:
+            print("no longer imported at startup: " + ", ".join(no_longer[: args.top]))
+
+
+if __name__ == "__main__":
+    main()
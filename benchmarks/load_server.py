@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+import json
+import random
+import tempfile
+import threading
+import time
+from urllib import request
+
+from voice_assistant.config import Settings
+from voice_assistant.logging_setup import setup_logging
+from voice_assistant.perf import summarize
+from voice_assistant.server import CommandServer, SessionPool
+
+COMMANDS = (
+    "add task review notes {n}",
+    "show tasks",
+    "remind me to drink water {n}",
+    "list reminders",
+    "add expense {n} for food",
+    "show expenses",
+    "what time is it",
+    "complete task 1",
+    "hello",
+    "add contact friend{n} 98765{n:05d}",
+)
+
+
+def _post(url: str, user: str, text: str) -> float:
+    body = json.dumps({"user": user, "text": text}).encode("utf-8")
+    req = request.Request(url, data=body, headers={"Content-Type": "application/json"})
+    started = time.perf_counter()
+    with request.urlopen(req, timeout=30) as response:
+        response.read()
+    return time.perf_counter() - started
+
+
+def run(url: str, users: int, commands: int, concurrency: int, seed: int) -> dict[str, object]:
+    rng = random.Random(seed)
+    jobs = [
+        (f"user{idx % users:04d}", rng.choice(COMMANDS).format(n=rng.randrange(1, 99999)))
+        for idx in range(users * commands)
+    ]
+    rng.shuffle(jobs)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(lambda job: _post(url, *job), jobs))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(jobs),
+        "elapsed": elapsed,
+        "requests_per_second": len(jobs) / elapsed,
+        "latency_ms": summarize([value * 1000 for value in latencies]),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent load against the multi-user command server.")
+    parser.add_argument("--url", help="server base URL (default: start one in-process on a free port)")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--commands", type=int, default=20, help="commands per user")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--max-sessions", type=int, default=256, help="pool size for the in-process server")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    server = None
+    scratch = None
+    url = args.url
+    if url is None:
+        scratch = tempfile.TemporaryDirectory(prefix="nova-load-")
+        setup_logging(f"{scratch.name}/server.log", "WARNING")
+        settings = replace(Settings(), llm_enabled=False, use_sqlite_storage=True)
+        server = CommandServer(SessionPool(settings, scratch.name, max_sessions=args.max_sessions), port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        report = run(url.rstrip("/") + "/command", args.users, args.commands, args.concurrency, args.seed)
+    finally:
+        if server is not None:
+            stats = server.pool.stats()
+            server.shutdown()
+            server.server_close()
+            print(f"sessions opened: {stats['opened']}, evicted: {stats['evicted']}")
+        if scratch is not None:
+            scratch.cleanup()
+    latency = report["latency_ms"]
+    print(
+        f"{report['requests']} requests from {args.users} users at concurrency {args.concurrency}: "
+        f"{report['requests_per_second']:.1f} req/s"
+    )
+    print(f"latency ms: p50 {latency['p50']:.2f}  p95 {latency['p95']:.2f}  p99 {latency['p99']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
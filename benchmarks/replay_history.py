@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+
+from voice_assistant.config import Settings
+from voice_assistant.intents import BatchParseStats, parse_intents
+from voice_assistant.storage.sqlite_store import MigrationSources, SQLiteStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-parse every stored user command and report throughput.")
+    parser.add_argument("--db", default=Settings().sqlite_db_file)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    settings = Settings()
+    store = SQLiteStore(
+        args.db,
+        sources=MigrationSources(
+            reminders_file=settings.reminders_file,
+            tasks_file=settings.tasks_file,
+            profile_file=settings.profile_file,
+            expenses_file=settings.expenses_file,
+            habits_file=settings.habits_file,
+            history_file=settings.history_file,
+            contacts_file=settings.contacts_file,
+            events_file=settings.events_file,
+        ),
+    )
+    commands = (row["text"] for row in store.iter_history(role="user"))
+    stats = BatchParseStats()
+    counts = Counter(
+        intent.intent_type.value
+        for intent in parse_intents(commands, workers=args.workers, chunk_size=args.chunk_size, stats=stats)
+    )
+    print(f"parsed {stats.count} commands in {stats.elapsed:.2f}s ({stats.per_second:,.0f} utterances/s)")
+    for name, count in counts.most_common():
+        print(f"  {name:24} {count}")
+
+
+if __name__ == "__main__":
+    main()
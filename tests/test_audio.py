@@ -0,0 +1,124 @@
+import threading
+from types import SimpleNamespace
+
+import voice_assistant.audio as audio
+from voice_assistant.audio import Speaker
+
+
+class _FakeEngine:
+    """Fires the started-word callback per word and holds after the first one.
+
+    ``speaking`` is set once the first word has started; no later word is
+    spoken until the test sets ``release``.
+    """
+
+    def __init__(self) -> None:
+        self.thread: threading.Thread | None = None
+        self.spoken: list[str] = []
+        self.cut: list[str] = []
+        self.speaking = threading.Event()
+        self.release = threading.Event()
+        self._queue: list[str] = []
+        self._stopped = False
+        self._on_word = None
+
+    def setProperty(self, name: str, value: object) -> None:
+        pass
+
+    def connect(self, topic: str, callback) -> None:
+        self._on_word = callback
+
+    def say(self, text: str) -> None:
+        self.thread = threading.current_thread()
+        self._queue.append(text)
+
+    def runAndWait(self) -> None:
+        self._stopped = False
+        text = self._queue.pop(0)
+        for word in text.split():
+            self._on_word(None, 0, len(word))
+            if self._stopped:
+                self.cut.append(text)
+                return
+            self.speaking.set()
+            assert self.release.wait(timeout=5)
+        self.spoken.append(text)
+
+    def stop(self) -> None:
+        self._stopped = True
+
+
+def _threaded_speaker(monkeypatch) -> tuple[Speaker, _FakeEngine]:
+    engine = _FakeEngine()
+    monkeypatch.setattr(audio, "pyttsx3", SimpleNamespace(init=lambda: engine))
+    return Speaker(threaded=True), engine
+
+
+def test_say_async_returns_before_speech_finishes(monkeypatch) -> None:
+    speaker, engine = _threaded_speaker(monkeypatch)
+    # The engine cannot finish until released, so both calls returning means neither waited for speech.
+    speaker.say_async("one two three four five six seven eight")
+    speaker.say_async("second reply")
+    assert engine.speaking.wait(timeout=2)
+    assert speaker.is_speaking() and not speaker.wait(timeout=0)
+    assert engine.spoken == []
+    engine.release.set()
+    assert speaker.wait(timeout=2)
+    assert engine.spoken == ["one two three four five six seven eight", "second reply"]
+    assert engine.thread is not threading.current_thread()
+    speaker.close()
+
+
+def test_stop_cuts_off_current_reply_and_drops_queue(monkeypatch) -> None:
+    speaker, engine = _threaded_speaker(monkeypatch)
+    speaker.say_async(" ".join(["word"] * 50))
+    speaker.say_async("queued reply")
+    assert engine.speaking.wait(timeout=2)
+    speaker.stop()
+    engine.release.set()
+    assert speaker.wait(timeout=1)
+    assert engine.spoken == []
+    assert len(engine.cut) == 1
+    assert speaker.interruptions == 1
+
+    speaker.say_async("after barge in")
+    speaker.close()
+    assert engine.spoken == ["after barge in"]
+
+
+def test_disabled_speaker_is_not_threaded() -> None:
+    speaker = Speaker(enabled=False, threaded=True)
+    assert not speaker.threaded
+    speaker.say_async("hello")
+    assert speaker.wait(timeout=0)
+    speaker.close()
+
+
+def test_async_conversation_always_uses_the_threaded_speaker(monkeypatch, tmp_path) -> None:
+    from dataclasses import replace
+
+    from voice_assistant.assistant import VoiceAssistant
+    from voice_assistant.config import Settings
+    from voice_assistant.replay import isolated_settings
+
+    engine = _FakeEngine()
+    monkeypatch.setattr(audio, "pyttsx3", SimpleNamespace(init=lambda: engine))
+    monkeypatch.setattr(audio, "sr", None)
+    settings = replace(
+        isolated_settings(Settings(), str(tmp_path)),
+        llm_enabled=False,
+        use_sqlite_storage=False,
+        async_conversation=True,
+        threaded_tts=False,
+        history_retention_days=0,
+        history_max_rows=0,
+    )
+    assistant = VoiceAssistant(settings=settings)
+    try:
+        assert assistant.speaker.threaded
+        engine.release.set()
+        assistant.speaker.say_async("hello")
+        assert assistant.speaker.wait(timeout=2)
+        assert engine.thread is not threading.current_thread()
+    finally:
+        assistant.close()
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import time
+
+from voice_assistant.conversation import ConversationEngine
+
+
+def _engine(utterances: list[str | None], speak_seconds: float, **kwargs) -> tuple[ConversationEngine, list[str], list[str]]:
+    script = iter(utterances)
+    spoken: list[str] = []
+    handled: list[str] = []
+    stop = threading.Event()
+
+    def listen() -> str | None:
+        time.sleep(0.01)
+        try:
+            item = next(script)
+        except StopIteration:
+            raise EOFError
+        return item
+
+    def handle(command: str) -> bool:
+        handled.append(command)
+        engine.reply(f"reply to {command}")
+        return command != "exit"
+
+    def speak(text: str) -> None:
+        stop.clear()
+        if not stop.wait(speak_seconds):
+            spoken.append(text)
+
+    engine = ConversationEngine(listen, handle, speak, stop_speaking=stop.set, **kwargs)
+    return engine, spoken, handled
+
+
+def test_commands_are_captured_while_replies_play() -> None:
+    engine, spoken, handled = _engine(["one", "two", "exit"], speak_seconds=0.05, barge_in=False)
+    started = time.perf_counter()
+    asyncio.run(engine.run())
+    assert handled == ["one", "two", "exit"]
+    assert spoken == ["reply to one", "reply to two", "reply to exit"]
+    assert time.perf_counter() - started < 0.05 * 3 + 0.1
+    assert not engine.ended_by_eof
+
+
+def test_barge_in_stops_the_current_reply() -> None:
+    engine, spoken, handled = _engine(["one", None, "two", None, None], speak_seconds=1.0)
+    asyncio.run(engine.run())
+    assert handled == ["one", "two"]
+    assert engine.interruptions == 1
+    assert "reply to one" not in spoken
+    assert engine.ended_by_eof
+
+
+def test_exit_stops_listening_and_leaves_no_worker_behind() -> None:
+    calls: list[int] = []
+    blocked = threading.Event()
+
+    def listen() -> str | None:
+        calls.append(1)
+        if len(calls) == 1:
+            return "exit"
+        blocked.wait()  # like input() waiting for a line that never comes
+        return None
+
+    engine = ConversationEngine(
+        listen,
+        lambda command: command != "exit",
+        lambda text: None,
+        ends_session=lambda text: text == "exit",
+    )
+    asyncio.run(engine.run())
+    assert calls == [1]
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("nova-") and not thread.daemon]
+
+
+def test_listen_blocked_at_exit_runs_on_a_daemon_thread() -> None:
+    release = threading.Event()
+    script = iter(["exit"])
+
+    def listen() -> str | None:
+        try:
+            return next(script)
+        except StopIteration:
+            release.wait()
+            return None
+
+    engine = ConversationEngine(listen, lambda command: command != "exit", lambda text: None)
+    asyncio.run(engine.run())
+    listeners = [thread for thread in threading.enumerate() if thread.name == "nova-listen"]
+    assert all(thread.daemon for thread in listeners)
+    release.set()
+    for thread in listeners:
+        thread.join(1)
@@ -1,8 +1,15 @@
+from datetime import date
+from pathlib import Path
+
 from voice_assistant.skills.expenses import (
     add_expense,
+    expense_report_text,
+    month_range,
     monthly_expense_report_text,
     show_expenses_text,
+    summarize_expenses,
 )
+from voice_assistant.storage.sqlite_store import MigrationSources, SQLiteStore
 
 
 def test_add_and_show_expense() -> None:
@@ -16,3 +23,30 @@ def test_monthly_report_text() -> None:
     expenses = [{"amount": 100.0, "category": "food", "date": "2099-01-10"}]
     report = monthly_expense_report_text(expenses)
     assert isinstance(report, str)
+
+
+def test_month_range_rolls_over_the_year() -> None:
+    assert month_range(date(2026, 2, 18)) == ("2026-02-01", "2026-03-01")
+    assert month_range(date(2026, 12, 31)) == ("2026-12-01", "2027-01-01")
+
+
+def test_summary_matches_between_python_and_sql(tmp_path: Path) -> None:
+    expenses = [
+        {"amount": 40.0, "category": "food", "date": "2026-02-01"},
+        {"amount": 25.5, "category": "travel", "date": "2026-02-14"},
+        {"amount": 30.0, "category": "food", "date": "2026-02-28"},
+        {"amount": 99.0, "category": "rent", "date": "2026-03-01"},
+        {"amount": 5.0, "category": "books", "date": "2026-01-31"},
+    ]
+    names = ("reminders", "tasks", "profile", "expenses", "habits", "contacts", "events")
+    files = {f"{name}_file": str(tmp_path / f"{name}.json") for name in names}
+    store = SQLiteStore(str(tmp_path / "state.db"), MigrationSources(history_file=str(tmp_path / "h.jsonl"), **files))
+    store.save_expenses(expenses)
+
+    start, end = month_range(date(2026, 2, 10))
+    total, top = summarize_expenses(expenses, start, end, top=2)
+    assert total == store.expense_total(start, end) == 95.5
+    assert top == store.top_expense_categories(start, end, limit=2) == [("food", 70.0), ("travel", 25.5)]
+    assert expense_report_text(total, top) == "This month you spent 95.50. Top categories: food: 70.00, travel: 25.50."
+    assert store.expense_total("2025-01-01", "2025-02-01") == 0.0
+    assert expense_report_text(0.0, []) == "No expenses found for this month."
@@ -0,0 +1,16 @@
+from voice_assistant.fuzzy import FuzzyPhraseIndex, bounded_levenshtein
+
+
+def test_bounded_levenshtein_stops_at_limit() -> None:
+    assert bounded_levenshtein("show tasks", "shoe tasks", 2) == 1
+    assert bounded_levenshtein("kitten", "sitting", 3) == 3
+    assert bounded_levenshtein("kitten", "sitting", 1) == 2
+    assert bounded_levenshtein("abc", "abcdef", 2) == 3
+
+
+def test_corrections_replace_the_closest_window() -> None:
+    index = FuzzyPhraseIndex(("show tasks", "remind me to", "time"))
+    assert index.corrections("remind me too drink water")[0] == (1, "remind me to", "remind me to drink water")
+    assert index.corrections("shoe tasks") == [(1, "show tasks", "show tasks")]
+    assert index.corrections("tame") == []
+    assert index.corrections("show tasks") == []
@@ -0,0 +1,92 @@
+import subprocess
+import sys
+from types import SimpleNamespace
+
+from voice_assistant.config import Settings
+from voice_assistant.handlers import HANDLERS, dispatch
+from voice_assistant.intents import Intent, IntentType
+from voice_assistant.skills.translate import supported_languages_text
+from voice_assistant.undo import UndoJournal
+
+
+def _context() -> SimpleNamespace:
+    saved: list[str] = []
+    ctx = SimpleNamespace(
+        settings=Settings(),
+        profile={},
+        reminders=[],
+        tasks=[],
+        expenses=[],
+        habits={},
+        contacts={},
+        events=[],
+        google_enabled=False,
+        journal=UndoJournal(),
+        saved=saved,
+        _history_text=lambda: "history",
+        _clear_history=lambda: "History cleared.",
+        _expense_report_text=lambda: "No expenses found for this month.",
+        _search_history_text=lambda query: f"Nothing in the history mentions {query}.",
+    )
+    for name in ("profile", "reminders", "tasks", "expenses", "habits", "contacts", "events", "journal"):
+        setattr(ctx, f"_persist_{name}", lambda name=name: saved.append(name))
+    return ctx
+
+
+def test_every_actionable_intent_has_a_handler() -> None:
+    missing = set(IntentType) - set(HANDLERS) - {IntentType.EXIT, IntentType.UNKNOWN}
+    assert missing == set()
+
+
+def test_handlers_update_state_and_persist() -> None:
+    ctx = _context()
+    assert dispatch(ctx, Intent(IntentType.ADD_TASK, payload="write report")) == "Task added: write report"
+    assert ctx.tasks[0]["text"] == "write report"
+    assert ctx.saved == ["tasks", "journal"]
+    assert len(ctx.journal) == 1
+    assert dispatch(ctx, Intent(IntentType.UNDO)) == "Undid task add."
+    assert ctx.tasks == []
+    assert dispatch(ctx, Intent(IntentType.UNDO)) == "Nothing to undo."
+    assert dispatch(ctx, Intent(IntentType.REDO)) == "Redid task add."
+    assert ctx.tasks[0]["text"] == "write report"
+
+
+def test_undo_walks_back_several_commands() -> None:
+    ctx = _context()
+    dispatch(ctx, Intent(IntentType.ADD_TASK, payload="write report"))
+    dispatch(ctx, Intent(IntentType.ADD_TASK, payload="send invoice"))
+    dispatch(ctx, Intent(IntentType.COMPLETE_TASK, payload=1))
+    assert dispatch(ctx, Intent(IntentType.UNDO)) == "Undid task complete."
+    assert ctx.tasks[0]["done"] is False
+    assert dispatch(ctx, Intent(IntentType.UNDO)) == "Undid task add."
+    assert [task["text"] for task in ctx.tasks] == ["write report"]
+    ctx.tasks.clear()
+    assert dispatch(ctx, Intent(IntentType.UNDO)).startswith("I cannot undo that")
+    assert len(ctx.journal) == 0
+
+
+def test_missing_payload_falls_through() -> None:
+    ctx = _context()
+    assert dispatch(ctx, Intent(IntentType.ADD_REMINDER)) is None
+    assert dispatch(ctx, Intent(IntentType.UNKNOWN)) is None
+    assert ctx.saved == []
+
+
+def test_google_handlers_report_disabled_sync() -> None:
+    reply = dispatch(_context(), Intent(IntentType.GOOGLE_LOGIN))
+    assert reply == "Google sync is disabled. Set GOOGLE_SYNC_ENABLED=true in .env and retry."
+
+
+def test_heavy_skills_are_imported_on_first_use() -> None:
+    code = (
+        "import sys, voice_assistant.assistant\n"
+        "lazy = ['conversation', 'skills.translate', 'skills.web', 'skills.llm', 'skills.google_sync']\n"
+        "print(','.join(name for name in lazy if 'voice_assistant.' + name in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_skill_loads_module_when_called() -> None:
+    reply = dispatch(_context(), Intent(IntentType.SHOW_TRANSLATE_LANGS))
+    assert reply == supported_languages_text()
@@ -1,4 +1,29 @@
-from voice_assistant.intents import IntentType, parse_intent
+import multiprocessing
+from types import SimpleNamespace
+
+from voice_assistant.config import Settings
+from voice_assistant.intents import (
+    DEFAULT_LOCALES,
+    FUZZY_ATTEMPTS,
+    INTENT_RULES,
+    BatchParseStats,
+    CompiledRules,
+    IntentRule,
+    IntentType,
+    configure_locales,
+    disable_fuzzy_matching,
+    disable_intent_cache,
+    disable_intent_profiling,
+    enable_fuzzy_matching,
+    enable_intent_cache,
+    enable_intent_profiling,
+    format_intent_profile,
+    intent_cache_stats,
+    intent_profile,
+    parse_intent,
+    parse_intents,
+    rank_intents,
+)
 
 
 def test_exit_intent() -> None:
@@ -428,3 +453,168 @@ def test_google_push_events_intent() -> None:
 def test_undo_intent() -> None:
     intent = parse_intent("undo")
     assert intent.intent_type == IntentType.UNDO
+
+
+def test_intent_cache_hits_misses_and_evictions() -> None:
+    enable_intent_cache(maxsize=2)
+    try:
+        first = parse_intent("show tasks")
+        assert parse_intent("show tasks") is first
+        parse_intent("what time is it")
+        parse_intent("my reminders")
+        stats = intent_cache_stats()
+        assert stats is not None
+        assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 3, 1, 2)
+        assert parse_intent("show tasks").intent_type == IntentType.LIST_TASKS
+        assert intent_cache_stats().misses == 4
+    finally:
+        disable_intent_cache()
+    assert intent_cache_stats() is None
+
+
+def test_parse_intents_in_process_preserves_order() -> None:
+    commands = ["show tasks", "what time is it", "sing a song"] * 3
+    stats = BatchParseStats()
+    intents = list(parse_intents(iter(commands), workers=4, chunk_size=100, stats=stats))
+    assert intents == [parse_intent(command) for command in commands]
+    assert stats.count == len(commands)
+    assert stats.per_second > 0
+
+
+def test_parse_intents_process_pool_preserves_order() -> None:
+    commands = [f"add task item {idx}" for idx in range(50)] + ["show tasks"] * 50
+    intents = list(parse_intents(commands, workers=2, chunk_size=10))
+    assert intents == [parse_intent(command) for command in commands]
+
+
+def test_spawned_workers_use_the_callers_locales_and_fuzzy_setting() -> None:
+    commands = ["tareas", "kholo github", "shoe tasks", "show tasks"] * 5
+    configure_locales("es")
+    enable_fuzzy_matching()
+    try:
+        expected = [parse_intent(command) for command in commands]
+        assert expected[0].intent_type == IntentType.LIST_TASKS
+        assert expected[1].intent_type == IntentType.UNKNOWN
+        assert expected[2].intent_type == IntentType.LIST_TASKS
+        spawn = multiprocessing.get_context("spawn")
+        assert list(parse_intents(commands, workers=2, chunk_size=4, mp_context=spawn)) == expected
+    finally:
+        disable_fuzzy_matching()
+        configure_locales(DEFAULT_LOCALES)
+
+
+def test_intent_rules_have_unique_ascending_priorities() -> None:
+    priorities = [rule.priority for rule in INTENT_RULES]
+    assert priorities == sorted(set(priorities))
+
+
+def test_compiled_rules_follow_priority_not_table_order() -> None:
+    rules = CompiledRules(
+        (
+            IntentRule(IntentType.SEARCH_WEB, 20, phrases=("find ",)),
+            IntentRule(IntentType.SAVE_NOTE, 10, keywords=("note",)),
+        )
+    )
+    assert rules.dispatch("find my note").intent_type == IntentType.SAVE_NOTE
+    found = rules.dispatch("find my keys")
+    assert (found.intent_type, found.payload) == (IntentType.SEARCH_WEB, "my keys")
+    assert rules.dispatch("nothing").intent_type == IntentType.UNKNOWN
+
+
+def test_extractor_rules_reject_missing_payload() -> None:
+    assert parse_intent("call 9876543210").payload == "9876543210"
+    assert parse_intent("call mom").payload == "mom"
+    assert parse_intent("what is love").intent_type != IntentType.CALCULATE
+    assert parse_intent("what is 2 + 3").payload == "2 + 3"
+
+
+def test_intent_profiling_records_stages_and_extractors() -> None:
+    assert intent_profile() is None
+    enable_intent_profiling()
+    try:
+        parse_intent("show tasks")
+        parse_intent("whatsapp ravi message see you soon")
+        profile = intent_profile()
+        assert profile is not None
+        assert profile["normalize"].calls == 2
+        assert profile["total"].calls == 2
+        assert profile["extract:_extract_whatsapp"].calls == 1
+        assert profile["scan"].calls == 1
+        assert "extract:_extract_whatsapp" in format_intent_profile(limit=50)
+    finally:
+        disable_intent_profiling()
+    assert intent_profile() is None
+
+
+def test_fuzzy_matching_recovers_misheard_keywords() -> None:
+    assert parse_intent("shoe tasks").intent_type == IntentType.UNKNOWN
+    enable_fuzzy_matching()
+    try:
+        assert parse_intent("shoe tasks").intent_type == IntentType.LIST_TASKS
+        reminder = parse_intent("remind me too drink water")
+        assert (reminder.intent_type, reminder.payload) == (IntentType.ADD_REMINDER, "drink water")
+        assert parse_intent("whatsap ravi message see you").intent_type == IntentType.WHATSAPP_MESSAGE
+        assert parse_intent("will you marry me").intent_type == IntentType.UNKNOWN
+    finally:
+        disable_fuzzy_matching()
+
+
+def test_fuzzy_matching_never_guesses_destructive_commands() -> None:
+    assert Settings().fuzzy_intents is False
+    enable_fuzzy_matching()
+    try:
+        for command in ("clear tusks", "clear remindars", "delete histori", "delete tusk 2"):
+            assert parse_intent(command).intent_type == IntentType.UNKNOWN
+            assert rank_intents(command) == []
+        assert parse_intent("clear tasks").intent_type == IntentType.CLEAR_TASKS
+    finally:
+        disable_fuzzy_matching()
+
+
+def test_rank_intents_lists_runner_up_with_evidence() -> None:
+    ranked = rank_intents("remind me to call mom")
+    assert ranked[0].intent == parse_intent("remind me to call mom")
+    assert [(c.intent.intent_type, c.evidence, c.matched) for c in ranked] == [
+        (IntentType.ADD_REMINDER, "keyword", "remind me to"),
+        (IntentType.CALL_CONTACT, "keyword", "call"),
+    ]
+    assert ranked[0].confidence > ranked[1].confidence
+    assert rank_intents("show tasks")[0].evidence == "exact"
+    assert rank_intents("open youtube")[0].evidence == "regex"
+    assert rank_intents("remind me to call mom", k=1) == ranked[:1]
+    assert rank_intents("sing me a song") == []
+
+
+def test_rank_intents_reports_fuzzy_matches() -> None:
+    enable_fuzzy_matching()
+    try:
+        (candidate,) = rank_intents("shoe tasks")
+        assert (candidate.intent.intent_type, candidate.evidence, candidate.matched) == (
+            IntentType.LIST_TASKS,
+            "fuzzy",
+            "show tasks",
+        )
+    finally:
+        disable_fuzzy_matching()
+
+
+def test_rank_stops_at_the_same_fuzzy_attempt_as_dispatch() -> None:
+    rules = CompiledRules(INTENT_RULES)
+    corrections = [(1, "shoe", "shoe zzz"), (1, "show", "show zzz"), (1, "qqq", "qqq zzz"), (2, "show tasks", "show tasks")]
+    index = SimpleNamespace(corrections=lambda text: corrections)
+    assert rules.fuzzy_dispatch("shoe tsks", index) is None
+    assert rules.rank("shoe tsks", index) == []
+    assert len(corrections) > FUZZY_ATTEMPTS
+    (candidate,) = rules.rank("shoe tsks", index, attempts=len(corrections))
+    assert candidate.intent == rules.fuzzy_dispatch("shoe tsks", index, attempts=len(corrections))
+
+
+def test_redo_intent() -> None:
+    intent = parse_intent("redo")
+    assert intent.intent_type == IntentType.REDO
+
+
+def test_search_history_intent() -> None:
+    intent = parse_intent("search history for dentist")
+    assert intent.intent_type == IntentType.SEARCH_HISTORY
+    assert intent.payload == "dentist"
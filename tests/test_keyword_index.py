@@ -0,0 +1,21 @@
+from voice_assistant.keyword_index import KeywordIndex
+
+
+def test_iter_matches_reports_overlapping_hits() -> None:
+    index = KeywordIndex(("he", "she", "his", "hers"))
+    assert sorted(index.iter_matches("ushers")) == [(1, "she"), (2, "he"), (2, "hers")]
+
+
+def test_first_positions_keeps_earliest_occurrence() -> None:
+    index = KeywordIndex(("undo", "undo last", "do "))
+    hits = index.first_positions("undo last undo")
+    assert hits == {"undo": 0, "undo last": 0, "do ": 2}
+    assert index.first_positions("nothing here") == {}
+
+
+def test_first_positions_matches_substring_search() -> None:
+    words = ("call ", "call", "remind me to ", "to do ", "todo ", "time", "day")
+    index = KeywordIndex(words)
+    text = "please remind me to call mom today to do laundry"
+    hits = index.first_positions(text)
+    assert hits == {word: text.index(word) for word in words if word in text}
@@ -0,0 +1,25 @@
+import pytest
+
+from voice_assistant.intents import DEFAULT_LOCALES, IntentType, active_locales, configure_locales, parse_intent
+from voice_assistant.language_packs import load_language_pack, parse_locales
+
+
+def test_only_configured_locales_are_applied() -> None:
+    try:
+        assert configure_locales("es, xx") == ("es",)
+        assert active_locales() == ("es",)
+        assert parse_intent("tareas").intent_type == IntentType.LIST_TASKS
+        assert parse_intent("kholo github").intent_type == IntentType.UNKNOWN
+        assert parse_intent("gud mrng").intent_type == IntentType.GREETING
+    finally:
+        configure_locales(DEFAULT_LOCALES)
+    assert parse_intent("kholo github").payload == "github"
+
+
+def test_language_pack_loading() -> None:
+    pack = load_language_pack("hi")
+    assert pack.code == "hi"
+    assert pack.phrase_map["shukriya"] == "thanks"
+    with pytest.raises(ValueError):
+        load_language_pack("fr")
+    assert parse_locales(" TE,hi,,te ") == ("te", "hi")
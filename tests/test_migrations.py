@@ -0,0 +1,79 @@
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+from voice_assistant.storage.migrations import MIGRATIONS, Migration, migrate, schema_version
+from voice_assistant.storage.sqlite_store import MigrationSources, SQLiteStore
+
+
+def _store(tmp_path: Path) -> SQLiteStore:
+    names = ("reminders", "tasks", "profile", "expenses", "habits", "contacts", "events")
+    files = {f"{name}_file": str(tmp_path / f"{name}.json") for name in names}
+    return SQLiteStore(str(tmp_path / "state.db"), MigrationSources(history_file=str(tmp_path / "history.jsonl"), **files))
+
+
+def _meta_db() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.commit()
+    return conn
+
+
+def test_new_store_is_at_latest_version(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    assert store.schema_version() == MIGRATIONS[-1].version
+    store.close()
+    assert _store(tmp_path).schema_version() == MIGRATIONS[-1].version
+
+
+def test_migrations_apply_in_order_once() -> None:
+    conn = _meta_db()
+    migrations = [
+        Migration(2, "add price", ("ALTER TABLE items ADD COLUMN price REAL",)),
+        Migration(1, "index names", ("CREATE INDEX idx_items_name ON items(name)",)),
+    ]
+    assert migrate(conn, migrations) == [1, 2]
+    assert schema_version(conn) == 2
+    assert migrate(conn, migrations) == []
+    with pytest.raises(ValueError):
+        migrate(conn, migrations + [Migration(2, "duplicate", ())])
+
+
+def test_failed_migration_rolls_back() -> None:
+    conn = _meta_db()
+    broken = [
+        Migration(1, "ok", ("CREATE INDEX idx_items_name ON items(name)",)),
+        Migration(2, "broken", ("ALTER TABLE items ADD COLUMN price REAL", "ALTER TABLE missing ADD COLUMN x")),
+    ]
+    with pytest.raises(sqlite3.OperationalError):
+        migrate(conn, broken)
+    assert schema_version(conn) == 1
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(items)")]
+    assert "price" not in columns
+
+
+def _plan(store: SQLiteStore, sql: str, params: tuple[object, ...] = ()) -> str:
+    with store._connect() as conn:
+        return " | ".join(str(row["detail"]) for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+
+def test_hot_queries_use_indexes(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    events_plan = _plan(store, "SELECT id, title, event_when, source FROM events ORDER BY event_when")
+    assert "idx_events_when" in events_plan and "TEMP B-TREE" not in events_plan
+    tasks_plan = _plan(store, "SELECT id, position, text, done FROM tasks ORDER BY position, id")
+    assert "idx_tasks_position" in tasks_plan and "TEMP B-TREE" not in tasks_plan
+    expenses_plan = _plan(
+        store,
+        "SELECT category, SUM(amount) FROM expenses WHERE date >= ? AND date < ? GROUP BY category",
+        ("2026-02-01", "2026-03-01"),
+    )
+    assert "idx_expenses_date_category" in expenses_plan
+    history_plan = _plan(
+        store,
+        "SELECT id, role, text, created_at FROM history WHERE id > ? AND role = ? ORDER BY id LIMIT ?",
+        (0, "user", 10),
+    )
+    assert "idx_history_role_id" in history_plan and "TEMP B-TREE" not in history_plan
@@ -0,0 +1,38 @@
+from voice_assistant.intents import _normalize_text, normalization_tables
+from voice_assistant.normalizer import TextNormalizer, normalize_reference
+
+
+def test_compiled_normalizer_matches_reference() -> None:
+    samples = [
+        "  Hola!  ",
+        "hola!",
+        "gud mrng bro",
+        "plz open github",
+        "nuvvu ela unnava",
+        "recuérdame beber agua",
+        "నాకు గుర్తు చేయి నీళ్లు తాగు",
+        "add task   finish (portfolio)",
+        "tareas",
+        "tareas ",
+        "whats up u",
+        "ty\tfor\nthe help?",
+        "dont wanna idk",
+    ]
+    tables = normalization_tables()
+    for sample in samples:
+        expected = normalize_reference(sample, *tables)
+        assert _normalize_text(sample) == expected
+
+
+def test_unsafe_phrase_table_falls_back_to_sequential() -> None:
+    phrase_map = {"b c": "x", "a b": "y"}
+    normalizer = TextNormalizer([], phrase_map, {})
+    assert normalizer.normalize("a b c") == normalize_reference("a b c", [], phrase_map, {})
+    assert normalizer.normalize("a b c") == "a x"
+
+
+def test_chained_regex_rewrites_match_reference() -> None:
+    rewrites = [(r"^foo\s+(.+)$", r"bar \1"), (r"^bar\s+(.+)$", r"baz \1"), (r"^baz\s+(.+)$", r"foo \1")]
+    normalizer = TextNormalizer(rewrites, {}, {})
+    for sample in ("foo x", "bar x", "baz x"):
+        assert normalizer.normalize(sample) == normalize_reference(sample, rewrites, {}, {})
@@ -0,0 +1,38 @@
+import json
+
+from voice_assistant.perf import StartupTracer, percentile, summarize
+
+
+def test_percentile_interpolates_between_ranks() -> None:
+    values = [4.0, 1.0, 3.0, 2.0, 5.0]
+    assert percentile(values, 0) == 1.0
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 100) == 5.0
+    assert percentile(values, 95) == 4.8
+    assert percentile([], 50) == 0.0
+
+
+def test_summarize_reports_count_and_tail() -> None:
+    summary = summarize(list(range(101)))
+    assert summary == {"count": 101.0, "p50": 50.0, "p95": 95.0, "p99": 99.0}
+
+
+def test_startup_tracer_records_nested_phases(tmp_path) -> None:
+    tracer = StartupTracer()
+    with tracer.phase("store"):
+        with tracer.phase("tasks"):
+            pass
+    with tracer.phase("memory"):
+        pass
+    assert [name for name, _ in tracer.phases] == ["store", "store/tasks", "memory"]
+    assert tracer.phases[0][1] >= tracer.phases[1][1]
+    text = tracer.format_report()
+    assert text.startswith("Startup: ") and "    tasks" in text
+
+    report_file = tmp_path / "trace.jsonl"
+    tracer.write_report(str(report_file))
+    tracer.write_report(str(report_file))
+    lines = [json.loads(line) for line in report_file.read_text(encoding="utf-8").splitlines()]
+    assert len(lines) == 2
+    assert lines[0]["phases"][1]["name"] == "store/tasks"
+    assert lines[0]["total_ms"] == lines[1]["total_ms"]
@@ -0,0 +1,41 @@
+from dataclasses import replace
+import json
+from pathlib import Path
+
+from voice_assistant.assistant import VoiceAssistant
+from voice_assistant.config import Settings
+from voice_assistant.replay import format_report, isolated_settings, read_utterances, replay
+
+
+def test_read_utterances_accepts_text_and_jsonl(tmp_path: Path) -> None:
+    text_file = tmp_path / "commands.txt"
+    text_file.write_text("show tasks\n\n# comment\nwhat time is it\n", encoding="utf-8")
+    assert list(read_utterances(str(text_file))) == ["show tasks", "what time is it"]
+
+    jsonl_file = tmp_path / "history.jsonl"
+    rows = [
+        {"role": "user", "text": "add task buy milk"},
+        {"role": "assistant", "text": "Task added: buy milk"},
+        {"command": "show tasks"},
+        "list reminders",
+    ]
+    jsonl_file.write_text("\n".join(json.dumps(row) for row in rows), encoding="utf-8")
+    assert list(read_utterances(str(jsonl_file))) == ["add task buy milk", "show tasks", "list reminders"]
+
+
+def test_replay_runs_commands_headless_and_reports_per_intent(tmp_path: Path) -> None:
+    settings = replace(isolated_settings(Settings(), str(tmp_path)), llm_enabled=False, use_sqlite_storage=True, write_behind=True)
+    assistant = VoiceAssistant(settings=settings, headless=True)
+    assert assistant.listener is None
+    try:
+        report = replay(assistant, ["add task write report", "show tasks", "add task call home", "exit", "show tasks"])
+    finally:
+        assistant.close()
+
+    assert report.commands == 4 and report.stopped_early
+    assert report.replies[1] == ("show tasks", ["Your tasks are: 1. write report (pending)"])
+    assert report.per_intent()["add_task"]["count"] == 2.0
+    assert "commands/s" in format_report(report)
+    assert assistant.store is not None
+    assert [task["text"] for task in assistant.store.load_tasks()] == ["write report", "call home"]
+    assert Path(settings.sqlite_db_file).parent == tmp_path
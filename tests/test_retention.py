@@ -0,0 +1,110 @@
+from dataclasses import replace
+from datetime import datetime
+import json
+from pathlib import Path
+import time
+
+from voice_assistant.assistant import VoiceAssistant
+from voice_assistant.config import Settings
+from voice_assistant.replay import isolated_settings
+from voice_assistant.storage.retention import (
+    RetentionPolicy,
+    RetentionRunner,
+    archive_history_batch,
+    compact_history_file,
+    search_archive,
+    write_archive,
+)
+from voice_assistant.storage.sqlite_store import MigrationSources, SQLiteStore
+
+
+def _store(tmp_path: Path) -> SQLiteStore:
+    names = ("reminders", "tasks", "profile", "expenses", "habits", "contacts", "events")
+    files = {f"{name}_file": str(tmp_path / f"{name}.json") for name in names}
+    return SQLiteStore(str(tmp_path / "state.db"), MigrationSources(history_file=str(tmp_path / "h.jsonl"), **files))
+
+
+def _dated_history(store: SQLiteStore, dates: list[str]) -> None:
+    with store._connect() as conn:
+        conn.executemany(
+            "INSERT INTO history(role, text, created_at) VALUES(?, ?, ?)",
+            [("user", f"message {idx}", created_at) for idx, created_at in enumerate(dates)],
+        )
+
+
+def test_archive_is_partitioned_by_month_and_appendable(tmp_path: Path) -> None:
+    archive = str(tmp_path / "archive")
+    write_archive(archive, [{"id": 1, "role": "user", "text": "buy milk", "created_at": "2024-01-05T10:00:00"}])
+    write_archive(
+        archive,
+        [
+            {"id": 2, "role": "assistant", "text": "Milk noted", "created_at": "2024-01-06T10:00:00"},
+            {"id": 3, "role": "user", "text": "call dentist", "created_at": "2024-02-01T09:00:00"},
+        ],
+    )
+    assert sorted(path.name for path in Path(archive).iterdir()) == ["history-2024-01.jsonl.gz", "history-2024-02.jsonl.gz"]
+    assert [item["id"] for item in search_archive(archive, "MILK")] == [2, 1]
+    assert [item["id"] for item in search_archive(archive, "milk", role="user")] == [1]
+    assert search_archive(archive, "", start="2024-02") == search_archive(archive, "dentist")
+    write_archive(archive, [{"id": 3, "role": "user", "text": "call dentist", "created_at": "2024-02-01T09:00:00"}])
+    assert len(search_archive(archive, "dentist")) == 1
+
+
+def test_row_limit_is_applied_in_batches(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    for idx in range(10):
+        store.append_history("user", f"note {idx}")
+    archive = str(tmp_path / "archive")
+    policy = RetentionPolicy(max_age_days=0, max_rows=4, batch_size=4)
+    assert archive_history_batch(store, archive, policy) == 4
+    assert archive_history_batch(store, archive, policy) == 2
+    assert archive_history_batch(store, archive, policy) == 0
+    assert [entry["text"] for entry in store.history_entries(limit=10)] == [f"note {idx}" for idx in range(6, 10)]
+    assert len(search_archive(archive, "note")) == 6
+
+
+def test_age_limit_keeps_recent_rows(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    _dated_history(store, ["2020-01-01T08:00:00", "2020-06-01T08:00:00", "2026-02-01T08:00:00"])
+    archive = str(tmp_path / "archive")
+    policy = RetentionPolicy(max_age_days=365, max_rows=0)
+    assert archive_history_batch(store, archive, policy, now=datetime(2026, 3, 1)) == 2
+    assert [entry["text"] for entry in store.history_entries()] == ["message 2"]
+    assert [item["text"] for item in search_archive(archive, "message", end="2020-03")] == ["message 0"]
+
+
+def test_compact_history_file_keeps_the_newest_lines(tmp_path: Path) -> None:
+    history = tmp_path / "history.jsonl"
+    history.write_text("".join(json.dumps({"role": "user", "text": f"line {idx}"}) + "\n" for idx in range(5)), encoding="utf-8")
+    archive = str(tmp_path / "archive")
+    assert compact_history_file(str(history), archive, RetentionPolicy(max_age_days=0, max_rows=2)) == 3
+    assert [json.loads(line)["text"] for line in history.read_text(encoding="utf-8").splitlines()] == ["line 3", "line 4"]
+    assert [item["text"] for item in search_archive(archive, "line")] == ["line 2", "line 1", "line 0"]
+
+
+def test_runner_drains_then_waits(tmp_path: Path) -> None:
+    batches = [3, 2, 0]
+    runner = RetentionRunner(lambda: batches.pop(0) if batches else 0, interval=60, pause=0.0)
+    runner.start()
+    deadline = time.monotonic() + 2
+    while runner.moved < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    runner.close()
+    assert runner.moved == 5 and batches == []
+
+
+def test_assistant_searches_live_and_archived_history(tmp_path: Path) -> None:
+    settings = replace(isolated_settings(Settings(), str(tmp_path)), llm_enabled=False, use_sqlite_storage=True, write_behind=False)
+    assistant = VoiceAssistant(settings=settings, headless=True)
+    try:
+        assert assistant.retention is None
+        write_archive(
+            settings.history_archive_dir,
+            [{"id": 1, "role": "user", "text": "remind me about the dentist", "created_at": "2023-05-02T09:00:00"}],
+        )
+        assistant.store.append_history("user", "dentist moved to friday")
+        reply = assistant._search_history_text("dentist")
+        assert reply.startswith("History matches for dentist: user: dentist moved to friday")
+        assert "remind me about the dentist (2023-05-02)" in reply
+    finally:
+        assistant.close()
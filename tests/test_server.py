@@ -0,0 +1,109 @@
+from dataclasses import replace
+import json
+from pathlib import Path
+import threading
+from urllib import error, request
+
+import pytest
+
+from voice_assistant.config import Settings
+from voice_assistant.server import CommandServer, SessionPool
+
+
+def _pool(tmp_path: Path, **kwargs) -> SessionPool:
+    settings = replace(Settings(), llm_enabled=False, use_sqlite_storage=True)
+    return SessionPool(settings, str(tmp_path / "users"), **kwargs)
+
+
+def test_sessions_keep_user_data_isolated(tmp_path: Path) -> None:
+    pool = _pool(tmp_path)
+    try:
+        pool.handle("asha", "add task write report")
+        pool.handle("ravi", "add task buy milk")
+        assert pool.handle("asha", "show tasks").replies == ["Your tasks are: 1. write report (pending)"]
+        result = pool.handle("ravi", "show tasks")
+        assert result.intent == "list_tasks"
+        assert result.replies == ["Your tasks are: 1. buy milk (pending)"]
+    finally:
+        pool.close()
+    assert (tmp_path / "users" / "asha").is_dir() and (tmp_path / "users" / "ravi").is_dir()
+
+
+def test_sessions_do_not_share_google_tokens_or_startup_traces(tmp_path: Path) -> None:
+    pool = _pool(tmp_path)
+    try:
+        pool.handle("asha", "what time is it")
+        pool.handle("ravi", "what time is it")
+        asha = pool._sessions["asha"].assistant.settings
+        ravi = pool._sessions["ravi"].assistant.settings
+    finally:
+        pool.close()
+    assert asha.google_token_file != ravi.google_token_file
+    assert Path(asha.google_token_file).parent == tmp_path / "users" / "asha"
+    assert Path(ravi.startup_trace_file).parent == tmp_path / "users" / "ravi"
+    assert asha.google_credentials_file == Settings().google_credentials_file
+
+
+def test_least_recently_used_and_idle_sessions_are_evicted(tmp_path: Path) -> None:
+    now = [0.0]
+    pool = _pool(tmp_path, max_sessions=2, idle_seconds=60, clock=lambda: now[0])
+    try:
+        pool.handle("a", "add reminder to stretch")
+        pool.handle("b", "what time is it")
+        pool.handle("c", "what time is it")
+        assert pool.stats()["sessions"] == 2 and pool.stats()["evicted"] == 1
+
+        # The evicted user's state is reloaded from disk on the next request.
+        assert pool.handle("a", "list reminders").replies == ["Your reminders are: stretch"]
+        now[0] = 120.0
+        assert pool.evict_idle() == 2
+        assert len(pool) == 0
+    finally:
+        pool.close()
+
+
+def test_invalid_requests_are_rejected(tmp_path: Path) -> None:
+    pool = _pool(tmp_path)
+    with pytest.raises(ValueError):
+        pool.handle("../etc", "show tasks")
+    with pytest.raises(ValueError):
+        pool.handle("asha", "   ")
+
+
+def test_http_server_routes_commands_to_sessions(tmp_path: Path) -> None:
+    server = CommandServer(_pool(tmp_path), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        body = json.dumps({"user": "asha", "text": "Add task write report"}).encode("utf-8")
+        req = request.Request(f"{base}/command", data=body, headers={"Content-Type": "application/json"})
+        with request.urlopen(req, timeout=5) as response:
+            payload = json.loads(response.read())
+        assert payload["intent"] == "add_task"
+        assert payload["replies"] == ["Task added: write report"]
+        with request.urlopen(f"{base}/health", timeout=5) as response:
+            assert json.loads(response.read())["sessions"] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_http_server_reports_session_failures_as_500(tmp_path: Path) -> None:
+    server = CommandServer(_pool(tmp_path), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    # A file where the user's data directory should be makes opening the session fail.
+    (tmp_path / "users").mkdir()
+    (tmp_path / "users" / "asha").write_text("not a directory", encoding="utf-8")
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        body = json.dumps({"user": "asha", "text": "show tasks"}).encode("utf-8")
+        req = request.Request(f"{base}/command", data=body, headers={"Content-Type": "application/json"})
+        with pytest.raises(error.HTTPError) as failure:
+            request.urlopen(req, timeout=5)
+        assert failure.value.code == 500
+        assert json.loads(failure.value.read()) == {"error": "internal error"}
+    finally:
+        server.shutdown()
+        server.server_close()
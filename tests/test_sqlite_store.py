@@ -1,6 +1,13 @@
+import json
 from pathlib import Path
+import threading
+from types import SimpleNamespace
+
+import pytest
 
 from voice_assistant.storage.sqlite_store import MigrationSources, SQLiteStore
+from voice_assistant.storage.tracking import TrackedDict, TrackedList
+from voice_assistant.undo import UndoJournal, inserted, removed
 
 
 def _sources(tmp_path: Path) -> MigrationSources:
@@ -33,3 +40,153 @@ def test_sqlite_store_roundtrip(tmp_path: Path) -> None:
     assert store.load_expenses()[0]["category"] == "food"
     assert store.load_habits()["reading"] == 2
     assert "user: hello" in store.history_text()
+
+
+def test_iter_history_streams_in_batches(tmp_path: Path) -> None:
+    store = SQLiteStore(str(tmp_path / "state.db"), _sources(tmp_path))
+    for idx in range(5):
+        store.append_history("user", f"command {idx}")
+        store.append_history("assistant", f"reply {idx}")
+    texts = [row["text"] for row in store.iter_history(role="user", batch_size=2)]
+    assert texts == [f"command {idx}" for idx in range(5)]
+    assert len(list(store.iter_history(batch_size=3))) == 10
+
+
+def test_apply_changes_writes_only_deltas(tmp_path: Path) -> None:
+    store = SQLiteStore(str(tmp_path / "state.db"), _sources(tmp_path))
+    store.save_tasks([{"text": "a", "done": False}, {"text": "b", "done": False}])
+    tasks = TrackedList.from_rows(store.task_rows())
+
+    tasks.append({"text": "c", "done": False})
+    tasks[0]["done"] = True
+    del tasks[1]
+    store.apply_task_changes(tasks.drain_changes())
+    assert store.load_tasks() == [{"text": "a", "done": True}, {"text": "c", "done": False}]
+
+    # The inserted row got its id, so a later edit updates it in place.
+    tasks[1]["done"] = True
+    store.apply_task_changes(tasks.drain_changes())
+    assert [task_id for task_id, _, _ in store.task_rows()] == [handle.id for handle in tasks.handles()]
+    assert store.load_tasks()[1] == {"text": "c", "done": True}
+
+    contacts = TrackedDict(store.load_contacts())
+    contacts["amma"] = "+911234567890"
+    store.apply_contact_changes(contacts.drain_changes())
+    del contacts["amma"]
+    store.apply_contact_changes(contacts.drain_changes())
+    assert store.load_contacts() == {}
+
+
+def test_undo_journal_roundtrip(tmp_path: Path) -> None:
+    store = SQLiteStore(str(tmp_path / "state.db"), _sources(tmp_path))
+    assert store.load_undo_journal() == {"undo": [], "redo": []}
+    journal = {
+        "undo": [{"label": "task add", "deltas": [["tasks", "splice", 0, [], [{"text": "a", "done": False}]]]}],
+        "redo": [{"label": "name change", "deltas": [["profile", "put", "name", None, "Sam"]]}],
+    }
+    store.save_undo_journal(journal)
+    store.save_undo_journal(journal)
+    assert store.load_undo_journal() == journal
+
+
+def test_undo_journal_changes_are_written_incrementally(tmp_path: Path) -> None:
+    store = SQLiteStore(str(tmp_path / "state.db"), _sources(tmp_path))
+    state = SimpleNamespace(tasks=[{"text": f"t{idx}", "done": False} for idx in range(500)])
+    journal = UndoJournal(depth=2)
+
+    def step(action) -> dict[int, tuple[object, ...]]:
+        action()
+        changes = journal.drain_changes()
+        store.apply_undo_journal_changes(changes)
+        assert store.load_undo_journal() == journal.to_dict()
+        return changes
+
+    cleared = list(state.tasks)
+    state.tasks.clear()
+    step(lambda: journal.record("clear tasks", [removed("tasks", 0, cleared)]))
+    state.tasks.append({"text": "a", "done": False})
+    later = step(lambda: journal.record("add a", [inserted("tasks", 0, [state.tasks[0]])]))
+    # The big clear entry is not written again by later commands.
+    assert [change[0] for change in later.values()] == ["push"]
+    assert "t499" not in json.dumps(list(later.values()))
+
+    assert [change[0] for change in step(lambda: journal.undo(state)).values()] == ["move"]
+    step(lambda: journal.undo(state))
+    assert len(state.tasks) == 500
+    step(lambda: journal.redo(state))
+    state.tasks.append({"text": "b", "done": False})
+    step(lambda: journal.record("add b", [inserted("tasks", 1, [state.tasks[-1]])]))
+    state.tasks.append({"text": "c", "done": False})
+    step(lambda: journal.record("add c", [inserted("tasks", 2, [state.tasks[-1]])]))
+    assert [entry["label"] for entry in store.load_undo_journal()["undo"]] == ["add b", "add c"]
+    step(journal.clear)
+    assert store.load_undo_journal() == {"undo": [], "redo": []}
+
+
+def test_persistent_connections_are_per_thread_and_use_wal(tmp_path: Path) -> None:
+    store = SQLiteStore(str(tmp_path / "state.db"), _sources(tmp_path), synchronous="normal")
+    with store._connect() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    with store._connect() as again:
+        assert again is conn
+
+    other: list[object] = []
+
+    def worker() -> None:
+        store.append_history("user", "from a thread")
+        with store._connect() as thread_conn:
+            other.append(thread_conn)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+    assert store.history_entries() == [{"role": "user", "text": "from a thread"}]
+
+    store.close()
+    assert store._connections == {}
+    store.save_tasks([{"text": "after close", "done": False}])
+    assert store.load_tasks() == [{"text": "after close", "done": False}]
+    store.close()
+
+
+def test_connect_per_call_mode_keeps_no_connections(tmp_path: Path) -> None:
+    store = SQLiteStore(str(tmp_path / "state.db"), _sources(tmp_path), persistent_connections=False)
+    store.save_reminders(["water plants"])
+    assert store.load_reminders() == ["water plants"]
+    assert store._connections == {}
+    with pytest.raises(ValueError):
+        SQLiteStore(str(tmp_path / "other.db"), _sources(tmp_path), synchronous="sometimes")
+
+
+def test_row_level_crud_by_id(tmp_path: Path) -> None:
+    store = SQLiteStore(str(tmp_path / "state.db"), _sources(tmp_path))
+    first = store.insert_task({"text": "write report", "done": False})
+    second = store.insert_task({"text": "pay rent", "done": False})
+    assert store.task_rows() == [
+        (first, 1.0, {"text": "write report", "done": False}),
+        (second, 2.0, {"text": "pay rent", "done": False}),
+    ]
+
+    assert store.update_task(second, done=True)
+    assert store.task_at(2) == (second, {"text": "pay rent", "done": True})
+    assert store.task_at(3) is None and store.task_at(0) is None
+    assert store.delete_task(first)
+    assert not store.delete_task(first)
+    assert not store.update_task(first, text="gone")
+
+    ids = store.upsert_tasks([(second, {"text": "pay rent today", "done": True}), (None, {"text": "call bank"})])
+    assert ids[0] == second
+    assert store.load_tasks() == [{"text": "pay rent today", "done": True}, {"text": "call bank", "done": False}]
+
+    reminder = store.insert_reminder("water plants")
+    assert store.reminder_at(1) == (reminder, "water plants")
+    assert store.update_reminder(reminder, "water the plants")
+    assert store.load_reminders() == ["water the plants"]
+    assert store.delete_reminder(reminder)
+    assert store.load_reminders() == []
+
+    event = store.insert_event({"title": "standup", "when": "2026-03-01 09:00"})
+    assert store.load_events() == [{"title": "standup", "when": "2026-03-01 09:00", "source": "manual"}]
+    assert store.delete_event(event)
@@ -0,0 +1,78 @@
+from copy import deepcopy
+import json
+
+from voice_assistant.storage.tracking import PendingChanges, TrackedDict, TrackedList
+
+
+def test_tracked_list_records_adds_edits_and_removals() -> None:
+    tasks = TrackedList.from_rows([(1, 1.0, {"text": "a", "done": False}), (2, 2.0, {"text": "b", "done": False})])
+    assert not tasks.has_changes()
+
+    tasks.append({"text": "c", "done": False})
+    tasks[0]["done"] = True
+    removed = tasks.pop(1)
+    removed["done"] = True
+
+    changes = tasks.drain_changes()
+    by_id = {handle.id: value for handle, value in changes.items()}
+    assert by_id[1] == {"text": "a", "done": True}
+    assert by_id[2] is None
+    assert by_id[None] == {"text": "c", "done": False}
+    assert tasks.drain_changes() == {}
+
+
+def test_slice_filter_only_records_dropped_rows() -> None:
+    events = TrackedList.from_rows([(idx, float(idx), {"title": f"e{idx}"}) for idx in range(1, 5)])
+    events[:] = [event for event in events if event["title"] != "e3"]
+    changes = events.drain_changes()
+    assert [(handle.id, value) for handle, value in changes.items()] == [(3, None)]
+    assert [event["title"] for event in events] == ["e1", "e2", "e4"]
+
+
+def test_positions_place_inserts_between_neighbours_and_renumber_on_sort() -> None:
+    tasks = TrackedList.from_rows([(1, 1.0, "a"), (2, 2.0, "c")])
+    tasks.insert(1, "b")
+    tasks.append("d")
+    positions = [handle.position for handle in tasks.handles()]
+    assert positions == sorted(positions) and positions[0] == 1.0 and positions[-1] == 3.0
+    assert 1.0 < positions[1] < 2.0
+    changes = tasks.drain_changes()
+    assert {handle.id for handle in changes} == {None}
+
+    tasks.sort(reverse=True)
+    assert [handle.position for handle in tasks.handles()] == [1.0, 2.0, 3.0, 4.0]
+    # "c" already sat at position 2, so only the rows that moved are rewritten.
+    assert sorted(tasks.drain_changes().values()) == ["a", "b", "d"]
+
+    tasks[1:3] = [tasks[2], tasks[1]]
+    positions = [handle.position for handle in tasks.handles()]
+    assert list(tasks) == ["d", "b", "c", "a"] and positions == sorted(positions)
+    tasks[1:3] = ["x", "y", "z"]
+    positions = [handle.position for handle in tasks.handles()]
+    assert list(tasks) == ["d", "x", "y", "z", "a"] and positions == sorted(positions)
+
+
+def test_tracked_collections_copy_and_serialize_as_plain_types() -> None:
+    tasks = TrackedList([{"text": "a", "done": False}])
+    copied = deepcopy(tasks)
+    assert type(copied) is list and type(copied[0]) is dict
+    assert json.loads(json.dumps(tasks)) == [{"text": "a", "done": False}]
+
+
+def test_tracked_dict_records_set_and_delete() -> None:
+    contacts = TrackedDict({"amma": "1", "anna": "2"})
+    contacts["ravi"] = "3"
+    contacts.pop("anna")
+    contacts.pop("missing", None)
+    assert contacts.drain_changes() == {"ravi": "3", "anna": None}
+
+
+def test_pending_changes_merge_and_restore() -> None:
+    pending = PendingChanges()
+    pending.add("contacts", {"a": "1", "b": "2"})
+    pending.add("contacts", {"a": None})
+    failed = pending.take("contacts")
+    assert failed == {"b": "2", "a": None}
+    pending.add("contacts", {"b": "3"})
+    pending.restore("contacts", failed)
+    assert pending.take("contacts") == {"a": None, "b": "3"}
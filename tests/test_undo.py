@@ -0,0 +1,154 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from voice_assistant.undo import (
+    JournalConflict,
+    UndoJournal,
+    inserted,
+    load_journal,
+    put,
+    removed,
+    save_journal,
+    updated,
+)
+
+
+def _state() -> SimpleNamespace:
+    return SimpleNamespace(tasks=[{"text": "a", "done": False}], profile={})
+
+
+def test_undo_and_redo_several_levels() -> None:
+    state = _state()
+    journal = UndoJournal()
+    state.tasks.append({"text": "b", "done": False})
+    journal.record("add b", [inserted("tasks", 1, [state.tasks[1]])])
+    state.tasks[0]["done"] = True
+    journal.record("done a", [updated("tasks", 0, {"done": False}, {"done": True})])
+    state.profile["name"] = "Sam"
+    journal.record("name", [put("profile", "name", None, "Sam")])
+
+    assert [journal.undo(state).label for _ in range(3)] == ["name", "done a", "add b"]
+    assert state.tasks == [{"text": "a", "done": False}] and state.profile == {}
+    assert journal.undo(state) is None
+
+    assert journal.redo(state).label == "add b"
+    assert journal.redo(state).label == "done a"
+    assert state.tasks == [{"text": "a", "done": True}, {"text": "b", "done": False}]
+
+    journal.record("remove a", [removed("tasks", 0, [state.tasks.pop(0)])])
+    assert not journal.can_redo()
+
+
+def test_depth_keeps_newest_entries() -> None:
+    state = SimpleNamespace(items=[])
+    journal = UndoJournal(depth=2)
+    for value in range(3):
+        state.items.append(value)
+        journal.record(f"add {value}", [inserted("items", value, [value])])
+    assert len(journal) == 2
+    journal.undo(state)
+    journal.undo(state)
+    assert journal.undo(state) is None
+    assert state.items == [0]
+
+
+def test_conflict_rolls_back_and_clears() -> None:
+    state = SimpleNamespace(items=[1, 2])
+    journal = UndoJournal()
+    journal.record("add both", [inserted("items", 0, [1]), inserted("items", 1, [2])])
+    state.items[0] = 9
+    with pytest.raises(JournalConflict):
+        journal.undo(state)
+    assert state.items == [9, 2]
+    assert len(journal) == 0 and not journal.can_redo()
+
+
+def test_journal_survives_json_roundtrip(tmp_path: Path) -> None:
+    state = _state()
+    journal = UndoJournal()
+    state.tasks.append({"text": "b", "done": False})
+    journal.record("add b", [inserted("tasks", 1, [state.tasks[1]])])
+    path = str(tmp_path / "undo.json")
+    save_journal(path, journal.to_dict())
+
+    restored = UndoJournal.from_dict(load_journal(path))
+    assert restored.undo(state).label == "add b"
+    assert state.tasks == [{"text": "a", "done": False}]
+    assert load_journal(str(tmp_path / "missing.json")) == {}
+
+
+@pytest.mark.parametrize("write_behind", [False, True])
+def test_undone_delete_keeps_its_place_across_restarts(tmp_path: Path, write_behind: bool) -> None:
+    from dataclasses import replace
+
+    from voice_assistant.assistant import VoiceAssistant
+    from voice_assistant.config import Settings
+    from voice_assistant.replay import isolated_settings, replay
+
+    settings = replace(
+        isolated_settings(Settings(), str(tmp_path)),
+        llm_enabled=False,
+        use_sqlite_storage=True,
+        write_behind=write_behind,
+    )
+
+    def session(commands: list[str]) -> tuple[list[str], list[str]]:
+        assistant = VoiceAssistant(settings=settings, headless=True)
+        try:
+            report = replay(assistant, commands)
+            tasks = [str(task["text"]) for task in assistant.tasks]
+        finally:
+            assistant.close()
+        return [line for _, lines in report.replies for line in lines], tasks
+
+    _, tasks = session(["add task alpha", "add task beta", "add task gamma", "delete task 2", "undo"])
+    assert tasks == ["alpha", "beta", "gamma"]
+
+    replies, tasks = session(["show tasks"])
+    assert tasks == ["alpha", "beta", "gamma"]
+    assert "2. beta" in replies[0]
+
+    replies, tasks = session(["redo"])
+    assert replies[0].startswith("Redid")
+    assert tasks == ["alpha", "gamma"]
+
+    replies, tasks = session(["undo"])
+    assert replies[0].startswith("Undid")
+    assert tasks == ["alpha", "beta", "gamma"]
+    _, tasks = session([])
+    assert tasks == ["alpha", "beta", "gamma"]
+
+
+def test_undo_walks_only_the_spliced_rows(monkeypatch) -> None:
+    from voice_assistant.storage.tracking import TrackedList
+
+    walked: list[int] = []
+    settle = TrackedList._settle_positions
+
+    def counting_settle(self, start=0, stop=None):
+        walked.append((len(self) if stop is None else stop) - start)
+        settle(self, start, stop)
+
+    monkeypatch.setattr(TrackedList, "_settle_positions", counting_settle)
+    monkeypatch.setattr(TrackedList, "_renumber", lambda self: pytest.fail("undo renumbered the list"))
+    for size in (10, 100_000):
+        state = SimpleNamespace(
+            tasks=TrackedList.from_rows((idx, float(idx), {"text": f"t{idx}", "done": False}) for idx in range(1, size + 1))
+        )
+        journal = UndoJournal()
+        middle = size // 2
+        gone = state.tasks.pop(middle)
+        journal.record("delete", [removed("tasks", middle, [gone])])
+        state.tasks.drain_changes()
+        walked.clear()
+
+        journal.undo(state)
+        assert walked == [1]
+        ((handle, value),) = state.tasks.drain_changes().items()
+        assert value == gone and state.tasks.handles()[middle - 1].position < handle.position
+        assert handle.position < state.tasks.handles()[middle + 1].position
+
+        journal.redo(state)
+        assert walked == [1, 0]
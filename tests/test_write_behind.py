@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+import threading
+
+from voice_assistant.storage.write_behind import WriteBehindQueue
+
+
+def test_bursts_are_coalesced_per_key() -> None:
+    queue = WriteBehindQueue(delay=0.2)
+    writes: list[tuple[str, int]] = []
+    try:
+        for value in range(5):
+            queue.submit("tasks", lambda value=value: writes.append(("tasks", value)))
+        queue.submit("habits", lambda: writes.append(("habits", 1)))
+        assert queue.flush(timeout=2)
+        assert writes == [("tasks", 4), ("habits", 1)]
+        assert (queue.submitted, queue.written) == (6, 2)
+    finally:
+        queue.close()
+
+
+def test_close_flushes_and_errors_are_reported() -> None:
+    errors: list[str] = []
+    done = threading.Event()
+    queue = WriteBehindQueue(delay=10, on_error=lambda key, exc: errors.append(f"{key}: {exc}"))
+
+    def fail() -> None:
+        raise ValueError("disk full")
+
+    queue.submit("profile", fail)
+    queue.submit("events", done.set)
+    queue.close()
+    assert done.is_set()
+    assert errors == ["profile: disk full"]
+    assert queue.pending() == 0
+
+
+def test_json_state_is_copied_on_the_writer_thread(tmp_path, monkeypatch) -> None:
+    from dataclasses import replace
+
+    import voice_assistant.assistant as assistant_module
+    from voice_assistant.config import Settings
+    from voice_assistant.replay import isolated_settings, replay
+
+    settings = replace(
+        isolated_settings(Settings(), str(tmp_path)),
+        llm_enabled=False,
+        use_sqlite_storage=False,
+        write_behind=True,
+        write_behind_delay_ms=200,
+    )
+    copies: list[str] = []
+    deepcopy = assistant_module.copy.deepcopy
+
+    def recording_deepcopy(state, *args):
+        if state is assistant.tasks:
+            copies.append(threading.current_thread().name)
+        return deepcopy(state, *args)
+
+    monkeypatch.setattr(assistant_module.copy, "deepcopy", recording_deepcopy)
+    assistant = assistant_module.VoiceAssistant(settings=settings, headless=True)
+    try:
+        replay(assistant, ["add task one", "add task two", "add task three"])
+    finally:
+        assistant.close()
+
+    assert copies == ["nova-write-behind"]
+    assert json.loads(Path(settings.tasks_file).read_text(encoding="utf-8"))[-1]["text"] == "three"
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import logging
+import queue
+import threading
+
 try:
     import speech_recognition as sr
 except ModuleNotFoundError:
@@ -22,22 +26,127 @@ except ModuleNotFoundError:
 
 
 class Speaker:
-    def __init__(self, rate: int = 180, enabled: bool = True) -> None:
+    """Text-to-speech output.
+
+    By default ``say`` blocks until the utterance has been read out. With
+    ``threaded=True`` a dedicated TTS thread creates and owns the engine and
+    reads utterances from a queue: ``say_async`` returns at once, ``wait``
+    blocks until the queue is empty and ``stop`` cuts off the current
+    utterance and drops the queued ones.
+    """
+
+    def __init__(self, rate: int = 180, enabled: bool = True, threaded: bool = False) -> None:
         self.engine = None
-        if enabled and pyttsx3 is not None:
+        self.threaded = threaded and enabled and pyttsx3 is not None
+        self.interruptions = 0
+        self._queue: queue.Queue[tuple[int, str] | None] = queue.Queue()
+        self._idle = threading.Condition()
+        self._pending = 0
+        # stop() bumps the generation; queued or playing utterances from an
+        # older generation are skipped or cut off by the TTS thread.
+        self._generation = 0
+        self._current: int | None = None
+        self._thread: threading.Thread | None = None
+        if self.threaded:
+            ready = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(rate, ready), name="nova-tts", daemon=True)
+            self._thread.start()
+            ready.wait()
+        elif enabled and pyttsx3 is not None:
             self.engine = pyttsx3.init()
             self.engine.setProperty("rate", rate)
 
-    def say(self, text: str) -> None:
+    @staticmethod
+    def _print(text: str) -> None:
         try:
             print(f"Assistant: {text}")
         except UnicodeEncodeError:
             safe = text.encode("ascii", errors="replace").decode("ascii")
             print(f"Assistant: {safe}")
+
+    def say(self, text: str) -> None:
+        if self.threaded:
+            self.say_async(text)
+            self.wait()
+            return
+        self._print(text)
         if self.engine is not None:
             self.engine.say(text)
             self.engine.runAndWait()
 
+    def say_async(self, text: str) -> None:
+        """Queue ``text`` for the TTS thread; speaks inline when not threaded."""
+        if not self.threaded:
+            self.say(text)
+            return
+        self._print(text)
+        with self._idle:
+            self._pending += 1
+            generation = self._generation
+        self._queue.put((generation, text))
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until every queued utterance has finished. Returns False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def is_speaking(self) -> bool:
+        with self._idle:
+            return self._pending > 0
+
+    def stop(self) -> None:
+        """Cut off the utterance being spoken, if any, and drop the queued ones."""
+        if not self.threaded:
+            if self.engine is not None:
+                self.engine.stop()
+            return
+        with self._idle:
+            if self._pending:
+                self.interruptions += 1
+            self._generation += 1
+
+    interrupt = stop
+
+    def close(self) -> None:
+        """Stop the TTS thread after the queued utterances have been spoken."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self, rate: int, ready: threading.Event) -> None:
+        try:
+            self.engine = pyttsx3.init()
+            self.engine.setProperty("rate", rate)
+            self.engine.connect("started-word", self._on_word)
+        except Exception:
+            logging.getLogger("voice_assistant").exception("Failed to start text-to-speech engine")
+            self.engine = None
+        ready.set()
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            generation, text = item
+            try:
+                if self.engine is not None and generation == self._generation:
+                    self._current = generation
+                    self.engine.say(text)
+                    self.engine.runAndWait()
+            except Exception:
+                logging.getLogger("voice_assistant").exception("Failed to speak response")
+            finally:
+                self._current = None
+                with self._idle:
+                    self._pending -= 1
+                    self._idle.notify_all()
+
+    def _on_word(self, *_: object) -> None:
+        # Runs on the TTS thread inside runAndWait, where stopping the engine is safe.
+        if self._current is not None and self._current != self._generation and self.engine is not None:
+            self.engine.stop()
+
 
 class Listener:
     def __init__(self, ambient_duration: float = 0.15, use_vad: bool = True, wake_word: str | None = None) -> None:
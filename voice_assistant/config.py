@@ -25,6 +25,7 @@ class Settings:
     assistant_name: str = os.getenv("ASSISTANT_NAME", "Nova")
     voice_rate: int = int(os.getenv("VOICE_RATE", "180"))
     tts_enabled: bool = _to_bool(os.getenv("TTS_ENABLED", "true"))
+    threaded_tts: bool = _to_bool(os.getenv("THREADED_TTS", "false"))
     listen_timeout: float = float(os.getenv("LISTEN_TIMEOUT", "2.0"))
     phrase_time_limit: float = float(os.getenv("PHRASE_TIME_LIMIT", "5.0"))
     ambient_duration: float = float(os.getenv("AMBIENT_DURATION", "0.15"))
@@ -35,6 +36,10 @@ class Settings:
     expenses_file: str = os.getenv("EXPENSES_FILE", "expenses.json")
     habits_file: str = os.getenv("HABITS_FILE", "habits.json")
     history_file: str = os.getenv("HISTORY_FILE", "history.jsonl")
+    history_archive_dir: str = os.getenv("HISTORY_ARCHIVE_DIR", ".data/history_archive")
+    history_retention_days: int = int(os.getenv("HISTORY_RETENTION_DAYS", "365"))
+    history_max_rows: int = int(os.getenv("HISTORY_MAX_ROWS", "100000"))
+    history_retention_interval_seconds: float = float(os.getenv("HISTORY_RETENTION_INTERVAL_SECONDS", "3600"))
     llm_enabled: bool = _to_bool(os.getenv("LLM_ENABLED", "false"))
     llm_api_key: str = os.getenv("LLM_API_KEY", "")
     llm_model: str = os.getenv("LLM_MODEL", "gpt-4o-mini")
@@ -45,12 +50,19 @@ class Settings:
     translation_api_url: str = os.getenv("TRANSLATION_API_URL", "")
     use_sqlite_storage: bool = _to_bool(os.getenv("USE_SQLITE_STORAGE", "true"))
     sqlite_db_file: str = os.getenv("SQLITE_DB_FILE", ".data/assistant_state.db")
+    sqlite_persistent_connections: bool = _to_bool(os.getenv("SQLITE_PERSISTENT_CONNECTIONS", "true"))
+    sqlite_synchronous: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    sqlite_cache_kb: int = int(os.getenv("SQLITE_CACHE_KB", "8192"))
+    write_behind: bool = _to_bool(os.getenv("WRITE_BEHIND", "true"))
+    write_behind_delay_ms: int = int(os.getenv("WRITE_BEHIND_DELAY_MS", "50"))
     log_file: str = os.getenv("LOG_FILE", ".data/assistant.log")
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
     phone_adb_enabled: bool = _to_bool(os.getenv("PHONE_ADB_ENABLED", "false"))
     phone_adb_path: str = os.getenv("PHONE_ADB_PATH", "adb")
     contacts_file: str = os.getenv("CONTACTS_FILE", "contacts.json")
     events_file: str = os.getenv("EVENTS_FILE", "events.json")
+    undo_journal_file: str = os.getenv("UNDO_JOURNAL_FILE", "undo_journal.json")
+    undo_depth: int = int(os.getenv("UNDO_DEPTH", "20"))
     google_sync_enabled: bool = _to_bool(os.getenv("GOOGLE_SYNC_ENABLED", "false"))
     google_credentials_file: str = os.getenv("GOOGLE_CREDENTIALS_FILE", ".data/google_credentials.json")
     google_token_file: str = os.getenv("GOOGLE_TOKEN_FILE", ".data/google_token.json")
@@ -60,5 +72,19 @@ class Settings:
     wake_word: str = os.getenv("WAKE_WORD", "nova")
     porcupine_keyword_file: str = os.getenv("PORCUPINE_KEYWORD_FILE", "")
     porcupine_access_key: str = os.getenv("PORCUPINE_ACCESS_KEY", "")
+    # Implies threaded_tts: the speech engine then lives on its own thread.
+    async_conversation: bool = _to_bool(os.getenv("ASYNC_CONVERSATION", "false"))
+    barge_in: bool = _to_bool(os.getenv("BARGE_IN", "true"))
     memory_message_limit: int = int(os.getenv("MEMORY_MESSAGE_LIMIT", "12"))
     ai_log_file: str = os.getenv("AI_LOG_FILE", ".data/ai_responses.log")
+    intent_cache_size: int = int(os.getenv("INTENT_CACHE_SIZE", "0"))
+    locales: str = os.getenv("LOCALES", "te,hi,es")
+    fuzzy_intents: bool = _to_bool(os.getenv("FUZZY_INTENTS", "false"))
+    intent_profiling: bool = _to_bool(os.getenv("INTENT_PROFILING", "false"))
+    startup_trace: bool = _to_bool(os.getenv("STARTUP_TRACE", "false"))
+    startup_trace_file: str = os.getenv("STARTUP_TRACE_FILE", ".data/startup_trace.jsonl")
+    server_host: str = os.getenv("SERVER_HOST", "127.0.0.1")
+    server_port: int = int(os.getenv("SERVER_PORT", "8765"))
+    server_data_dir: str = os.getenv("SERVER_DATA_DIR", ".data/users")
+    server_max_sessions: int = int(os.getenv("SERVER_MAX_SESSIONS", "256"))
+    server_idle_seconds: float = float(os.getenv("SERVER_IDLE_SECONDS", "600"))
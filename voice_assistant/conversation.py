@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import Callable
+
+
+class ConversationEngine:
+    """Overlapped listen / handle / speak loop.
+
+    Capture (listening plus recognition), command handling (intents, skills and
+    LLM calls) and speech each run as their own asyncio task, connected by
+    queues, so the microphone keeps listening while a reply is being computed
+    or spoken. Handling and speech run on dedicated single-thread executors,
+    which keeps the TTS engine on one thread. Each listen runs on a daemon
+    thread: a listen still blocked (for example in ``input()``) when the
+    session ends must not keep the process alive.
+
+    Capture stops after an utterance for which ``ends_session`` is true, so
+    no further listen (or typed-input prompt) is started after "exit".
+
+    With ``barge_in`` enabled, an utterance captured while a reply is playing
+    stops the speech and drops replies that have not started yet.
+    """
+
+    def __init__(
+        self,
+        listen: Callable[[], str | None],
+        handle: Callable[[str], bool],
+        speak: Callable[[str], None],
+        stop_speaking: Callable[[], None] | None = None,
+        barge_in: bool = True,
+        max_pending: int = 8,
+        ends_session: Callable[[str], bool] | None = None,
+    ) -> None:
+        self._listen = listen
+        self._ends_session = ends_session
+        self._handle = handle
+        self._speak = speak
+        self._stop_speaking = stop_speaking
+        self.barge_in = barge_in
+        self.max_pending = max(1, max_pending)
+        self.interruptions = 0
+        self.ended_by_eof = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._commands: asyncio.Queue[str | None] | None = None
+        self._replies: asyncio.Queue[str | None] | None = None
+        self._speaking: asyncio.Future[None] | None = None
+        self._stopping = False
+
+    def reply(self, text: str) -> None:
+        """Queue ``text`` to be spoken. Safe to call from any thread."""
+        loop, replies = self._loop, self._replies
+        if loop is None or replies is None:
+            self._speak(text)
+            return
+        loop.call_soon_threadsafe(replies.put_nowait, text)
+
+    def interrupt(self) -> None:
+        """Stop the reply being spoken and discard the ones still queued."""
+        if self._replies is not None:
+            while not self._replies.empty():
+                self._replies.get_nowait()
+        if self._speaking is not None and not self._speaking.done():
+            self.interruptions += 1
+            if self._stop_speaking is not None:
+                self._stop_speaking()
+
+    async def run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._commands = asyncio.Queue(self.max_pending)
+        self._replies = asyncio.Queue()
+        self._stopping = False
+        handle_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nova-handle")
+        speech_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nova-speech")
+        capture = asyncio.create_task(self._capture_loop())
+        speaker = asyncio.create_task(self._speak_loop(speech_pool))
+        try:
+            await self._handle_loop(handle_pool)
+        finally:
+            self._stopping = True
+            capture.cancel()
+            self._replies.put_nowait(None)
+            await asyncio.gather(capture, speaker, return_exceptions=True)
+            handle_pool.shutdown(wait=True)
+            speech_pool.shutdown(wait=True)
+            self._loop = None
+            self._replies = None
+            self._commands = None
+
+    def _listen_in_thread(self) -> asyncio.Future[str | None]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str | None] = loop.create_future()
+
+        def deliver(text: str | None, error: BaseException | None) -> None:
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(text)
+
+        def run() -> None:
+            text, error = None, None
+            try:
+                text = self._listen()
+            except BaseException as exc:
+                error = exc
+            try:
+                loop.call_soon_threadsafe(deliver, text, error)
+            except RuntimeError:
+                pass  # The session is over and its loop closed; drop the result.
+
+        threading.Thread(target=run, name="nova-listen", daemon=True).start()
+        return future
+
+    async def _capture_loop(self) -> None:
+        assert self._commands is not None
+        while not self._stopping:
+            try:
+                text = await self._listen_in_thread()
+            except (EOFError, KeyboardInterrupt):
+                self.ended_by_eof = True
+                await self._commands.put(None)
+                return
+            if not text:
+                continue
+            if self.barge_in:
+                self.interrupt()
+            await self._commands.put(text)
+            if self._ends_session is not None and self._ends_session(text):
+                return
+
+    async def _handle_loop(self, pool: ThreadPoolExecutor) -> None:
+        loop = asyncio.get_running_loop()
+        assert self._commands is not None
+        while True:
+            command = await self._commands.get()
+            if command is None:
+                return
+            if not await loop.run_in_executor(pool, self._handle, command):
+                return
+
+    async def _speak_loop(self, pool: ThreadPoolExecutor) -> None:
+        loop = asyncio.get_running_loop()
+        assert self._replies is not None
+        while True:
+            text = await self._replies.get()
+            if text is None:
+                return
+            self._speaking = loop.run_in_executor(pool, self._speak, text)
+            try:
+                await self._speaking
+            finally:
+                self._speaking = None
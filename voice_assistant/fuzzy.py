@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Iterable
+
+
+def bounded_levenshtein(left: str, right: str, limit: int) -> int:
+    """Edit distance between two strings, or ``limit + 1`` once it is known to exceed ``limit``.
+
+    Only the diagonal band of width ``2 * limit + 1`` is computed.
+    """
+    over = limit + 1
+    if abs(len(left) - len(right)) > limit:
+        return over
+    width = len(right)
+    previous = [col if col <= limit else over for col in range(width + 1)]
+    for row, left_ch in enumerate(left, start=1):
+        low = max(1, row - limit)
+        high = min(width, row + limit)
+        current = [over] * (width + 1)
+        current[0] = row if row <= limit else over
+        best = current[0]
+        for col in range(low, high + 1):
+            value = previous[col - 1] if left_ch == right[col - 1] else previous[col - 1] + 1
+            if previous[col] + 1 < value:
+                value = previous[col] + 1
+            if current[col - 1] + 1 < value:
+                value = current[col - 1] + 1
+            current[col] = value if value < over else over
+            if value < best:
+                best = value
+        if best > limit:
+            return over
+        previous = current
+    return previous[width]
+
+
+def _grams(text: str, size: int) -> set[str]:
+    padded = f" {text} "
+    return {padded[idx:idx + size] for idx in range(len(padded) - size + 1)}
+
+
+def _gap_grams(left: str, right: str, size: int) -> set[str]:
+    joined = f"{left[-(size - 1):]} {right[:size - 1]}"
+    return {joined[idx:idx + size] for idx in range(len(joined) - size + 1)}
+
+
+class FuzzyPhraseIndex:
+    """Character n-gram index for recovering misheard keyword phrases.
+
+    Each phrase may be matched by a run of the same number of words within a
+    small edit distance (none for phrases shorter than ``min_length``, one per
+    five characters otherwise, capped at ``max_distance``). A phrase within
+    ``k`` edits keeps all but ``size * k`` of its n-grams, so it is only indexed
+    under its ``size * k + 1`` rarest n-grams; candidates from that index are
+    checked by shared n-gram count before any distance is computed.
+    """
+
+    def __init__(
+        self,
+        phrases: Iterable[str],
+        size: int = 3,
+        max_distance: int = 2,
+        min_length: int = 5,
+    ) -> None:
+        self.size = size
+        self.max_distance = max_distance
+        self.phrases = tuple(
+            dict.fromkeys(phrase.strip() for phrase in phrases if len(phrase.strip()) >= min_length)
+        )
+        self._limits = [min(max_distance, len(phrase) // 5) for phrase in self.phrases]
+        self._grams = [_grams(phrase, size) for phrase in self.phrases]
+        frequency = Counter(gram for grams in self._grams for gram in grams)
+        # Postings are kept per word count, since a window only competes with
+        # phrases that have as many words as it does.
+        self._postings: dict[int, dict[str, list[int]]] = {}
+        self._lengths: dict[int, tuple[int, int]] = {}
+        for idx, phrase in enumerate(self.phrases):
+            if self._limits[idx] == 0:
+                continue
+            count = len(phrase.split())
+            postings = self._postings.setdefault(count, {})
+            low, high = self._lengths.get(count, (len(phrase), len(phrase)))
+            self._lengths[count] = (min(low, len(phrase)), max(high, len(phrase)))
+            rarest = sorted(self._grams[idx], key=lambda gram: (frequency[gram], gram))
+            for gram in rarest[: size * self._limits[idx] + 1]:
+                postings.setdefault(gram, []).append(idx)
+
+    def corrections(self, text: str) -> list[tuple[int, str, str]]:
+        """Return ``(distance, phrase, corrected_text)`` for near misses, closest first."""
+        words = text.split()
+        # A window's n-grams are its words' padded n-grams plus the ones that
+        # straddle each gap, so they are computed once per word and per gap.
+        word_grams = [_grams(word, self.size) for word in words]
+        gap_grams = [_gap_grams(left, right, self.size) for left, right in zip(words, words[1:])]
+        found: dict[str, tuple[int, str, str]] = {}
+        for count, postings in self._postings.items():
+            low, high = self._lengths[count]
+            for start in range(len(words) - count + 1):
+                window = " ".join(words[start:start + count])
+                if not low - self.max_distance <= len(window) <= high + self.max_distance:
+                    continue
+                grams = set().union(*word_grams[start:start + count], *gap_grams[start:start + count - 1])
+                candidates = {idx for gram in grams for idx in postings.get(gram, ())}
+                for idx in candidates:
+                    limit = self._limits[idx]
+                    phrase = self.phrases[idx]
+                    if window == phrase or abs(len(window) - len(phrase)) > limit:
+                        continue
+                    if len(grams & self._grams[idx]) < len(self._grams[idx]) - self.size * limit:
+                        continue
+                    distance = bounded_levenshtein(window, phrase, limit)
+                    if distance > limit:
+                        continue
+                    corrected = " ".join(words[:start] + [phrase] + words[start + count:])
+                    if corrected not in found or distance < found[corrected][0]:
+                        found[corrected] = (distance, phrase, corrected)
+        return sorted(found.values(), key=lambda item: (item[0], -len(item[1])))
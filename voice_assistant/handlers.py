@@ -0,0 +1,639 @@
+from __future__ import annotations
+
+from functools import lru_cache
+import importlib
+from types import ModuleType
+from typing import Any, Callable, Protocol
+
+from voice_assistant.config import Settings
+from voice_assistant.intents import Intent, IntentType
+from voice_assistant.skills.calendar_tools import add_event, show_schedule_text, sync_tasks_to_calendar
+from voice_assistant.skills.contacts import add_contact, list_contacts_text, resolve_contact_number
+from voice_assistant.skills.expenses import add_expense, show_expenses_text
+from voice_assistant.skills.habits import add_habit, done_habit, show_habits_text
+from voice_assistant.skills.math_tools import calculate_expression
+from voice_assistant.skills.notes import save_note
+from voice_assistant.skills.reminders import clear_reminders, delete_reminder
+from voice_assistant.skills.study import build_study_plan, explain_topic, quiz_topic
+from voice_assistant.skills.system import (
+    get_affirmation_text,
+    get_breathing_text,
+    get_check_in_text,
+    get_daily_chores_text,
+    get_date_text,
+    get_fitness_tip_text,
+    get_greeting_text,
+    get_help_text,
+    get_how_are_you_text,
+    get_joke_text,
+    get_money_tip_text,
+    get_motivation_text,
+    get_sleep_tip_text,
+    get_study_tip_text,
+    get_thanks_reply_text,
+    get_time_text,
+)
+from voice_assistant.skills.tasks import add_task, clear_tasks, complete_task, delete_task, list_tasks_text
+from voice_assistant.undo import Delta, JournalConflict, UndoJournal, inserted, put, removed, updated
+
+
+def lazy_skill(module: str, name: str) -> Callable[..., Any]:
+    """Stand-in for ``voice_assistant.skills.<module>.<name>`` that imports the module on first call.
+
+    Used for skills whose imports (``urllib.request``, ``subprocess``,
+    ``webbrowser``) would otherwise be paid at startup.
+    """
+
+    def call(*args: Any, **kwargs: Any) -> Any:
+        return getattr(importlib.import_module(f"voice_assistant.skills.{module}"), name)(*args, **kwargs)
+
+    call.__name__ = name
+    return call
+
+
+@lru_cache(maxsize=1)
+def load_google_sync() -> ModuleType | None:
+    """Import the Google sync skill on first use; None when the client libraries are missing."""
+    try:
+        return importlib.import_module("voice_assistant.skills.google_sync")
+    except ModuleNotFoundError:
+        return None
+
+
+make_call = lazy_skill("phone", "make_call")
+open_phone_app = lazy_skill("phone", "open_phone_app")
+send_sms = lazy_skill("phone", "send_sms")
+send_whatsapp_message = lazy_skill("phone", "send_whatsapp_message")
+supported_languages_text = lazy_skill("translate", "supported_languages_text")
+translate_text = lazy_skill("translate", "translate_text")
+open_site = lazy_skill("web", "open_site")
+search_web = lazy_skill("web", "search_web")
+
+
+class HandlerContext(Protocol):
+    """The assistant state a handler may read or change.
+
+    ``VoiceAssistant`` satisfies it; tests can pass any object with these
+    attributes.
+    """
+
+    settings: Settings
+    profile: dict[str, str]
+    reminders: list[str]
+    tasks: list[dict[str, Any]]
+    expenses: list[dict[str, Any]]
+    habits: dict[str, int]
+    contacts: dict[str, str]
+    events: list[dict[str, str]]
+    google_enabled: bool
+    journal: UndoJournal
+
+    def _persist_profile(self) -> None: ...
+    def _persist_reminders(self) -> None: ...
+    def _persist_tasks(self) -> None: ...
+    def _persist_expenses(self) -> None: ...
+    def _persist_habits(self) -> None: ...
+    def _persist_contacts(self) -> None: ...
+    def _persist_events(self) -> None: ...
+    def _persist_journal(self) -> None: ...
+    def _history_text(self) -> str: ...
+    def _clear_history(self) -> str: ...
+    def _search_history_text(self, query: str) -> str: ...
+    def _expense_report_text(self) -> str: ...
+
+
+Handler = Callable[[HandlerContext, Intent], "str | None"]
+
+HANDLERS: dict[IntentType, Handler] = {}
+_PAYLOAD_REQUIRED: set[IntentType] = set()
+
+
+def handles(*intent_types: IntentType, payload: bool = False) -> Callable[[Handler], Handler]:
+    """Register a handler for ``intent_types``.
+
+    With ``payload=True`` the handler is skipped for intents without a payload,
+    so the command falls through to the conversational reply.
+    """
+
+    def register(handler: Handler) -> Handler:
+        for intent_type in intent_types:
+            HANDLERS[intent_type] = handler
+            if payload:
+                _PAYLOAD_REQUIRED.add(intent_type)
+        return handler
+
+    return register
+
+
+def dispatch(ctx: HandlerContext, intent: Intent) -> str | None:
+    """Run the handler registered for ``intent`` and return its reply.
+
+    ``None`` means no handler applies and the caller should fall back.
+    """
+    handler = HANDLERS.get(intent.intent_type)
+    if handler is None or (not intent.payload and intent.intent_type in _PAYLOAD_REQUIRED):
+        return None
+    return handler(ctx, intent)
+
+
+def _record(ctx: HandlerContext, label: str, *deltas: Delta) -> None:
+    """Journal the changes a handler made so they can be undone."""
+    if deltas:
+        ctx.journal.record(label, deltas)
+        ctx._persist_journal()
+
+
+def _appended(ctx: HandlerContext, collection: str, before: int) -> tuple[Delta, ...]:
+    items = getattr(ctx, collection)
+    return (inserted(collection, before, items[before:]),) if len(items) > before else ()
+
+
+def _removed_at(ctx: HandlerContext, collection: str, index: int) -> Callable[[], tuple[Delta, ...]]:
+    """Capture item ``index`` (1-based) now; the returned check reports its removal."""
+    items = getattr(ctx, collection)
+    size = len(items)
+    item = items[index - 1] if 1 <= index <= size else None
+    snapshot = dict(item) if isinstance(item, dict) else item
+
+    def check() -> tuple[Delta, ...]:
+        if item is None or len(getattr(ctx, collection)) == size:
+            return ()
+        return (removed(collection, index - 1, [snapshot]),)
+
+    return check
+
+
+_STATIC_REPLIES: dict[IntentType, Callable[[], str]] = {
+    IntentType.GET_TIME: get_time_text,
+    IntentType.GET_DATE: get_date_text,
+    IntentType.HOW_ARE_YOU: get_how_are_you_text,
+    IntentType.DAILY_CHORES: get_daily_chores_text,
+    IntentType.MOTIVATION: get_motivation_text,
+    IntentType.THANKS: get_thanks_reply_text,
+    IntentType.BREATHING: get_breathing_text,
+    IntentType.AFFIRMATION: get_affirmation_text,
+    IntentType.STUDY_TIP: get_study_tip_text,
+    IntentType.FITNESS_TIP: get_fitness_tip_text,
+    IntentType.MONEY_TIP: get_money_tip_text,
+    IntentType.SLEEP_TIP: get_sleep_tip_text,
+    IntentType.HELP: get_help_text,
+    IntentType.JOKE: get_joke_text,
+    IntentType.SHOW_TRANSLATE_LANGS: supported_languages_text,
+}
+
+
+@handles(*_STATIC_REPLIES)
+def _static_reply(ctx: HandlerContext, intent: Intent) -> str:
+    return _STATIC_REPLIES[intent.intent_type]()
+
+
+# Profile and small talk
+
+
+@handles(IntentType.GREETING)
+def _greeting(ctx: HandlerContext, intent: Intent) -> str:
+    name = ctx.profile.get("name")
+    return f"Hi {name}. Nice to hear from you." if name else get_greeting_text()
+
+
+@handles(IntentType.SET_NAME, payload=True)
+def _set_name(ctx: HandlerContext, intent: Intent) -> str:
+    formatted = str(intent.payload).strip().split()[0].capitalize()
+    previous = ctx.profile.get("name")
+    ctx.profile["name"] = formatted
+    ctx._persist_profile()
+    if previous != formatted:
+        _record(ctx, "name change", put("profile", "name", previous, formatted))
+    return f"Nice to meet you, {formatted}. I will remember your name."
+
+
+@handles(IntentType.GET_NAME)
+def _get_name(ctx: HandlerContext, intent: Intent) -> str:
+    name = ctx.profile.get("name")
+    return f"Your name is {name}." if name else "I do not know your name yet. You can say: my name is Sunil."
+
+
+@handles(IntentType.CHECK_IN)
+def _check_in(ctx: HandlerContext, intent: Intent) -> str:
+    return get_check_in_text(ctx.profile.get("name"))
+
+
+# Expenses, habits and summaries
+
+
+@handles(IntentType.ADD_EXPENSE, payload=True)
+def _add_expense(ctx: HandlerContext, intent: Intent) -> str:
+    amount_str, category = str(intent.payload).split("|", 1)
+    before = len(ctx.expenses)
+    reply = add_expense(ctx.expenses, float(amount_str), category)
+    ctx._persist_expenses()
+    _record(ctx, "expense add", *_appended(ctx, "expenses", before))
+    return reply
+
+
+@handles(IntentType.SHOW_EXPENSES)
+def _show_expenses(ctx: HandlerContext, intent: Intent) -> str:
+    return show_expenses_text(ctx.expenses)
+
+
+@handles(IntentType.EXPENSE_REPORT)
+def _expense_report(ctx: HandlerContext, intent: Intent) -> str:
+    return ctx._expense_report_text()
+
+
+@handles(IntentType.ADD_HABIT, payload=True)
+def _add_habit(ctx: HandlerContext, intent: Intent) -> str:
+    key = str(intent.payload).strip().lower()
+    previous = ctx.habits.get(key)
+    reply = add_habit(ctx.habits, str(intent.payload))
+    ctx._persist_habits()
+    if ctx.habits.get(key) != previous:
+        _record(ctx, "habit add", put("habits", key, previous, ctx.habits.get(key)))
+    return reply
+
+
+@handles(IntentType.DONE_HABIT, payload=True)
+def _done_habit(ctx: HandlerContext, intent: Intent) -> str:
+    key = str(intent.payload).strip().lower()
+    previous = ctx.habits.get(key)
+    reply = done_habit(ctx.habits, str(intent.payload))
+    ctx._persist_habits()
+    if ctx.habits.get(key) != previous:
+        _record(ctx, "habit progress", put("habits", key, previous, ctx.habits.get(key)))
+    return reply
+
+
+@handles(IntentType.SHOW_HABITS)
+def _show_habits(ctx: HandlerContext, intent: Intent) -> str:
+    return show_habits_text(ctx.habits)
+
+
+@handles(IntentType.DAY_SUMMARY)
+def _day_summary(ctx: HandlerContext, intent: Intent) -> str:
+    pending = sum(1 for task in ctx.tasks if not bool(task.get("done")))
+    done = sum(1 for task in ctx.tasks if bool(task.get("done")))
+    reminders = len(ctx.reminders)
+    expense_reply = ctx._expense_report_text()
+    return (
+        f"Day summary. Tasks pending: {pending}. Tasks done: {done}. "
+        f"Active reminders: {reminders}. {expense_reply}"
+    )
+
+
+@handles(IntentType.SHOW_HISTORY)
+def _show_history(ctx: HandlerContext, intent: Intent) -> str:
+    return ctx._history_text()
+
+
+@handles(IntentType.SEARCH_HISTORY, payload=True)
+def _search_history(ctx: HandlerContext, intent: Intent) -> str:
+    return ctx._search_history_text(str(intent.payload))
+
+
+@handles(IntentType.CLEAR_HISTORY)
+def _clear_history(ctx: HandlerContext, intent: Intent) -> str:
+    return ctx._clear_history()
+
+
+@handles(IntentType.TRANSLATE, payload=True)
+def _translate(ctx: HandlerContext, intent: Intent) -> str:
+    return translate_text(str(intent.payload), api_url=ctx.settings.translation_api_url)
+
+
+# Reminders and tasks
+
+
+@handles(IntentType.ADD_REMINDER, payload=True)
+def _add_reminder(ctx: HandlerContext, intent: Intent) -> str:
+    ctx.reminders.append(str(intent.payload))
+    ctx._persist_reminders()
+    _record(ctx, "reminder add", inserted("reminders", len(ctx.reminders) - 1, [str(intent.payload)]))
+    return f"Reminder added: {intent.payload}"
+
+
+@handles(IntentType.LIST_REMINDERS)
+def _list_reminders(ctx: HandlerContext, intent: Intent) -> str:
+    return "Your reminders are: " + "; ".join(ctx.reminders) if ctx.reminders else "You do not have any reminders yet."
+
+
+@handles(IntentType.DELETE_REMINDER, payload=True)
+def _delete_reminder(ctx: HandlerContext, intent: Intent) -> str:
+    check = _removed_at(ctx, "reminders", int(str(intent.payload)))
+    reply = delete_reminder(ctx.reminders, int(str(intent.payload)))
+    ctx._persist_reminders()
+    _record(ctx, "reminder delete", *check())
+    return reply
+
+
+@handles(IntentType.CLEAR_REMINDERS)
+def _clear_reminders(ctx: HandlerContext, intent: Intent) -> str:
+    cleared = list(ctx.reminders)
+    reply = clear_reminders(ctx.reminders)
+    ctx._persist_reminders()
+    if cleared and not ctx.reminders:
+        _record(ctx, "reminder clear", removed("reminders", 0, cleared))
+    return reply
+
+
+@handles(IntentType.ADD_TASK, payload=True)
+def _add_task(ctx: HandlerContext, intent: Intent) -> str:
+    before = len(ctx.tasks)
+    reply = add_task(ctx.tasks, str(intent.payload))
+    ctx._persist_tasks()
+    _record(ctx, "task add", *_appended(ctx, "tasks", before))
+    return reply
+
+
+@handles(IntentType.LIST_TASKS)
+def _list_tasks(ctx: HandlerContext, intent: Intent) -> str:
+    return list_tasks_text(ctx.tasks)
+
+
+@handles(IntentType.COMPLETE_TASK, payload=True)
+def _complete_task(ctx: HandlerContext, intent: Intent) -> str:
+    index = int(str(intent.payload))
+    previous = ctx.tasks[index - 1].get("done") if 1 <= index <= len(ctx.tasks) else None
+    reply = complete_task(ctx.tasks, index)
+    ctx._persist_tasks()
+    if 1 <= index <= len(ctx.tasks) and ctx.tasks[index - 1].get("done") != previous:
+        _record(ctx, "task complete", updated("tasks", index - 1, {"done": previous}, {"done": True}))
+    return reply
+
+
+@handles(IntentType.DELETE_TASK, payload=True)
+def _delete_task(ctx: HandlerContext, intent: Intent) -> str:
+    check = _removed_at(ctx, "tasks", int(str(intent.payload)))
+    reply = delete_task(ctx.tasks, int(str(intent.payload)))
+    ctx._persist_tasks()
+    _record(ctx, "task delete", *check())
+    return reply
+
+
+@handles(IntentType.CLEAR_TASKS)
+def _clear_tasks(ctx: HandlerContext, intent: Intent) -> str:
+    cleared = list(ctx.tasks)
+    reply = clear_tasks(ctx.tasks)
+    ctx._persist_tasks()
+    if cleared and not ctx.tasks:
+        _record(ctx, "task clear", removed("tasks", 0, cleared))
+    return reply
+
+
+# Contacts, phone and calendar
+
+
+@handles(IntentType.ADD_CONTACT, payload=True)
+def _add_contact(ctx: HandlerContext, intent: Intent) -> str:
+    name, number = str(intent.payload).split("|", 1)
+    key = name.strip().lower()
+    previous = ctx.contacts.get(key)
+    reply = add_contact(ctx.contacts, name, number)
+    ctx._persist_contacts()
+    if ctx.contacts.get(key) != previous:
+        _record(ctx, f"contact add: {name.strip()}", put("contacts", key, previous, ctx.contacts.get(key)))
+    return reply
+
+
+@handles(IntentType.LIST_CONTACTS)
+def _list_contacts(ctx: HandlerContext, intent: Intent) -> str:
+    return list_contacts_text(ctx.contacts)
+
+
+@handles(IntentType.CALL_CONTACT, payload=True)
+def _call_contact(ctx: HandlerContext, intent: Intent) -> str:
+    number = resolve_contact_number(ctx.contacts, str(intent.payload))
+    if not number:
+        return f"I do not have contact {intent.payload}. Add it first."
+    return make_call(number, adb_enabled=ctx.settings.phone_adb_enabled, adb_path=ctx.settings.phone_adb_path)
+
+
+@handles(IntentType.SMS_CONTACT, payload=True)
+def _sms_contact(ctx: HandlerContext, intent: Intent) -> str:
+    name, message = str(intent.payload).split("|", 1)
+    number = resolve_contact_number(ctx.contacts, name)
+    if not number:
+        return f"I do not have contact {name}. Add it first."
+    return send_sms(
+        number,
+        message,
+        adb_enabled=ctx.settings.phone_adb_enabled,
+        adb_path=ctx.settings.phone_adb_path,
+    )
+
+
+@handles(IntentType.WHATSAPP_MESSAGE, payload=True)
+def _whatsapp_message(ctx: HandlerContext, intent: Intent) -> str:
+    target, message = str(intent.payload).split("|", 1)
+    number = resolve_contact_number(ctx.contacts, target) or target
+    return send_whatsapp_message(
+        number,
+        message,
+        adb_enabled=ctx.settings.phone_adb_enabled,
+        adb_path=ctx.settings.phone_adb_path,
+    )
+
+
+@handles(IntentType.PHONE_CALL, payload=True)
+def _phone_call(ctx: HandlerContext, intent: Intent) -> str:
+    return make_call(
+        str(intent.payload),
+        adb_enabled=ctx.settings.phone_adb_enabled,
+        adb_path=ctx.settings.phone_adb_path,
+    )
+
+
+@handles(IntentType.PHONE_SMS, payload=True)
+def _phone_sms(ctx: HandlerContext, intent: Intent) -> str:
+    number, message = str(intent.payload).split("|", 1)
+    return send_sms(
+        number,
+        message,
+        adb_enabled=ctx.settings.phone_adb_enabled,
+        adb_path=ctx.settings.phone_adb_path,
+    )
+
+
+@handles(IntentType.PHONE_OPEN_APP, payload=True)
+def _phone_open_app(ctx: HandlerContext, intent: Intent) -> str:
+    return open_phone_app(
+        str(intent.payload),
+        adb_enabled=ctx.settings.phone_adb_enabled,
+        adb_path=ctx.settings.phone_adb_path,
+    )
+
+
+@handles(IntentType.ADD_EVENT, payload=True)
+def _add_event(ctx: HandlerContext, intent: Intent) -> str:
+    title, when = str(intent.payload).split("|", 1)
+    before = len(ctx.events)
+    reply = add_event(ctx.events, title, when)
+    ctx._persist_events()
+    _record(ctx, "event add", *_appended(ctx, "events", before))
+    return reply
+
+
+@handles(IntentType.SHOW_SCHEDULE)
+def _show_schedule(ctx: HandlerContext, intent: Intent) -> str:
+    return show_schedule_text(ctx.events)
+
+
+@handles(IntentType.SYNC_TASKS_CALENDAR)
+def _sync_tasks_calendar(ctx: HandlerContext, intent: Intent) -> str:
+    before = len(ctx.events)
+    reply = sync_tasks_to_calendar(ctx.tasks, ctx.events)
+    ctx._persist_events()
+    _record(ctx, "calendar sync", *_appended(ctx, "events", before))
+    return reply
+
+
+# Google sync
+
+
+def _google_unavailable(ctx: HandlerContext) -> str | None:
+    if not ctx.google_enabled:
+        return "Google sync is disabled. Set GOOGLE_SYNC_ENABLED=true in .env and retry."
+    if load_google_sync() is None:
+        return "Google sync libraries are missing. Install google-auth, google-auth-oauthlib, google-api-python-client."
+    return None
+
+
+@handles(IntentType.GOOGLE_LOGIN)
+def _google_login(ctx: HandlerContext, intent: Intent) -> str:
+    unavailable = _google_unavailable(ctx)
+    if unavailable:
+        return unavailable
+    return load_google_sync().google_login(ctx.settings.google_credentials_file, ctx.settings.google_token_file)
+
+
+@handles(IntentType.GOOGLE_SYNC_CONTACTS)
+def _google_sync_contacts(ctx: HandlerContext, intent: Intent) -> str:
+    unavailable = _google_unavailable(ctx)
+    if unavailable:
+        return unavailable
+    try:
+        imported = load_google_sync().sync_google_contacts(ctx.settings.google_credentials_file, ctx.settings.google_token_file)
+        added = 0
+        deltas: list[Delta] = []
+        for name, number in imported:
+            key = name.strip().lower()
+            previous = ctx.contacts.get(key)
+            if add_contact(ctx.contacts, name, number).startswith("Saved"):
+                added += 1
+                if ctx.contacts.get(key) != previous:
+                    deltas.append(put("contacts", key, previous, ctx.contacts.get(key)))
+        if added:
+            ctx._persist_contacts()
+        _record(ctx, "Google contacts import", *deltas)
+        return f"Imported {added} Google contacts."
+    except Exception as exc:
+        return f"Google contacts sync failed: {exc}"
+
+
+@handles(IntentType.GOOGLE_SYNC_CALENDAR)
+def _google_sync_calendar(ctx: HandlerContext, intent: Intent) -> str:
+    unavailable = _google_unavailable(ctx)
+    if unavailable:
+        return unavailable
+    try:
+        events = load_google_sync().sync_google_calendar_pull(
+            ctx.settings.google_credentials_file,
+            ctx.settings.google_token_file,
+            ctx.settings.google_calendar_id,
+        )
+        before = len(ctx.events)
+        ctx.events.extend(events)
+        ctx._persist_events()
+        _record(ctx, "Google Calendar import", *_appended(ctx, "events", before))
+        return f"Imported {len(events)} events from Google Calendar."
+    except Exception as exc:
+        return f"Google Calendar sync failed: {exc}"
+
+
+@handles(IntentType.GOOGLE_PUSH_EVENTS)
+def _google_push_events(ctx: HandlerContext, intent: Intent) -> str:
+    unavailable = _google_unavailable(ctx)
+    if unavailable:
+        return unavailable
+    try:
+        reply = load_google_sync().sync_google_calendar_push(
+            ctx.settings.google_credentials_file,
+            ctx.settings.google_token_file,
+            ctx.settings.google_calendar_id,
+            ctx.events,
+        )
+        return reply
+    except Exception as exc:
+        return f"Google Calendar push failed: {exc}"
+
+
+# Study, web and tools
+
+
+@handles(IntentType.STUDY_PLAN, payload=True)
+def _study_plan(ctx: HandlerContext, intent: Intent) -> str:
+    return build_study_plan(str(intent.payload))
+
+
+@handles(IntentType.STUDY_EXPLAIN, payload=True)
+def _study_explain(ctx: HandlerContext, intent: Intent) -> str:
+    return explain_topic(str(intent.payload))
+
+
+@handles(IntentType.STUDY_QUIZ, payload=True)
+def _study_quiz(ctx: HandlerContext, intent: Intent) -> str:
+    return quiz_topic(str(intent.payload))
+
+
+@handles(IntentType.OPEN_SITE, payload=True)
+def _open_site(ctx: HandlerContext, intent: Intent) -> str:
+    return open_site(str(intent.payload))
+
+
+@handles(IntentType.SEARCH_WEB, payload=True)
+def _search_web(ctx: HandlerContext, intent: Intent) -> str:
+    return search_web(str(intent.payload))
+
+
+@handles(IntentType.SAVE_NOTE, payload=True)
+def _save_note(ctx: HandlerContext, intent: Intent) -> str:
+    return save_note(str(intent.payload), ctx.settings.notes_file)
+
+
+@handles(IntentType.CALCULATE, payload=True)
+def _calculate(ctx: HandlerContext, intent: Intent) -> str:
+    return calculate_expression(str(intent.payload))
+
+
+# Undo
+
+
+def _persist_collections(ctx: HandlerContext, collections: list[str]) -> None:
+    for collection in collections:
+        getattr(ctx, f"_persist_{collection}")()
+    ctx._persist_journal()
+
+
+@handles(IntentType.UNDO)
+def _undo(ctx: HandlerContext, intent: Intent) -> str:
+    try:
+        entry = ctx.journal.undo(ctx)
+    except JournalConflict:
+        ctx._persist_journal()
+        return "I cannot undo that because the data changed since. Undo history cleared."
+    if entry is None:
+        return "Nothing to undo."
+    _persist_collections(ctx, entry.collections)
+    return f"Undid {entry.label}."
+
+
+@handles(IntentType.REDO)
+def _redo(ctx: HandlerContext, intent: Intent) -> str:
+    try:
+        entry = ctx.journal.redo(ctx)
+    except JournalConflict:
+        ctx._persist_journal()
+        return "I cannot redo that because the data changed since. Undo history cleared."
+    if entry is None:
+        return "Nothing to redo."
+    _persist_collections(ctx, entry.collections)
+    return f"Redid {entry.label}."
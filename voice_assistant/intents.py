@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 import re
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+from voice_assistant.fuzzy import FuzzyPhraseIndex
+from voice_assistant.keyword_index import KeywordIndex
+from voice_assistant.language_packs import AVAILABLE_LOCALES, load_language_pack, parse_locales
+from voice_assistant.normalizer import TextNormalizer
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from multiprocessing.context import BaseContext
 
 
 class IntentType(str, Enum):
@@ -45,6 +59,7 @@ class IntentType(str, Enum):
     DAY_SUMMARY = "day_summary"
     SHOW_HISTORY = "show_history"
     CLEAR_HISTORY = "clear_history"
+    SEARCH_HISTORY = "search_history"
     TRANSLATE = "translate"
     SHOW_TRANSLATE_LANGS = "show_translate_langs"
     PHONE_CALL = "phone_call"
@@ -66,6 +81,7 @@ class IntentType(str, Enum):
     GOOGLE_SYNC_CALENDAR = "google_sync_calendar"
     GOOGLE_PUSH_EVENTS = "google_push_events"
     UNDO = "undo"
+    REDO = "redo"
     HELP = "help"
     EXIT = "exit"
     UNKNOWN = "unknown"
@@ -77,144 +93,99 @@ class Intent:
     payload: str | None = None
 
 
-def _extract_after_phrase(text: str, phrases: tuple[str, ...]) -> str | None:
-    for phrase in phrases:
-        if phrase in text:
-            value = text.split(phrase, 1)[1].strip(" .!?")
-            if value:
-                return value
-    return None
-
-
-def _contains_any(text: str, keywords: tuple[str, ...]) -> bool:
-    return any(word in text for word in keywords)
+_REGEX_PHRASE_PATTERNS: list[tuple[str, str]] = [
+    (r"^add task\s+(.+)$", r"add task \1"),
+]
+
+_PHRASE_MAP: dict[str, str] = {
+    "gud mrng": "good morning",
+    "gd mrng": "good morning",
+    "whats up": "what is up",
+    "watsup": "what is up",
+    "wru": "where are you",
+    "hru": "how are you",
+    "wyd": "what are you doing",
+    "idk": "i do not know",
+    "dont": "do not",
+    "cant": "can not",
+    "wanna": "want to",
+    "gonna": "going to",
+    "kinda": "kind of",
+    "sorta": "sort of",
+    "bonjour": "hello",
+}
+
+_TOKEN_MAP: dict[str, str] = {
+    "u": "you",
+    "ur": "your",
+    "r": "are",
+    "pls": "please",
+    "plz": "please",
+    "thx": "thanks",
+    "ty": "thank you",
+    "im": "i am",
+    "luv": "love",
+    "bro": "friend",
+    "sis": "friend",
+    "gm": "good morning",
+    "gn": "good night",
+    "tmrw": "tomorrow",
+    "2day": "today",
+}
+
+DEFAULT_LOCALES = ("te", "hi", "es")
+
+_locales: tuple[str, ...] = DEFAULT_LOCALES
+_NORMALIZER: TextNormalizer | None = None
+_normalizer_lock = threading.Lock()
+
+
+def normalization_tables(
+    locales: Iterable[str] | None = None,
+) -> tuple[list[tuple[str, str]], dict[str, str], dict[str, str]]:
+    """Core rewrite tables merged with the language packs for ``locales``."""
+    regex_rewrites = list(_REGEX_PHRASE_PATTERNS)
+    phrase_map = dict(_PHRASE_MAP)
+    for code in _locales if locales is None else locales:
+        pack = load_language_pack(code)
+        regex_rewrites.extend(pack.regex_rewrites)
+        for src, dst in pack.phrase_map.items():
+            phrase_map.setdefault(src, dst)
+    return regex_rewrites, phrase_map, dict(_TOKEN_MAP)
+
+
+def configure_locales(locales: str | Iterable[str]) -> tuple[str, ...]:
+    """Select the language packs applied by the normalizer.
+
+    Unknown codes are ignored; the accepted ones are returned. Packs are only
+    imported and compiled when the next utterance is normalized.
+    """
+    global _locales, _NORMALIZER
+    accepted = tuple(code for code in parse_locales(locales) if code in AVAILABLE_LOCALES)
+    with _normalizer_lock:
+        _locales = accepted
+        _NORMALIZER = None
+    clear_intent_cache()
+    return accepted
+
+
+def active_locales() -> tuple[str, ...]:
+    return _locales
+
+
+def _get_normalizer() -> TextNormalizer:
+    global _NORMALIZER
+    with _normalizer_lock:
+        if _NORMALIZER is None:
+            _NORMALIZER = TextNormalizer(*normalization_tables())
+        return _NORMALIZER
 
 
 def _normalize_text(text: str) -> str:
-    cleaned = text.lower().strip()
-    cleaned = re.sub(r"[\t\r\n]+", " ", cleaned)
-    cleaned = re.sub(r"[!,?;\"()\[\]{}]", " ", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned)
-
-    regex_phrase_patterns: list[tuple[str, str]] = [
-        (r"^నాకు గుర్తు చేయి\s+(.+)$", r"remind me to \1"),
-        (r"^naaku gurtu cheyi\s+(.+)$", r"remind me to \1"),
-        (r"^gurtu cheyi\s+(.+)$", r"remind me to \1"),
-        (r"^मुझे याद दिलाओ\s+(.+)$", r"remind me to \1"),
-        (r"^mujhe yaad dilao\s+(.+)$", r"remind me to \1"),
-        (r"^recu[eé]rdame\s+(.+)$", r"remind me to \1"),
-        (r"^గుర్తుచేయి\s+(.+)$", r"remind me to \1"),
-        (r"^open cheyi\s+(.+)$", r"open \1"),
-        (r"^తెరువు\s+(.+)$", r"open \1"),
-        (r"^खोलो\s+(.+)$", r"open \1"),
-        (r"^kholo\s+(.+)$", r"open \1"),
-        (r"^abrir\s+(.+)$", r"open \1"),
-        (r"^abre\s+(.+)$", r"open \1"),
-        (r"^వెతుకు\s+(.+)$", r"search \1"),
-        (r"^ढूंढो\s+(.+)$", r"search \1"),
-        (r"^buscar\s+(.+)$", r"search \1"),
-        (r"^nota\s+(.+)$", r"note \1"),
-        (r"^గమనిక\s+(.+)$", r"note \1"),
-        (r"^नोट\s+(.+)$", r"note \1"),
-        (r"^చూపు రిమైండర్లు$", r"show reminders"),
-        (r"^recordatorios$", r"show reminders"),
-        (r"^reminders dikhao$", r"show reminders"),
-        (r"^చూపు tasks$", r"show tasks"),
-        (r"^tareas$", r"show tasks"),
-        (r"^tasks dikhao$", r"show tasks"),
-        (r"^add task\s+(.+)$", r"add task \1"),
-        (r"^పని జోడించు\s+(.+)$", r"add task \1"),
-        (r"^kaam jodo\s+(.+)$", r"add task \1"),
-        (r"^tarea\s+(.+)$", r"add task \1"),
-    ]
-    for pattern, replacement in regex_phrase_patterns:
-        cleaned = re.sub(pattern, replacement, cleaned)
-
-    phrase_map = {
-        "gud mrng": "good morning",
-        "gd mrng": "good morning",
-        "whats up": "what is up",
-        "watsup": "what is up",
-        "wru": "where are you",
-        "hru": "how are you",
-        "wyd": "what are you doing",
-        "idk": "i do not know",
-        "dont": "do not",
-        "cant": "can not",
-        "wanna": "want to",
-        "gonna": "going to",
-        "kinda": "kind of",
-        "sorta": "sort of",
-        "namaste": "hello",
-        "hola": "hello",
-        "bonjour": "hello",
-        "nuvvu ela unnava": "how are you",
-        "ela unnava": "how are you",
-        "ela unnav": "how are you",
-        "ela unav": "how are you",
-        "ela unavu": "how are you",
-        "bagunnava": "how are you",
-        "bagunava": "how are you",
-        "bagunnava?": "how are you",
-        "mee peru enti": "what is my name",
-        "samayam entha": "what is time",
-        "samayam enta": "what is time",
-        "thedi emiti": "what is date",
-        "tarikh kya hai": "what is date",
-        "que hora es": "what is time",
-        "que fecha es": "what is date",
-        "como estas": "how are you",
-        "kya kar sakte ho": "what can you do",
-        "ayuda": "help",
-        "gracias": "thanks",
-        "dhanyavad": "thanks",
-        "shukriya": "thanks",
-        "adios": "goodbye",
-        "hasta luego": "goodbye",
-        "buenos dias": "good morning",
-        "buenas noches": "good night",
-        "నమస్తే": "hello",
-        "హలో": "hello",
-        "హాయ్": "hello",
-        "నువ్వు ఎలా ఉన్నావు": "how are you",
-        "సమయం ఎంత": "what is time",
-        "సమయం ఎంతా": "what is time",
-        "తేదీ ఏమిటి": "what is date",
-        "నా పేరు ఏమిటి": "what is my name",
-        "నాకు సహాయం చేయి": "help",
-        "ధన్యవాదాలు": "thanks",
-        "వీడ్కోలు": "goodbye",
-        "नमस्ते": "hello",
-        "कैसे हो": "how are you",
-        "समय क्या है": "what is time",
-        "तारीख क्या है": "what is date",
-        "मेरा नाम क्या है": "what is my name",
-        "धन्यवाद": "thanks",
-        "अलविदा": "goodbye",
-    }
-    for src, dst in phrase_map.items():
-        cleaned = re.sub(rf"(?<!\S){re.escape(src)}(?!\S)", dst, cleaned)
-
-    token_map = {
-        "u": "you",
-        "ur": "your",
-        "r": "are",
-        "pls": "please",
-        "plz": "please",
-        "thx": "thanks",
-        "ty": "thank you",
-        "im": "i am",
-        "luv": "love",
-        "bro": "friend",
-        "sis": "friend",
-        "gm": "good morning",
-        "gn": "good night",
-        "tmrw": "tomorrow",
-        "2day": "today",
-    }
-    tokens = [token_map.get(token, token) for token in cleaned.split()]
-    cleaned = " ".join(tokens)
-    return re.sub(r"\s+", " ", cleaned).strip()
+    normalizer = _NORMALIZER
+    if normalizer is None:
+        normalizer = _get_normalizer()
+    return normalizer.normalize(text)
 
 
 def _extract_site_name(text: str) -> str | None:
@@ -381,8 +352,6 @@ def _extract_event(text: str) -> str | None:
 
 
 def _is_greeting(text: str) -> bool:
-    if text in ("hi", "hello", "hey", "good morning", "good evening", "what's up", "whats up"):
-        return True
     return bool(re.match(r"^(hi|hello|hey)\b", text))
 
 
@@ -393,275 +362,686 @@ def _looks_like_math_expression(expr: str) -> bool:
     return bool(re.fullmatch(r"[0-9\.\+\-\*/%\^()]+", compact))
 
 
-def parse_intent(command: str) -> Intent:
-    text = _normalize_text(command)
-
-    if _contains_any(text, ("exit", "quit", "stop", "goodbye", "bye")):
-        return Intent(IntentType.EXIT)
-
-    if _is_greeting(text):
-        return Intent(IntentType.GREETING)
-
-    if _contains_any(text, ("how are you", "how do you feel", "are you okay")):
-        return Intent(IntentType.HOW_ARE_YOU)
-
-    if _contains_any(text, ("daily chores", "plan my day", "routine for today", "today plan")):
-        return Intent(IntentType.DAILY_CHORES)
-
-    if _contains_any(text, ("motivate me", "motivation", "i feel lazy", "encourage me")):
-        return Intent(IntentType.MOTIVATION)
-
-    reminder_text = _extract_after_phrase(
-        text,
-        ("remind me to ", "set reminder to ", "add reminder to ", "remember to ", "remind me 2 "),
-    )
-    if reminder_text:
-        return Intent(IntentType.ADD_REMINDER, payload=reminder_text)
-
-    if _contains_any(text, ("show reminders", "my reminders", "list reminders", "what are my reminders")):
-        return Intent(IntentType.LIST_REMINDERS)
-
-    reminder_index = _extract_index(
+def _extract_reminder_index(text: str) -> str | None:
+    return _extract_index(
         text,
         (
             r"(?:delete|remove)\s+reminder\s+(\d+)",
             r"reminder\s+(\d+)\s+(?:delete|remove)",
         ),
     )
-    if reminder_index:
-        return Intent(IntentType.DELETE_REMINDER, payload=reminder_index)
 
-    if _contains_any(text, ("clear reminders", "delete all reminders", "remove all reminders")):
-        return Intent(IntentType.CLEAR_REMINDERS)
 
-    task_text = _extract_after_phrase(
-        text,
-        ("add task ", "add todo ", "todo ", "to do "),
-    )
-    if task_text:
-        return Intent(IntentType.ADD_TASK, payload=task_text)
-
-    if _contains_any(text, ("show tasks", "my tasks", "list tasks", "todo list", "to do list")):
-        return Intent(IntentType.LIST_TASKS)
-
-    task_done_index = _extract_index(
+def _extract_task_done_index(text: str) -> str | None:
+    return _extract_index(
         text,
         (
             r"(?:complete|finish|done)\s+task\s+(\d+)",
             r"mark\s+task\s+(\d+)\s+done",
         ),
     )
-    if task_done_index:
-        return Intent(IntentType.COMPLETE_TASK, payload=task_done_index)
 
-    task_delete_index = _extract_index(
+
+def _extract_task_delete_index(text: str) -> str | None:
+    return _extract_index(
         text,
         (
             r"(?:delete|remove)\s+task\s+(\d+)",
             r"task\s+(\d+)\s+(?:delete|remove)",
         ),
     )
-    if task_delete_index:
-        return Intent(IntentType.DELETE_TASK, payload=task_delete_index)
 
-    if _contains_any(text, ("clear tasks", "delete all tasks", "remove all tasks")):
-        return Intent(IntentType.CLEAR_TASKS)
 
-    add_contact_payload = _extract_contact_add(text)
-    if add_contact_payload:
-        return Intent(IntentType.ADD_CONTACT, payload=add_contact_payload)
+def _contact_name(value: str) -> str | None:
+    cleaned = value.split(" at ", 1)[0].split(" number ", 1)[0].strip()
+    if cleaned and not any(ch.isdigit() for ch in cleaned):
+        return cleaned
+    return None
 
-    if _contains_any(text, ("show contacts", "list contacts", "my contacts")):
-        return Intent(IntentType.LIST_CONTACTS)
 
-    contact_sms_payload = _extract_contact_sms(text)
-    if contact_sms_payload:
-        return Intent(IntentType.SMS_CONTACT, payload=contact_sms_payload)
+def _math_expression(value: str) -> str | None:
+    return value if _looks_like_math_expression(value) else None
 
-    whatsapp_payload = _extract_whatsapp(text)
-    if whatsapp_payload:
-        return Intent(IntentType.WHATSAPP_MESSAGE, payload=whatsapp_payload)
 
-    event_payload = _extract_event(text)
-    if event_payload:
-        return Intent(IntentType.ADD_EVENT, payload=event_payload)
+def _extract_after_hit(text: str, hits: dict[str, int], phrases: tuple[str, ...]) -> str | None:
+    for phrase in phrases:
+        start = hits.get(phrase)
+        if start is not None:
+            value = text[start + len(phrase):].strip(" .!?")
+            if value:
+                return value
+    return None
 
-    if _contains_any(text, ("show schedule", "my schedule", "calendar events", "upcoming events")):
-        return Intent(IntentType.SHOW_SCHEDULE)
 
-    if _contains_any(text, ("sync tasks to calendar", "sync my tasks", "calendar sync")):
-        return Intent(IntentType.SYNC_TASKS_CALENDAR)
+@dataclass(frozen=True)
+class IntentRule:
+    """One entry of the intent table.
 
-    if _contains_any(text, ("undo", "undo last")):
-        return Intent(IntentType.UNDO)
+    A rule is considered when the normalized text equals one of ``exact`` or
+    contains one of ``keywords`` or ``phrases``. Keywords alone are enough
+    unless the rule has an ``extract`` function, in which case they only gate
+    it. ``phrases`` take the text after the first phrase hit as payload, and
+    ``build`` can validate or reshape that payload (returning None rejects it).
+    Rules are tried in ascending ``priority``; the first match wins.
+    """
 
-    if _contains_any(text, ("google login", "login google", "connect google")):
-        return Intent(IntentType.GOOGLE_LOGIN)
+    intent_type: IntentType
+    priority: int
+    exact: tuple[str, ...] = ()
+    keywords: tuple[str, ...] = ()
+    phrases: tuple[str, ...] = ()
+    extract: Callable[[str], str | bool | None] | None = None
+    build: Callable[[str], str | None] | None = None
+
+    @property
+    def stage(self) -> str:
+        """Name this rule's work is recorded under when profiling is on."""
+        if self.extract is not None:
+            return f"extract:{self.extract.__name__}"
+        return f"rule:{self.intent_type.value}"
+
+    def evidence(self, text: str, hits: dict[str, int]) -> tuple[float, str, str]:
+        """Score a successful match: ``(confidence, kind, matched text)``."""
+        words = self.keywords + self.phrases
+        if text in self.exact or any(text == word.strip() for word in words):
+            return 1.0, "exact", text
+        matched = max((word.strip() for word in words if word in hits), key=len, default="")
+        if self.extract is not None:
+            return 0.9, "regex", matched
+        return round(0.5 + 0.4 * len(matched) / max(len(text), 1), 3), "keyword", matched
+
+    def match(self, text: str, hits: dict[str, int]) -> Intent | None:
+        if text in self.exact:
+            return Intent(self.intent_type)
+        payload: str | bool | None
+        if self.extract is not None:
+            if self.keywords and not any(word in hits for word in self.keywords):
+                return None
+            payload = self.extract(text)
+        elif self.phrases:
+            payload = _extract_after_hit(text, hits, self.phrases)
+        else:
+            return Intent(self.intent_type) if any(word in hits for word in self.keywords) else None
+        if isinstance(payload, str) and payload and self.build is not None:
+            payload = self.build(payload)
+        if not payload:
+            return None
+        if payload is True:
+            return Intent(self.intent_type)
+        return Intent(self.intent_type, payload=str(payload))
+
+
+INTENT_RULES: tuple[IntentRule, ...] = (
+    IntentRule(IntentType.EXIT, 10, keywords=("exit", "quit", "stop", "goodbye", "bye")),
+    IntentRule(
+        IntentType.GREETING,
+        20,
+        exact=("hi", "hello", "hey", "good morning", "good evening", "what's up", "whats up"),
+        keywords=("hi", "hello", "hey"),
+        extract=_is_greeting,
+    ),
+    IntentRule(IntentType.HOW_ARE_YOU, 30, keywords=("how are you", "how do you feel", "are you okay")),
+    IntentRule(
+        IntentType.DAILY_CHORES,
+        40,
+        keywords=("daily chores", "plan my day", "routine for today", "today plan"),
+    ),
+    IntentRule(IntentType.MOTIVATION, 50, keywords=("motivate me", "motivation", "i feel lazy", "encourage me")),
+    IntentRule(
+        IntentType.ADD_REMINDER,
+        60,
+        phrases=("remind me to ", "set reminder to ", "add reminder to ", "remember to ", "remind me 2 "),
+    ),
+    IntentRule(
+        IntentType.LIST_REMINDERS,
+        70,
+        keywords=("show reminders", "my reminders", "list reminders", "what are my reminders"),
+    ),
+    IntentRule(IntentType.DELETE_REMINDER, 80, keywords=("reminder",), extract=_extract_reminder_index),
+    IntentRule(
+        IntentType.CLEAR_REMINDERS,
+        90,
+        keywords=("clear reminders", "delete all reminders", "remove all reminders"),
+    ),
+    IntentRule(IntentType.ADD_TASK, 100, phrases=("add task ", "add todo ", "todo ", "to do ")),
+    IntentRule(
+        IntentType.LIST_TASKS,
+        110,
+        keywords=("show tasks", "my tasks", "list tasks", "todo list", "to do list"),
+    ),
+    IntentRule(IntentType.COMPLETE_TASK, 120, keywords=("task",), extract=_extract_task_done_index),
+    IntentRule(IntentType.DELETE_TASK, 130, keywords=("task",), extract=_extract_task_delete_index),
+    IntentRule(IntentType.CLEAR_TASKS, 140, keywords=("clear tasks", "delete all tasks", "remove all tasks")),
+    IntentRule(IntentType.ADD_CONTACT, 150, keywords=("contact",), extract=_extract_contact_add),
+    IntentRule(IntentType.LIST_CONTACTS, 160, keywords=("show contacts", "list contacts", "my contacts")),
+    IntentRule(IntentType.SMS_CONTACT, 170, keywords=("sms", "text"), extract=_extract_contact_sms),
+    IntentRule(IntentType.WHATSAPP_MESSAGE, 180, keywords=("whatsapp", "wa"), extract=_extract_whatsapp),
+    IntentRule(IntentType.ADD_EVENT, 190, keywords=("event",), extract=_extract_event),
+    IntentRule(
+        IntentType.SHOW_SCHEDULE,
+        200,
+        keywords=("show schedule", "my schedule", "calendar events", "upcoming events"),
+    ),
+    IntentRule(
+        IntentType.SYNC_TASKS_CALENDAR,
+        210,
+        keywords=("sync tasks to calendar", "sync my tasks", "calendar sync"),
+    ),
+    IntentRule(IntentType.UNDO, 220, keywords=("undo", "undo last")),
+    IntentRule(IntentType.REDO, 225, keywords=("redo", "redo last")),
+    IntentRule(IntentType.GOOGLE_LOGIN, 230, keywords=("google login", "login google", "connect google")),
+    IntentRule(
+        IntentType.GOOGLE_SYNC_CONTACTS,
+        240,
+        keywords=("sync google contacts", "google contacts sync", "import google contacts"),
+    ),
+    IntentRule(
+        IntentType.GOOGLE_SYNC_CALENDAR,
+        250,
+        keywords=("sync google calendar", "import google calendar", "pull google calendar"),
+    ),
+    IntentRule(
+        IntentType.GOOGLE_PUSH_EVENTS,
+        260,
+        keywords=("push events to google", "sync events to google", "export calendar"),
+    ),
+    IntentRule(IntentType.PHONE_CALL, 270, keywords=("call", "dial", "ring"), extract=_extract_phone_number),
+    IntentRule(IntentType.CALL_CONTACT, 280, phrases=("call ", "dial "), build=_contact_name),
+    IntentRule(IntentType.PHONE_SMS, 290, keywords=("send", "text", "sms"), extract=_extract_phone_sms),
+    IntentRule(
+        IntentType.PHONE_OPEN_APP,
+        300,
+        keywords=("open app", "launch app", "start app"),
+        extract=_extract_open_app,
+    ),
+    IntentRule(IntentType.STUDY_PLAN, 310, phrases=("study plan for ", "make study plan for ")),
+    IntentRule(IntentType.STUDY_EXPLAIN, 320, phrases=("explain ", "teach me ", "i want to learn ")),
+    IntentRule(IntentType.STUDY_QUIZ, 330, phrases=("quiz me on ", "test me on ")),
+    IntentRule(
+        IntentType.TRANSLATE,
+        340,
+        keywords=("translate", "what is", "how to say"),
+        extract=_extract_translation,
+    ),
+    IntentRule(
+        IntentType.SHOW_TRANSLATE_LANGS,
+        350,
+        keywords=("supported languages", "translation languages", "translate languages"),
+    ),
+    IntentRule(IntentType.THANKS, 360, keywords=("thank you", "thanks", "thank u")),
+    IntentRule(IntentType.SET_NAME, 370, phrases=("my name is ", "call me ")),
+    IntentRule(IntentType.GET_NAME, 380, keywords=("what is my name", "do you know my name", "who am i")),
+    IntentRule(IntentType.CHECK_IN, 390, keywords=("check in with me", "check on me", "how am i doing")),
+    IntentRule(IntentType.BREATHING, 400, keywords=("breathing exercise", "help me breathe", "calm me down")),
+    IntentRule(
+        IntentType.AFFIRMATION,
+        410,
+        keywords=("affirm me", "give me affirmation", "say something positive"),
+    ),
+    IntentRule(IntentType.STUDY_TIP, 420, keywords=("study tip", "help me study", "study advice")),
+    IntentRule(IntentType.FITNESS_TIP, 430, keywords=("fitness tip", "workout tip", "health tip")),
+    IntentRule(IntentType.MONEY_TIP, 440, keywords=("money tip", "finance tip", "save money")),
+    IntentRule(IntentType.SLEEP_TIP, 450, keywords=("sleep tip", "help me sleep", "better sleep")),
+    IntentRule(IntentType.ADD_EXPENSE, 460, keywords=("spent", "spend", "add expense"), extract=_extract_expense),
+    IntentRule(IntentType.SHOW_EXPENSES, 470, keywords=("show expenses", "list expenses", "my expenses")),
+    IntentRule(
+        IntentType.EXPENSE_REPORT,
+        480,
+        keywords=("expense report", "monthly expense report", "spending report"),
+    ),
+    IntentRule(IntentType.ADD_HABIT, 490, phrases=("add habit ", "new habit ")),
+    IntentRule(IntentType.DONE_HABIT, 500, phrases=("done habit ", "mark habit done ")),
+    IntentRule(IntentType.SHOW_HABITS, 510, keywords=("show habits", "list habits", "my habits")),
+    IntentRule(IntentType.DAY_SUMMARY, 520, keywords=("summarize my day", "day summary", "daily summary")),
+    IntentRule(
+        IntentType.SEARCH_HISTORY,
+        525,
+        phrases=("search history for ", "search my history for ", "search history ", "find in history "),
+    ),
+    IntentRule(IntentType.SHOW_HISTORY, 530, keywords=("show history", "chat history", "conversation history")),
+    IntentRule(IntentType.CLEAR_HISTORY, 540, keywords=("clear history", "delete history", "erase history")),
+    IntentRule(
+        IntentType.HELP,
+        550,
+        keywords=("what can you do", "help", "commands", "how can you help", "features"),
+    ),
+    IntentRule(IntentType.GET_TIME, 560, keywords=("time",)),
+    IntentRule(IntentType.GET_DATE, 570, keywords=("date", "day")),
+    IntentRule(IntentType.OPEN_SITE, 580, keywords=("open", "launch", "go to"), extract=_extract_site_name),
+    IntentRule(IntentType.SEARCH_WEB, 590, phrases=("search for ", "search ", "look up ", "find ")),
+    IntentRule(IntentType.CALCULATE, 600, phrases=("calculate ", "compute ", "what is "), build=_math_expression),
+    IntentRule(IntentType.SAVE_NOTE, 610, phrases=("note ", "write this down ", "save note ", "take a note ")),
+    IntentRule(IntentType.JOKE, 620, keywords=("joke",)),
+)
 
-    if _contains_any(text, ("sync google contacts", "google contacts sync", "import google contacts")):
-        return Intent(IntentType.GOOGLE_SYNC_CONTACTS)
 
-    if _contains_any(text, ("sync google calendar", "import google calendar", "pull google calendar")):
-        return Intent(IntentType.GOOGLE_SYNC_CALENDAR)
+@dataclass(frozen=True)
+class IntentCandidate:
+    intent: Intent
+    confidence: float
+    evidence: str
+    matched: str = ""
+
+
+# Near-miss corrections tried per unmatched command, closest first.
+FUZZY_ATTEMPTS = 3
+# A guessed command must never throw data away ("clear tusks").
+FUZZY_EXCLUDED = frozenset(
+    {
+        IntentType.DELETE_REMINDER,
+        IntentType.CLEAR_REMINDERS,
+        IntentType.DELETE_TASK,
+        IntentType.CLEAR_TASKS,
+        IntentType.CLEAR_HISTORY,
+    }
+)
+
+
+def _fuzzy_allowed(intent: Intent) -> bool:
+    return intent.intent_type != IntentType.UNKNOWN and intent.intent_type not in FUZZY_EXCLUDED
+
+
+class CompiledRules:
+    """Dispatcher built from an intent rule table.
+
+    Whole-utterance matches for every exact phrase and keyword are resolved
+    once at build time and answered from a dict. Otherwise one keyword scan
+    picks the candidate rules, and only those run their extractors, in
+    priority order.
+    """
+
+    def __init__(self, rules: Iterable[IntentRule]) -> None:
+        self.rules = tuple(sorted(rules, key=lambda rule: rule.priority))
+        self._by_word: dict[str, list[int]] = {}
+        self._by_exact: dict[str, list[int]] = {}
+        self._always: list[int] = []
+        for idx, rule in enumerate(self.rules):
+            for word in rule.keywords + rule.phrases:
+                self._by_word.setdefault(word, []).append(idx)
+            for phrase in rule.exact:
+                self._by_exact.setdefault(phrase, []).append(idx)
+            if not (rule.keywords or rule.phrases or rule.exact):
+                self._always.append(idx)
+        self.index = KeywordIndex(self._by_word)
+        self._exact: dict[str, Intent] = {}
+        for phrase in set(self._by_exact) | {word.strip() for word in self._by_word}:
+            self._exact[phrase] = self._dispatch(phrase)
+
+    def candidates(self, text: str, hits: dict[str, int]) -> list[int]:
+        found = set(self._always)
+        found.update(self._by_exact.get(text, ()))
+        for word in hits:
+            found.update(self._by_word[word])
+        return sorted(found)
+
+    def _dispatch(self, text: str) -> Intent:
+        hits = self.index.first_positions(text)
+        for idx in self.candidates(text, hits):
+            intent = self.rules[idx].match(text, hits)
+            if intent is not None:
+                return intent
+        return Intent(IntentType.UNKNOWN)
+
+    def dispatch(self, text: str) -> Intent:
+        intent = self._exact.get(text)
+        if intent is not None:
+            return intent
+        return self._dispatch(text)
+
+    def rank(
+        self, text: str, fuzzy: FuzzyPhraseIndex | None = None, attempts: int = FUZZY_ATTEMPTS
+    ) -> list[IntentCandidate]:
+        """Every rule that matches ``text``, from one keyword scan.
+
+        The first candidate is the one ``dispatch`` returns; the rest follow by
+        confidence. Fuzzy corrections are only tried when nothing matches, and
+        only the first ``attempts`` of them, as in ``fuzzy_dispatch``.
+        """
+        hits = self.index.first_positions(text)
+        found: dict[IntentType, IntentCandidate] = {}
+        for idx in self.candidates(text, hits):
+            rule = self.rules[idx]
+            intent = rule.match(text, hits)
+            if intent is not None and intent.intent_type not in found:
+                found[intent.intent_type] = IntentCandidate(intent, *rule.evidence(text, hits))
+        if not found and fuzzy is not None:
+            for distance, phrase, corrected in fuzzy.corrections(text)[:attempts]:
+                intent = self.dispatch(corrected)
+                if _fuzzy_allowed(intent) and intent.intent_type not in found:
+                    found[intent.intent_type] = IntentCandidate(intent, round(0.5 - 0.15 * distance, 3), "fuzzy", phrase)
+        ranked = list(found.values())
+        return ranked[:1] + sorted(ranked[1:], key=lambda candidate: -candidate.confidence)
+
+    def vocabulary(self) -> tuple[str, ...]:
+        """Every exact phrase and keyword in the table, without surrounding spaces."""
+        return tuple(dict.fromkeys(word.strip() for word in (*self._by_exact, *self._by_word)))
+
+    def fuzzy_dispatch(self, text: str, index: FuzzyPhraseIndex, attempts: int = FUZZY_ATTEMPTS) -> Intent | None:
+        """Retry ``text`` with its closest near-miss phrases corrected.
+
+        Corrections that land on a destructive intent are skipped.
+        """
+        for _, _, corrected in index.corrections(text)[:attempts]:
+            intent = self.dispatch(corrected)
+            if _fuzzy_allowed(intent):
+                return intent
+        return None
 
-    if _contains_any(text, ("push events to google", "sync events to google", "export calendar")):
-        return Intent(IntentType.GOOGLE_PUSH_EVENTS)
+    def dispatch_profiled(self, text: str, record: Callable[[str, float], None]) -> Intent:
+        """Same as ``dispatch``, reporting the time of each step to ``record``."""
+        clock = time.perf_counter
+        started = clock()
+        intent = self._exact.get(text)
+        record("exact", clock() - started)
+        if intent is not None:
+            return intent
+        started = clock()
+        hits = self.index.first_positions(text)
+        candidates = self.candidates(text, hits)
+        record("scan", clock() - started)
+        for idx in candidates:
+            rule = self.rules[idx]
+            started = clock()
+            intent = rule.match(text, hits)
+            record(rule.stage, clock() - started)
+            if intent is not None:
+                return intent
+        return Intent(IntentType.UNKNOWN)
+
+
+_RULES = CompiledRules(INTENT_RULES)
 
-    call_number = _extract_phone_number(text) if _contains_any(text, ("call", "dial", "ring")) else None
-    if call_number:
-        return Intent(IntentType.PHONE_CALL, payload=call_number)
 
-    call_contact_name = _extract_after_phrase(text, ("call ", "dial "))
-    if call_contact_name:
-        cleaned_name = call_contact_name.split(" at ", 1)[0].split(" number ", 1)[0].strip()
-        if cleaned_name and not any(ch.isdigit() for ch in cleaned_name):
-            return Intent(IntentType.CALL_CONTACT, payload=cleaned_name)
+@dataclass(frozen=True)
+class IntentCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
 
-    sms_payload = _extract_phone_sms(text)
-    if sms_payload:
-        return Intent(IntentType.PHONE_SMS, payload=sms_payload)
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
 
-    if _contains_any(text, ("open app", "launch app", "start app")):
-        app_name = _extract_open_app(text)
-        if app_name:
-            return Intent(IntentType.PHONE_OPEN_APP, payload=app_name)
 
-    study_plan_topic = _extract_after_phrase(
-        text,
-        ("study plan for ", "make study plan for "),
-    )
-    if study_plan_topic:
-        return Intent(IntentType.STUDY_PLAN, payload=study_plan_topic)
+class _IntentCache:
+    """Bounded LRU map from raw command strings to parsed intents."""
 
-    explain_topic = _extract_after_phrase(
-        text,
-        ("explain ", "teach me ", "i want to learn "),
-    )
-    if explain_topic:
-        return Intent(IntentType.STUDY_EXPLAIN, payload=explain_topic)
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = max(1, int(maxsize))
+        self._entries: OrderedDict[str, Intent] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
-    quiz_topic = _extract_after_phrase(
-        text,
-        ("quiz me on ", "test me on "),
-    )
-    if quiz_topic:
-        return Intent(IntentType.STUDY_QUIZ, payload=quiz_topic)
+    def get(self, command: str) -> Intent | None:
+        with self._lock:
+            intent = self._entries.get(command)
+            if intent is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(command)
+            self.hits += 1
+            return intent
 
-    translation_payload = _extract_translation(text)
-    if translation_payload:
-        return Intent(IntentType.TRANSLATE, payload=translation_payload)
+    def put(self, command: str, intent: Intent) -> None:
+        with self._lock:
+            self._entries[command] = intent
+            self._entries.move_to_end(command)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
 
-    if _contains_any(text, ("supported languages", "translation languages", "translate languages")):
-        return Intent(IntentType.SHOW_TRANSLATE_LANGS)
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
 
-    if _contains_any(text, ("thank you", "thanks", "thank u")):
-        return Intent(IntentType.THANKS)
+    def stats(self) -> IntentCacheStats:
+        with self._lock:
+            return IntentCacheStats(self.hits, self.misses, self.evictions, len(self._entries), self.maxsize)
 
-    name_text = _extract_after_phrase(
-        text,
-        ("my name is ", "call me "),
-    )
-    if name_text:
-        return Intent(IntentType.SET_NAME, payload=name_text)
 
-    if _contains_any(text, ("what is my name", "do you know my name", "who am i")):
-        return Intent(IntentType.GET_NAME)
+_intent_cache: _IntentCache | None = None
 
-    if _contains_any(text, ("check in with me", "check on me", "how am i doing")):
-        return Intent(IntentType.CHECK_IN)
 
-    if _contains_any(text, ("breathing exercise", "help me breathe", "calm me down")):
-        return Intent(IntentType.BREATHING)
+def enable_intent_cache(maxsize: int = 256) -> None:
+    """Memoize parse_intent results for up to ``maxsize`` distinct commands."""
+    global _intent_cache
+    _intent_cache = _IntentCache(maxsize)
 
-    if _contains_any(text, ("affirm me", "give me affirmation", "say something positive")):
-        return Intent(IntentType.AFFIRMATION)
 
-    if _contains_any(text, ("study tip", "help me study", "study advice")):
-        return Intent(IntentType.STUDY_TIP)
+def disable_intent_cache() -> None:
+    global _intent_cache
+    _intent_cache = None
 
-    if _contains_any(text, ("fitness tip", "workout tip", "health tip")):
-        return Intent(IntentType.FITNESS_TIP)
 
-    if _contains_any(text, ("money tip", "finance tip", "save money")):
-        return Intent(IntentType.MONEY_TIP)
+def clear_intent_cache() -> None:
+    if _intent_cache is not None:
+        _intent_cache.clear()
 
-    if _contains_any(text, ("sleep tip", "help me sleep", "better sleep")):
-        return Intent(IntentType.SLEEP_TIP)
 
-    expense_payload = _extract_expense(text)
-    if expense_payload:
-        return Intent(IntentType.ADD_EXPENSE, payload=expense_payload)
+def intent_cache_stats() -> IntentCacheStats | None:
+    return _intent_cache.stats() if _intent_cache is not None else None
 
-    if _contains_any(text, ("show expenses", "list expenses", "my expenses")):
-        return Intent(IntentType.SHOW_EXPENSES)
 
-    if _contains_any(text, ("expense report", "monthly expense report", "spending report")):
-        return Intent(IntentType.EXPENSE_REPORT)
+@dataclass(frozen=True)
+class StageTiming:
+    calls: int
+    total: float
+    max: float
 
-    habit_text = _extract_after_phrase(text, ("add habit ", "new habit "))
-    if habit_text:
-        return Intent(IntentType.ADD_HABIT, payload=habit_text)
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
 
-    done_habit = _extract_after_phrase(text, ("done habit ", "mark habit done "))
-    if done_habit:
-        return Intent(IntentType.DONE_HABIT, payload=done_habit)
 
-    if _contains_any(text, ("show habits", "list habits", "my habits")):
-        return Intent(IntentType.SHOW_HABITS)
+class _IntentProfiler:
+    """Accumulates call counts and wall time per parsing stage."""
 
-    if _contains_any(text, ("summarize my day", "day summary", "daily summary")):
-        return Intent(IntentType.DAY_SUMMARY)
+    def __init__(self) -> None:
+        self._stages: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
 
-    if _contains_any(text, ("show history", "chat history", "conversation history")):
-        return Intent(IntentType.SHOW_HISTORY)
+    def record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            entry = self._stages.get(stage)
+            if entry is None:
+                self._stages[stage] = [1, seconds, seconds]
+                return
+            entry[0] += 1
+            entry[1] += seconds
+            if seconds > entry[2]:
+                entry[2] = seconds
 
-    if _contains_any(text, ("clear history", "delete history", "erase history")):
-        return Intent(IntentType.CLEAR_HISTORY)
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
 
-    if _contains_any(
-        text,
-        (
-            "what can you do",
-            "help",
-            "commands",
-            "how can you help",
-            "features",
-        ),
-    ):
-        return Intent(IntentType.HELP)
+    def snapshot(self) -> dict[str, StageTiming]:
+        with self._lock:
+            return {
+                stage: StageTiming(int(calls), total, peak) for stage, (calls, total, peak) in self._stages.items()
+            }
 
-    if "time" in text:
-        return Intent(IntentType.GET_TIME)
 
-    if "date" in text or "day" in text:
-        return Intent(IntentType.GET_DATE)
+_intent_profiler: _IntentProfiler | None = None
+_fuzzy_index: FuzzyPhraseIndex | None = None
 
-    site = _extract_site_name(text)
-    if site:
-        return Intent(IntentType.OPEN_SITE, payload=site)
 
-    search_query = _extract_after_phrase(
-        text,
-        ("search for ", "search ", "look up ", "find "),
-    )
-    if search_query:
-        return Intent(IntentType.SEARCH_WEB, payload=search_query)
+def enable_fuzzy_matching(max_distance: int = 2) -> None:
+    """Retry unmatched commands with misheard keyword phrases corrected.
 
-    calc_expr = _extract_after_phrase(
-        text,
-        ("calculate ", "compute ", "what is "),
-    )
-    if calc_expr and _looks_like_math_expression(calc_expr):
-        return Intent(IntentType.CALCULATE, payload=calc_expr)
+    The n-gram index is built here, so parsing costs nothing extra until this
+    is called, and only commands that would be UNKNOWN pay for the lookup.
+    """
+    global _fuzzy_index
+    _fuzzy_index = FuzzyPhraseIndex(_RULES.vocabulary(), max_distance=max_distance)
+    clear_intent_cache()
 
-    note_text = _extract_after_phrase(
-        text,
-        ("note ", "write this down ", "save note ", "take a note "),
+
+def disable_fuzzy_matching() -> None:
+    global _fuzzy_index
+    _fuzzy_index = None
+    clear_intent_cache()
+
+
+def enable_intent_profiling() -> None:
+    """Record time spent per stage (normalize, exact, scan) and per rule or extractor."""
+    global _intent_profiler
+    if _intent_profiler is None:
+        _intent_profiler = _IntentProfiler()
+
+
+def disable_intent_profiling() -> None:
+    global _intent_profiler
+    _intent_profiler = None
+
+
+def reset_intent_profile() -> None:
+    if _intent_profiler is not None:
+        _intent_profiler.reset()
+
+
+def intent_profile() -> dict[str, StageTiming] | None:
+    return _intent_profiler.snapshot() if _intent_profiler is not None else None
+
+
+def format_intent_profile(limit: int = 10) -> str:
+    """Render the slowest stages by total time, one per line, for logs."""
+    profile = intent_profile()
+    if not profile:
+        return "no intent profile recorded"
+    ranked = sorted(profile.items(), key=lambda item: item[1].total, reverse=True)[:limit]
+    return "\n".join(
+        f"{stage}: {timing.calls} calls, {timing.total * 1000:.2f} ms total, "
+        f"{timing.mean * 1_000_000:.1f} us mean, {timing.max * 1_000_000:.1f} us max"
+        for stage, timing in ranked
     )
-    if note_text:
-        return Intent(IntentType.SAVE_NOTE, payload=note_text)
 
-    if "joke" in text:
-        return Intent(IntentType.JOKE)
 
-    return Intent(IntentType.UNKNOWN)
+def parse_intent(command: str) -> Intent:
+    cache = _intent_cache
+    if cache is None:
+        return _parse_uncached(command)
+    intent = cache.get(command)
+    if intent is None:
+        intent = _parse_uncached(command)
+        cache.put(command, intent)
+    return intent
+
+
+def rank_intents(command: str, k: int = 3) -> list[IntentCandidate]:
+    """Top ``k`` intents that ``command`` could mean, with confidence and evidence.
+
+    The first entry is what ``parse_intent`` returns; an empty list means
+    nothing matched (``parse_intent`` would say UNKNOWN).
+    """
+    return _RULES.rank(_normalize_text(command), _fuzzy_index)[: max(0, k)]
+
+
+@dataclass
+class BatchParseStats:
+    count: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def per_second(self) -> float:
+        return self.count / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _parse_chunk(commands: list[str]) -> list[Intent]:
+    return [parse_intent(command) for command in commands]
+
+
+def _init_parse_worker(locales: tuple[str, ...], fuzzy_distance: int | None) -> None:
+    # Spawned workers start from the module defaults, so they are given the
+    # parent's language packs and fuzzy tier explicitly.
+    configure_locales(locales)
+    if fuzzy_distance is None:
+        disable_fuzzy_matching()
+    else:
+        enable_fuzzy_matching(fuzzy_distance)
+
+
+def parse_intents(
+    commands: Iterable[str],
+    workers: int = 1,
+    chunk_size: int = 1000,
+    stats: BatchParseStats | None = None,
+    mp_context: BaseContext | None = None,
+) -> Iterator[Intent]:
+    """Parse many commands, yielding intents in input order.
+
+    Input is consumed lazily in chunks. With ``workers > 1`` and more than one
+    chunk of input, chunks are parsed in a process pool with a bounded number
+    in flight; anything smaller is parsed in-process. Workers use the same
+    locales and fuzzy setting as the caller whatever ``mp_context`` they are
+    started with. ``stats`` (if given) is filled in with the count and wall
+    time once the generator is exhausted.
+    """
+    started = time.perf_counter()
+    count = 0
+    source = iter(commands)
+    chunk_size = max(1, int(chunk_size))
+    first = list(islice(source, chunk_size))
+    second = list(islice(source, chunk_size)) if workers > 1 and len(first) == chunk_size else []
+
+    if not second:
+        for command in first:
+            yield parse_intent(command)
+            count += 1
+        for command in source:
+            yield parse_intent(command)
+            count += 1
+    else:
+        # Imported here so single-process callers never load the pool machinery.
+        from concurrent.futures import ProcessPoolExecutor
+
+        fuzzy = _fuzzy_index
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_parse_worker,
+            initargs=(active_locales(), fuzzy.max_distance if fuzzy is not None else None),
+        ) as pool:
+            pending: deque[Future[list[Intent]]] = deque(
+                [pool.submit(_parse_chunk, first), pool.submit(_parse_chunk, second)]
+            )
+            while pending:
+                while len(pending) < workers * 2:
+                    chunk = list(islice(source, chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(pool.submit(_parse_chunk, chunk))
+                for intent in pending.popleft().result():
+                    yield intent
+                    count += 1
+
+    if stats is not None:
+        stats.count = count
+        stats.elapsed = time.perf_counter() - started
+
+
+def _parse_uncached(command: str) -> Intent:
+    profiler = _intent_profiler
+    fuzzy = _fuzzy_index
+    if profiler is None:
+        text = _normalize_text(command)
+        intent = _RULES.dispatch(text)
+        if fuzzy is not None and intent.intent_type == IntentType.UNKNOWN:
+            return _RULES.fuzzy_dispatch(text, fuzzy) or intent
+        return intent
+    clock = time.perf_counter
+    started = clock()
+    text = _normalize_text(command)
+    profiler.record("normalize", clock() - started)
+    intent = _RULES.dispatch_profiled(text, profiler.record)
+    if fuzzy is not None and intent.intent_type == IntentType.UNKNOWN:
+        fuzzy_started = clock()
+        intent = _RULES.fuzzy_dispatch(text, fuzzy) or intent
+        profiler.record("fuzzy", clock() - fuzzy_started)
+    profiler.record("total", clock() - started)
+    return intent
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Iterator
+
+
+class KeywordIndex:
+    """Aho-Corasick automaton over a fixed set of keywords.
+
+    The automaton is built once and turned into a full transition table, so a
+    scan is one dictionary lookup per character however many keywords there are.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords = tuple(dict.fromkeys(word for word in keywords if word))
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[list[str]] = [[]]
+        for word in self.keywords:
+            state = 0
+            for ch in word:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(word)
+
+        fail = [0] * len(goto)
+        order: list[int] = []
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for ch, nxt in goto[state].items():
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                candidate = goto[fallback].get(ch, 0)
+                fail[nxt] = candidate if candidate != nxt else 0
+                queue.append(nxt)
+
+        # Resolve failure links into complete transitions (breadth-first, so a
+        # state's failure target is always finished before the state itself).
+        self._delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        self._outputs: list[tuple[str, ...]] = [()] * len(goto)
+        for state in order:
+            merged = dict(self._delta[fail[state]])
+            merged.update(goto[state])
+            self._delta[state] = merged
+            self._outputs[state] = tuple(outputs[state]) + self._outputs[fail[state]]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, str]]:
+        """Yield ``(start, keyword)`` for every occurrence, in order of end position."""
+        delta = self._delta
+        outputs = self._outputs
+        state = 0
+        for end, ch in enumerate(text, start=1):
+            state = delta[state].get(ch, 0)
+            for word in outputs[state]:
+                yield end - len(word), word
+
+    def first_positions(self, text: str) -> dict[str, int]:
+        """Map each keyword found in ``text`` to the start of its first occurrence."""
+        delta = self._delta
+        outputs = self._outputs
+        found: dict[str, int] = {}
+        state = 0
+        for end, ch in enumerate(text, start=1):
+            state = delta[state].get(ch, 0)
+            for word in outputs[state]:
+                if word not in found:
+                    found[word] = end - len(word)
+        return found
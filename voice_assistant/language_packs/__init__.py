@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import importlib
+from typing import Iterable
+
+
+AVAILABLE_LOCALES = ("es", "hi", "te")
+
+
+@dataclass(frozen=True)
+class LanguagePack:
+    """Rewrites that map one locale's phrasing onto the English commands."""
+
+    code: str
+    regex_rewrites: tuple[tuple[str, str], ...]
+    phrase_map: dict[str, str]
+
+
+@lru_cache(maxsize=None)
+def load_language_pack(code: str) -> LanguagePack:
+    """Import the pack for ``code`` on first use."""
+    if code not in AVAILABLE_LOCALES:
+        raise ValueError(f"Unknown language pack: {code}")
+    module = importlib.import_module(f"{__name__}.{code}")
+    return LanguagePack(code, tuple(module.REGEX_REWRITES), dict(module.PHRASE_MAP))
+
+
+def parse_locales(value: str | Iterable[str]) -> tuple[str, ...]:
+    """Split a comma-separated locale list, keeping order and dropping blanks and duplicates."""
+    items = value.split(",") if isinstance(value, str) else value
+    return tuple(dict.fromkeys(item.strip().lower() for item in items if item.strip()))
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+REGEX_REWRITES: list[tuple[str, str]] = [
+    (r"^recu[eé]rdame\s+(.+)$", r"remind me to \1"),
+    (r"^abrir\s+(.+)$", r"open \1"),
+    (r"^abre\s+(.+)$", r"open \1"),
+    (r"^buscar\s+(.+)$", r"search \1"),
+    (r"^nota\s+(.+)$", r"note \1"),
+    (r"^recordatorios$", r"show reminders"),
+    (r"^tareas$", r"show tasks"),
+    (r"^tarea\s+(.+)$", r"add task \1"),
+]
+
+PHRASE_MAP: dict[str, str] = {
+    "hola": "hello",
+    "que hora es": "what is time",
+    "que fecha es": "what is date",
+    "como estas": "how are you",
+    "ayuda": "help",
+    "gracias": "thanks",
+    "adios": "goodbye",
+    "hasta luego": "goodbye",
+    "buenos dias": "good morning",
+    "buenas noches": "good night",
+}
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+REGEX_REWRITES: list[tuple[str, str]] = [
+    (r"^मुझे याद दिलाओ\s+(.+)$", r"remind me to \1"),
+    (r"^mujhe yaad dilao\s+(.+)$", r"remind me to \1"),
+    (r"^खोलो\s+(.+)$", r"open \1"),
+    (r"^kholo\s+(.+)$", r"open \1"),
+    (r"^ढूंढो\s+(.+)$", r"search \1"),
+    (r"^नोट\s+(.+)$", r"note \1"),
+    (r"^reminders dikhao$", r"show reminders"),
+    (r"^tasks dikhao$", r"show tasks"),
+    (r"^kaam jodo\s+(.+)$", r"add task \1"),
+]
+
+PHRASE_MAP: dict[str, str] = {
+    "namaste": "hello",
+    "tarikh kya hai": "what is date",
+    "kya kar sakte ho": "what can you do",
+    "dhanyavad": "thanks",
+    "shukriya": "thanks",
+    "नमस्ते": "hello",
+    "कैसे हो": "how are you",
+    "समय क्या है": "what is time",
+    "तारीख क्या है": "what is date",
+    "मेरा नाम क्या है": "what is my name",
+    "धन्यवाद": "thanks",
+    "अलविदा": "goodbye",
+}
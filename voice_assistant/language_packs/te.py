@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+REGEX_REWRITES: list[tuple[str, str]] = [
+    (r"^నాకు గుర్తు చేయి\s+(.+)$", r"remind me to \1"),
+    (r"^naaku gurtu cheyi\s+(.+)$", r"remind me to \1"),
+    (r"^gurtu cheyi\s+(.+)$", r"remind me to \1"),
+    (r"^గుర్తుచేయి\s+(.+)$", r"remind me to \1"),
+    (r"^open cheyi\s+(.+)$", r"open \1"),
+    (r"^తెరువు\s+(.+)$", r"open \1"),
+    (r"^వెతుకు\s+(.+)$", r"search \1"),
+    (r"^గమనిక\s+(.+)$", r"note \1"),
+    (r"^చూపు రిమైండర్లు$", r"show reminders"),
+    (r"^చూపు tasks$", r"show tasks"),
+    (r"^పని జోడించు\s+(.+)$", r"add task \1"),
+]
+
+PHRASE_MAP: dict[str, str] = {
+    "namaste": "hello",
+    "nuvvu ela unnava": "how are you",
+    "ela unnava": "how are you",
+    "ela unnav": "how are you",
+    "ela unav": "how are you",
+    "ela unavu": "how are you",
+    "bagunnava": "how are you",
+    "bagunava": "how are you",
+    "bagunnava?": "how are you",
+    "mee peru enti": "what is my name",
+    "samayam entha": "what is time",
+    "samayam enta": "what is time",
+    "thedi emiti": "what is date",
+    "నమస్తే": "hello",
+    "హలో": "hello",
+    "హాయ్": "hello",
+    "నువ్వు ఎలా ఉన్నావు": "how are you",
+    "సమయం ఎంత": "what is time",
+    "సమయం ఎంతా": "what is time",
+    "తేదీ ఏమిటి": "what is date",
+    "నా పేరు ఏమిటి": "what is my name",
+    "నాకు సహాయం చేయి": "help",
+    "ధన్యవాదాలు": "thanks",
+    "వీడ్కోలు": "goodbye",
+}
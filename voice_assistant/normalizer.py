@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import re
+from typing import Mapping, Sequence
+
+
+_SEPARATORS = re.compile(r"[\s!,?;\"()\[\]{}]+")
+
+
+def _phrase_pattern(phrase: str) -> str:
+    return rf"(?<!\S){re.escape(phrase)}(?!\S)"
+
+
+def normalize_reference(
+    text: str,
+    regex_rewrites: Sequence[tuple[str, str]],
+    phrase_map: Mapping[str, str],
+    token_map: Mapping[str, str],
+) -> str:
+    """Rewrite one rule at a time, in table order.
+
+    This is the original normalization algorithm. It is kept as the
+    specification that ``TextNormalizer`` must reproduce byte for byte.
+    """
+    cleaned = text.lower().strip()
+    cleaned = re.sub(r"[\t\r\n]+", " ", cleaned)
+    cleaned = re.sub(r"[!,?;\"()\[\]{}]", " ", cleaned)
+    cleaned = re.sub(r"\s+", " ", cleaned)
+    for pattern, replacement in regex_rewrites:
+        cleaned = re.sub(pattern, replacement, cleaned)
+    for src, dst in phrase_map.items():
+        cleaned = re.sub(_phrase_pattern(src), dst, cleaned)
+    tokens = [token_map.get(token, token) for token in cleaned.split()]
+    cleaned = " ".join(tokens)
+    return re.sub(r"\s+", " ", cleaned).strip()
+
+
+def _can_overlap(source: list[str], output: list[str]) -> bool:
+    for start in range(1 - len(source), len(output)):
+        aligned = [
+            (token, output[start + idx])
+            for idx, token in enumerate(source)
+            if 0 <= start + idx < len(output)
+        ]
+        if all(left == right for left, right in aligned):
+            return True
+    return False
+
+
+def _single_pass_safe(entries: Sequence[tuple[str, str]], phrase_count: int) -> bool:
+    """Check that one leftmost-first scan gives the same result as sequential rewrites.
+
+    ``entries`` are the phrase rewrites followed by the token rewrites. Sequential
+    application differs from a single scan only when an output can be matched
+    again, or when two sources overlap and the one starting later has priority.
+    """
+    sources = [src.split() for src, _ in entries]
+    outputs = [dst.split() for _, dst in entries[:phrase_count]]
+    for tokens in sources:
+        if not tokens or any(_can_overlap(tokens, output) for output in outputs):
+            return False
+    for a_idx, a_tokens in enumerate(sources):
+        for b_idx, b_tokens in enumerate(sources):
+            if a_idx == b_idx:
+                continue
+            for offset in range(1, len(a_tokens)):
+                tail = a_tokens[offset:]
+                overlap = min(len(tail), len(b_tokens))
+                if tail[:overlap] == b_tokens[:overlap] and b_idx < a_idx:
+                    return False
+    return True
+
+
+class TextNormalizer:
+    """Compiled form of the normalization tables.
+
+    The anchored regex rewrites are merged into one alternation, and the phrase
+    and token maps into one leftmost-first scan, so an utterance costs a couple
+    of regex passes no matter how large the tables grow. Tables that cannot be
+    merged safely fall back to sequential rewriting for that stage.
+    """
+
+    def __init__(
+        self,
+        regex_rewrites: Sequence[tuple[str, str]],
+        phrase_map: Mapping[str, str],
+        token_map: Mapping[str, str],
+    ) -> None:
+        self.regex_rewrites = list(regex_rewrites)
+        self.phrase_map = dict(phrase_map)
+        self.token_map = dict(token_map)
+        self._rules = [(re.compile(pattern), replacement) for pattern, replacement in self.regex_rewrites]
+        self._rule_matcher = self._compile_rule_matcher()
+
+        entries = list(self.phrase_map.items()) + list(self.token_map.items())
+        self._replacements = {**self.token_map, **self.phrase_map}
+        self._phrase_matcher: re.Pattern[str] | None = None
+        if entries and _single_pass_safe(entries, len(self.phrase_map)):
+            alternation = "|".join(re.escape(src) for src, _ in entries)
+            self._phrase_matcher = re.compile(rf"(?<!\S)(?:{alternation})(?!\S)")
+        self._sequential_phrases = [
+            (re.compile(_phrase_pattern(src)), dst) for src, dst in self.phrase_map.items()
+        ]
+
+    def _compile_rule_matcher(self) -> re.Pattern[str] | None:
+        if not self._rules:
+            return None
+        if not all(pattern.startswith("^") for pattern, _ in self.regex_rewrites):
+            return None
+        branches = "|".join(f"(?P<_r{idx}>{pattern})" for idx, (pattern, _) in enumerate(self.regex_rewrites))
+        try:
+            return re.compile(branches)
+        except re.error:
+            return None
+
+    def _apply_rules(self, text: str) -> str:
+        if self._rule_matcher is None:
+            for pattern, replacement in self._rules:
+                text = pattern.sub(replacement, text)
+            return text
+        last = -1
+        while True:
+            match = self._rule_matcher.match(text)
+            if match is None:
+                return text
+            index = int(str(match.lastgroup)[2:])
+            if index <= last:
+                # The rewritten text matches a rule that already had its turn, so
+                # the merged matcher cannot tell which later rule applies next.
+                for pattern, replacement in self._rules[last + 1:]:
+                    text = pattern.sub(replacement, text)
+                return text
+            pattern, replacement = self._rules[index]
+            text = pattern.sub(replacement, text)
+            last = index
+
+    def _replace(self, match: re.Match[str]) -> str:
+        return self._replacements[match.group(0)]
+
+    def normalize(self, text: str) -> str:
+        cleaned = _SEPARATORS.sub(" ", text.lower().strip())
+        cleaned = self._apply_rules(cleaned)
+        if self._phrase_matcher is not None:
+            cleaned = self._phrase_matcher.sub(self._replace, cleaned)
+            return " ".join(cleaned.split())
+        for pattern, dst in self._sequential_phrases:
+            cleaned = pattern.sub(dst, cleaned)
+        cleaned = " ".join(self.token_map.get(token, token) for token in cleaned.split())
+        return " ".join(cleaned.split())
+
+    __call__ = normalize
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime
+import json
+from pathlib import Path
+import time
+from typing import Iterator, Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile of ``values`` (``pct`` in 0..100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * min(max(pct, 0.0), 100.0) / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values: Sequence[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    return {
+        "count": float(len(ordered)),
+        "p50": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "p99": percentile(ordered, 99),
+    }
+
+
+class StartupTracer:
+    """Records how long each named phase of a start-up sequence takes.
+
+    Phases are timed with ``with tracer.phase("name"):``; nested phases are
+    recorded as ``outer/inner``. Recording is cheap enough to stay on; the
+    report is only printed or written when asked.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.phases: list[tuple[str, float]] = []
+        self._stack: list[str] = []
+        self.finished: float | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        self._stack.append(name)
+        label = "/".join(self._stack)
+        # The slot is taken on entry so a phase is listed before its children.
+        slot = len(self.phases)
+        self.phases.append((label, 0.0))
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[slot] = (label, time.perf_counter() - start)
+            self._stack.pop()
+
+    def finish(self) -> float:
+        """Stop the clock and return the total start-up time in seconds."""
+        if self.finished is None:
+            self.finished = time.perf_counter()
+        return self.finished - self.started
+
+    def report(self) -> dict[str, object]:
+        total = self.finish()
+        return {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "total_ms": round(total * 1000, 3),
+            "phases": [{"name": name, "ms": round(elapsed * 1000, 3)} for name, elapsed in self.phases],
+        }
+
+    def format_report(self) -> str:
+        total = self.finish()
+        lines = [f"Startup: {total * 1000:.1f} ms"]
+        for name, elapsed in self.phases:
+            share = elapsed / total * 100 if total else 0.0
+            indent = "  " * name.count("/")
+            lines.append(f"  {indent}{name.rsplit('/', 1)[-1]:<{28 - len(indent)}} {elapsed * 1000:8.1f} ms {share:5.1f}%")
+        return "\n".join(lines)
+
+    def write_report(self, path: str) -> None:
+        """Append the report as one JSON line, so successive starts can be compared."""
+        file_path = Path(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with file_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(self.report()) + "\n")
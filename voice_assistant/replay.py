@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+import json
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from voice_assistant.config import Settings
+from voice_assistant.perf import summarize
+
+if TYPE_CHECKING:
+    from voice_assistant.assistant import VoiceAssistant
+
+
+_STATE_FILES = (
+    "notes_file",
+    "reminders_file",
+    "tasks_file",
+    "profile_file",
+    "expenses_file",
+    "habits_file",
+    "history_file",
+    "history_archive_dir",
+    "contacts_file",
+    "events_file",
+    "undo_journal_file",
+    "sqlite_db_file",
+    "ai_log_file",
+    "log_file",
+    # Per user too: a shared token would let one user's "google login" sync
+    # everyone else against that account.
+    "google_token_file",
+    "startup_trace_file",
+)
+
+
+def isolated_settings(settings: Settings, data_dir: str) -> Settings:
+    """Point every state file of ``settings`` into ``data_dir``."""
+    root = Path(data_dir)
+    root.mkdir(parents=True, exist_ok=True)
+    return replace(
+        settings,
+        **{name: str(root / Path(getattr(settings, name)).name) for name in _STATE_FILES},
+    )
+
+
+def read_utterances(path: str) -> Iterator[str]:
+    """Yield commands from a transcript file.
+
+    Plain text has one command per line; blank lines and ``#`` comments are
+    skipped. JSONL lines may be strings or objects with a ``text`` (or
+    ``command``) field; objects with a ``role`` other than ``user`` are
+    skipped, so a ``history.jsonl`` can be replayed as is.
+    """
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line[0] in "{\"":
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError:
+                    yield line
+                    continue
+                if isinstance(item, str):
+                    text = item
+                elif isinstance(item, dict) and item.get("role", "user") == "user":
+                    text = item.get("text", item.get("command", ""))
+                else:
+                    continue
+                if isinstance(text, str) and text.strip():
+                    yield text.strip()
+                continue
+            yield line
+
+
+@dataclass
+class ReplayReport:
+    commands: int = 0
+    elapsed: float = 0.0
+    flush_elapsed: float = 0.0
+    stopped_early: bool = False
+    replies: list[tuple[str, list[str]]] = field(default_factory=list)
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+
+    @property
+    def commands_per_second(self) -> float:
+        return self.commands / self.elapsed if self.elapsed else 0.0
+
+    def per_intent(self) -> dict[str, dict[str, float]]:
+        """Latency percentiles in milliseconds per intent type, busiest first."""
+        ordered = sorted(self.latencies.items(), key=lambda item: (-len(item[1]), item[0]))
+        return {name: summarize([value * 1000 for value in values]) for name, values in ordered}
+
+
+def replay(assistant: VoiceAssistant, utterances: Iterable[str]) -> ReplayReport:
+    """Feed ``utterances`` through ``assistant._handle`` and time each one.
+
+    Replies are captured instead of spoken. Replay stops at the first command
+    that ends the session, such as "exit". Queued writes are flushed at the
+    end and timed separately.
+    """
+    report = ReplayReport()
+    captured: list[str] = []
+    previous_sink = assistant.reply_sink
+    assistant.reply_sink = captured.append
+    started = time.perf_counter()
+    try:
+        for command in utterances:
+            captured.clear()
+            assistant.last_intent = None
+            before = time.perf_counter()
+            keep_going = assistant._handle(command)
+            elapsed = time.perf_counter() - before
+            intent = assistant.last_intent
+            name = intent.intent_type.value if intent is not None else "error"
+            report.latencies.setdefault(name, []).append(elapsed)
+            report.replies.append((command, list(captured)))
+            report.commands += 1
+            if not keep_going:
+                report.stopped_early = True
+                break
+    finally:
+        report.elapsed = time.perf_counter() - started
+        assistant.reply_sink = previous_sink
+    if assistant.persistence is not None:
+        before = time.perf_counter()
+        assistant.persistence.flush()
+        report.flush_elapsed = time.perf_counter() - before
+    return report
+
+
+def format_report(report: ReplayReport) -> str:
+    lines = [
+        f"Replayed {report.commands} commands in {report.elapsed:.3f}s "
+        f"({report.commands_per_second:.1f} commands/s); pending writes flushed in {report.flush_elapsed * 1000:.1f} ms",
+        f"{'intent':<24} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}",
+    ]
+    for name, stats in report.per_intent().items():
+        lines.append(
+            f"{name:<24} {int(stats['count']):>6} {stats['p50']:>8.2f} {stats['p95']:>8.2f} {stats['p99']:>8.2f}"
+        )
+    if report.stopped_early:
+        lines.append("Stopped at an exit command.")
+    return "\n".join(lines)
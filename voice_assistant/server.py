@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+from pathlib import Path
+import re
+import threading
+import time
+from typing import Callable
+
+from voice_assistant.assistant import VoiceAssistant, configure_intent_pipeline
+from voice_assistant.config import Settings
+from voice_assistant.logging_setup import setup_logging
+from voice_assistant.replay import isolated_settings
+
+_USER_ID = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+
+
+@dataclass
+class Session:
+    user_id: str
+    assistant: VoiceAssistant
+    last_used: float
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    commands: int = 0
+    closed: bool = False
+
+
+@dataclass
+class CommandResult:
+    user: str
+    intent: str
+    replies: list[str]
+    elapsed_ms: float
+
+    def as_dict(self) -> dict[str, object]:
+        return {"user": self.user, "intent": self.intent, "replies": self.replies, "ms": round(self.elapsed_ms, 3)}
+
+
+class SessionPool:
+    """Per-user assistants for a multi-user server, keyed by user id.
+
+    Each user gets a headless ``VoiceAssistant`` whose state lives in its own
+    directory under ``data_root``. Sessions are opened on first use, reused
+    while active, and closed when idle for ``idle_seconds`` or when more than
+    ``max_sessions`` are open (least recently used first). Commands for one
+    user run one at a time; different users run concurrently.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        data_root: str,
+        max_sessions: int = 256,
+        idle_seconds: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        # Sessions write synchronously: their saves are row-level deltas, and a
+        # write-behind thread per user would not scale with the pool.
+        self.settings = replace(settings, write_behind=False, threaded_tts=False)
+        self.data_root = Path(data_root)
+        self.max_sessions = max(1, max_sessions)
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+        self._opening: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.evicted = 0
+        configure_intent_pipeline(self.settings)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def handle(self, user_id: str, text: str) -> CommandResult:
+        """Run one text command for ``user_id`` and return the captured replies."""
+        if not _USER_ID.match(user_id or ""):
+            raise ValueError("user id must be 1-64 letters, digits, '.', '_' or '-'")
+        command = (text or "").strip().lower()
+        if not command:
+            raise ValueError("text must not be empty")
+        while True:
+            session = self._session(user_id)
+            with session.lock:
+                # An evicted session may be handed out just before it closes.
+                if session.closed:
+                    continue
+                assistant = session.assistant
+                replies: list[str] = []
+                assistant.reply_sink = replies.append
+                assistant.last_intent = None
+                started = time.perf_counter()
+                try:
+                    assistant._handle(command)
+                finally:
+                    assistant.reply_sink = None
+                elapsed = time.perf_counter() - started
+                session.commands += 1
+                session.last_used = self._clock()
+            intent = assistant.last_intent
+            return CommandResult(user_id, intent.intent_type.value if intent else "error", replies, elapsed * 1000)
+
+    def evict_idle(self) -> int:
+        """Close sessions unused for ``idle_seconds``; returns how many were closed."""
+        cutoff = self._clock() - self.idle_seconds
+        with self._lock:
+            idle = [session for session in self._sessions.values() if session.last_used < cutoff]
+            for session in idle:
+                del self._sessions[session.user_id]
+        for session in idle:
+            self._close(session)
+        return len(idle)
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            self._close(session)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "opened": self.opened,
+                "evicted": self.evicted,
+                "max_sessions": self.max_sessions,
+            }
+
+    def _session(self, user_id: str) -> Session:
+        with self._lock:
+            session = self._sessions.get(user_id)
+            if session is not None:
+                self._sessions.move_to_end(user_id)
+                return session
+            opening = self._opening.setdefault(user_id, threading.Lock())
+        # Opening loads the user's state from disk, so it happens outside the
+        # pool lock; the per-user lock stops two requests opening it twice.
+        with opening:
+            with self._lock:
+                session = self._sessions.get(user_id)
+                if session is not None:
+                    return session
+            assistant = VoiceAssistant(
+                settings=isolated_settings(self.settings, str(self.data_root / user_id)),
+                headless=True,
+                configure_intents=False,
+            )
+            session = Session(user_id, assistant, last_used=self._clock())
+            with self._lock:
+                self._sessions[user_id] = session
+                self._opening.pop(user_id, None)
+                self.opened += 1
+                overflow = []
+                while len(self._sessions) > self.max_sessions:
+                    overflow.append(self._sessions.popitem(last=False)[1])
+        for old in overflow:
+            self._close(old)
+        return session
+
+    def _close(self, session: Session) -> None:
+        with session.lock:
+            if session.closed:
+                return
+            session.closed = True
+            session.assistant.close()
+        with self._lock:
+            self.evicted += 1
+
+
+class _CommandHandler(BaseHTTPRequestHandler):
+    server: CommandServer
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/") == "/health":
+            self._reply(200, {"status": "ok", **self.server.pool.stats()})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def do_POST(self) -> None:
+        if self.path.rstrip("/") != "/command":
+            self._reply(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(body, dict):
+                raise ValueError("request body must be a JSON object")
+            result = self.server.pool.handle(str(body.get("user", "")), str(body.get("text", "")))
+        except (ValueError, json.JSONDecodeError) as exc:
+            self._reply(400, {"error": str(exc)})
+            return
+        except Exception:
+            # e.g. the user's data directory or database could not be opened.
+            logging.getLogger("voice_assistant").exception("Failed to handle command request")
+            self._reply(500, {"error": "internal error"})
+            return
+        self._reply(200, result.as_dict())
+
+    def _reply(self, status: int, payload: dict[str, object]) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: object) -> None:
+        logging.getLogger("voice_assistant").debug("server: " + format, *args)
+
+
+class CommandServer(ThreadingHTTPServer):
+    """JSON-over-HTTP front end for a ``SessionPool``.
+
+    ``POST /command`` with ``{"user": ..., "text": ...}`` returns the intent,
+    the replies and the handling time; ``GET /health`` returns pool counters.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, pool: SessionPool, host: str = "127.0.0.1", port: int = 8765) -> None:
+        super().__init__((host, port), _CommandHandler)
+        self.pool = pool
+        self._janitor = threading.Thread(target=self._evict_loop, name="nova-session-janitor", daemon=True)
+        self._stopped = threading.Event()
+        self._janitor.start()
+
+    def _evict_loop(self) -> None:
+        interval = max(1.0, min(60.0, self.pool.idle_seconds / 4))
+        while not self._stopped.wait(interval):
+            self.pool.evict_idle()
+
+    def server_close(self) -> None:
+        self._stopped.set()
+        super().server_close()
+        self.pool.close()
+
+
+def serve(settings: Settings, host: str | None = None, port: int | None = None) -> None:
+    Path(settings.log_file).parent.mkdir(parents=True, exist_ok=True)
+    setup_logging(settings.log_file, settings.log_level)
+    pool = SessionPool(
+        settings,
+        settings.server_data_dir,
+        max_sessions=settings.server_max_sessions,
+        idle_seconds=settings.server_idle_seconds,
+    )
+    server = CommandServer(pool, host or settings.server_host, settings.server_port if port is None else port)
+    address, bound_port = server.server_address[:2]
+    print(f"Serving text commands on http://{address}:{bound_port}/command")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 import json
 from pathlib import Path
 
@@ -52,16 +52,37 @@ def show_expenses_text(expenses: list[dict[str, object]]) -> str:
     return "Recent expenses: " + "; ".join(lines)
 
 
-def monthly_expense_report_text(expenses: list[dict[str, object]]) -> str:
-    current_month = datetime.now().strftime("%Y-%m")
-    monthly = [e for e in expenses if str(e.get("date", "")).startswith(current_month)]
-    if not monthly:
-        return "No expenses found for this month."
-    total = sum(float(e["amount"]) for e in monthly)
+def month_range(day: date | None = None) -> tuple[str, str]:
+    """First day of the month of ``day`` (default today) and of the next month, as YYYY-MM-DD."""
+    day = day or date.today()
+    start = day.replace(day=1)
+    end = date(start.year + 1, 1, 1) if start.month == 12 else start.replace(month=start.month + 1)
+    return start.isoformat(), end.isoformat()
+
+
+def summarize_expenses(
+    expenses: list[dict[str, object]], start: str, end: str, top: int = 3
+) -> tuple[float, list[tuple[str, float]]]:
+    """Total and top categories of the expenses dated in ``[start, end)``."""
+    total = 0.0
     by_category: dict[str, float] = {}
-    for item in monthly:
-        cat = str(item["category"])
-        by_category[cat] = by_category.get(cat, 0.0) + float(item["amount"])
-    top = sorted(by_category.items(), key=lambda x: x[1], reverse=True)[:3]
+    for item in expenses:
+        if start <= str(item.get("date", "")) < end:
+            amount = float(item["amount"])  # type: ignore[arg-type]
+            total += amount
+            cat = str(item["category"])
+            by_category[cat] = by_category.get(cat, 0.0) + amount
+    ranked = sorted(by_category.items(), key=lambda x: (-x[1], x[0]))[:top]
+    return total, ranked
+
+
+def expense_report_text(total: float, top: list[tuple[str, float]]) -> str:
+    if not top:
+        return "No expenses found for this month."
     top_text = ", ".join(f"{cat}: {amt:.2f}" for cat, amt in top)
     return f"This month you spent {total:.2f}. Top categories: {top_text}."
+
+
+def monthly_expense_report_text(expenses: list[dict[str, object]]) -> str:
+    start, end = month_range()
+    return expense_report_text(*summarize_expenses(expenses, start, end))
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+from datetime import datetime
 import json
 from pathlib import Path
 
+_SEARCH_REPLY = "History matches for "
+_SEARCH_COMMANDS = ("search history", "search my history", "find in history")
+
 
 def append_history(path: str, role: str, text: str) -> None:
-    line = json.dumps({"role": role, "text": text}, ensure_ascii=False)
+    line = json.dumps(
+        {"role": role, "text": text, "created_at": datetime.now().isoformat(timespec="seconds")},
+        ensure_ascii=False,
+    )
     with Path(path).open("a", encoding="utf-8") as f:
         f.write(line + "\n")
 
@@ -37,6 +44,35 @@ def clear_history(path: str) -> str:
         return "Could not clear history."
 
 
+def search_history_file(path: str, query: str, limit: int = 20) -> list[dict[str, str]]:
+    """Entries of a ``history.jsonl`` file whose text contains ``query``, newest first."""
+    needle = query.strip().lower()
+    found: list[dict[str, str]] = []
+    for item in reversed(read_history(path, limit=1_000_000)):
+        if needle in item["text"].lower():
+            found.append(item)
+            if len(found) >= limit:
+                break
+    return found
+
+
+def search_results_text(query: str, entries: list[dict[str, object]], limit: int = 5) -> str:
+    # Earlier searches and their answers would otherwise match themselves.
+    entries = [
+        item
+        for item in entries
+        if not str(item["text"]).startswith(_SEARCH_REPLY)
+        and not (item.get("role") == "user" and str(item["text"]).startswith(_SEARCH_COMMANDS))
+    ]
+    if not entries:
+        return f"Nothing in the history mentions {query}."
+    lines = []
+    for item in entries[:limit]:
+        when = str(item.get("created_at") or "")[:10]
+        lines.append(f"{item['role']}: {item['text']}" + (f" ({when})" if when else ""))
+    return f"{_SEARCH_REPLY}{query}: " + " | ".join(lines)
+
+
 def history_text(path: str, limit: int = 8) -> str:
     entries = read_history(path, limit=limit)
     if not entries:
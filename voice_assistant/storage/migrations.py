@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import sqlite3
+from typing import Sequence
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    statements: tuple[str, ...]
+
+
+# Append new migrations with the next version number; never edit or reorder
+# one that has shipped, since databases record only the last version applied.
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        1,
+        "hot-path indexes",
+        (
+            # iter_history(role=...) filters on role and pages by id.
+            "CREATE INDEX IF NOT EXISTS idx_history_role_id ON history(role, id)",
+            # Monthly expense reports filter on date and group by category.
+            "CREATE INDEX IF NOT EXISTS idx_expenses_date_category ON expenses(date, category, amount)",
+            # Upcoming-event lookups order by event_when.
+            "CREATE INDEX IF NOT EXISTS idx_events_when ON events(event_when)",
+        ),
+    ),
+    Migration(
+        2,
+        "list positions",
+        # Lists are stored in position order rather than id order, so an item
+        # put back by undo (or inserted mid-list) keeps its place on reload.
+        tuple(
+            statement
+            for table in ("reminders", "tasks", "expenses", "events")
+            for statement in (
+                f"ALTER TABLE {table} ADD COLUMN position REAL",
+                f"UPDATE {table} SET position = id",
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_position ON {table}(position, id)",
+            )
+        ),
+    ),
+)
+
+_VERSION_KEY = "schema_version"
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (_VERSION_KEY,)).fetchone()
+    return int(row[0]) if row else 0
+
+
+def migrate(conn: sqlite3.Connection, migrations: Sequence[Migration] = MIGRATIONS) -> list[int]:
+    """Apply the migrations newer than the database's version, oldest first.
+
+    Each migration runs in its own transaction together with the version
+    bump, so a failure leaves the database at the last complete version.
+    ``BEGIN IMMEDIATE`` makes a second process wait and then skip what the
+    first one already applied. Returns the versions applied.
+    """
+    ordered = sorted(migrations, key=lambda migration: migration.version)
+    if len({migration.version for migration in ordered}) != len(ordered):
+        raise ValueError("migration versions must be unique")
+    applied: list[int] = []
+    for migration in ordered:
+        if conn.in_transaction:
+            conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if schema_version(conn) >= migration.version:
+                conn.rollback()
+                continue
+            for statement in migration.statements:
+                conn.execute(statement)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta(key, value) VALUES(?, ?)",
+                (_VERSION_KEY, str(migration.version)),
+            )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        applied.append(migration.version)
+    return applied
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import gzip
+import json
+import logging
+from pathlib import Path
+import threading
+from typing import TYPE_CHECKING, Callable, Iterable
+
+if TYPE_CHECKING:
+    from voice_assistant.storage.sqlite_store import SQLiteStore
+
+_ARCHIVE_GLOB = "history-*.jsonl.gz"
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Which history rows leave the live store; 0 turns a limit off."""
+
+    max_age_days: int = 365
+    max_rows: int = 100_000
+    batch_size: int = 500
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_age_days > 0 or self.max_rows > 0
+
+    def cutoff(self, now: datetime | None = None) -> str | None:
+        if self.max_age_days <= 0:
+            return None
+        return ((now or datetime.now()) - timedelta(days=self.max_age_days)).isoformat(timespec="seconds")
+
+
+def archive_path(archive_dir: str, month: str) -> Path:
+    return Path(archive_dir) / f"history-{month}.jsonl.gz"
+
+
+def write_archive(archive_dir: str, rows: Iterable[dict[str, object]]) -> int:
+    """Append ``rows`` to one gzip file per month of ``created_at``.
+
+    Each call adds a gzip member to the end of the file, so earlier data is
+    never rewritten. Rows without a date go to ``history-undated.jsonl.gz``.
+    """
+    by_month: dict[str, list[str]] = {}
+    for row in rows:
+        created_at = str(row.get("created_at") or "")
+        month = created_at[:7] if len(created_at) >= 7 else "undated"
+        by_month.setdefault(month, []).append(json.dumps(row, ensure_ascii=False))
+    Path(archive_dir).mkdir(parents=True, exist_ok=True)
+    for month, lines in by_month.items():
+        with gzip.open(archive_path(archive_dir, month), "at", encoding="utf-8") as handle:
+            handle.write("\n".join(lines) + "\n")
+    return sum(len(lines) for lines in by_month.values())
+
+
+def search_archive(
+    archive_dir: str,
+    query: str = "",
+    role: str | None = None,
+    start: str | None = None,
+    end: str | None = None,
+    limit: int = 20,
+) -> list[dict[str, object]]:
+    """Archived entries whose text contains ``query``, newest first.
+
+    ``start``/``end`` (YYYY-MM or YYYY-MM-DD, end exclusive) skip whole month
+    files outside the range. Entries archived twice after an interrupted run
+    are returned once.
+    """
+    needle = query.strip().lower()
+    files = sorted(Path(archive_dir).glob(_ARCHIVE_GLOB), reverse=True)
+    found: list[dict[str, object]] = []
+    seen: set[object] = set()
+    for path in files:
+        month = path.name[len("history-") : -len(".jsonl.gz")]
+        if month != "undated" and ((start and month < start[:7]) or (end and month > end[:7])):
+            continue
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                lines = handle.read().splitlines()
+        except (OSError, EOFError):
+            logging.getLogger("voice_assistant").warning("Skipping unreadable history archive %s", path)
+            continue
+        for line in reversed(lines):
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(item, dict) or not isinstance(item.get("text"), str):
+                continue
+            created_at = str(item.get("created_at") or "")
+            if (start and created_at and created_at < start) or (end and created_at and created_at >= end):
+                continue
+            if role is not None and item.get("role") != role:
+                continue
+            if needle and needle not in item["text"].lower():
+                continue
+            key = item.get("id", (created_at, item.get("role"), item["text"]))
+            if key in seen:
+                continue
+            seen.add(key)
+            found.append(item)
+            if len(found) >= limit:
+                return found
+    return found
+
+
+def _expired_prefix(
+    rows: list[dict[str, object]], cutoff: str | None, keep_from_id: int | None
+) -> list[dict[str, object]]:
+    expired: list[dict[str, object]] = []
+    for row in rows:
+        over_count = keep_from_id is not None and int(row.get("id", 0)) < keep_from_id  # type: ignore[arg-type]
+        too_old = cutoff is not None and bool(row.get("created_at")) and str(row["created_at"]) < cutoff
+        if not (over_count or too_old):
+            break
+        expired.append(row)
+    return expired
+
+
+def archive_history_batch(
+    store: SQLiteStore, archive_dir: str, policy: RetentionPolicy, now: datetime | None = None
+) -> int:
+    """Move up to ``policy.batch_size`` of the oldest expired rows to the archive.
+
+    Rows are archived before they are deleted, so a crash in between can
+    only archive a row twice, never lose it. Returns the rows moved; 0 means
+    the live table is within the policy.
+    """
+    if not policy.enabled:
+        return 0
+    keep_from_id = store.history_keep_from_id(policy.max_rows) if policy.max_rows > 0 else None
+    expired = _expired_prefix(store.oldest_history(policy.batch_size), policy.cutoff(now), keep_from_id)
+    if not expired:
+        return 0
+    write_archive(archive_dir, expired)
+    store.delete_history_through(int(expired[-1]["id"]))  # type: ignore[arg-type]
+    return len(expired)
+
+
+def compact_history_file(path: str, archive_dir: str, policy: RetentionPolicy, now: datetime | None = None) -> int:
+    """Apply ``policy`` to a ``history.jsonl`` file: archive expired lines and rewrite the rest."""
+    file_path = Path(path)
+    if not policy.enabled or not file_path.exists():
+        return 0
+    lines = file_path.read_text(encoding="utf-8").splitlines()
+    rows: list[dict[str, object]] = []
+    for line in lines:
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(item, dict):
+            rows.append(item)
+    keep_from = len(rows) - policy.max_rows if policy.max_rows > 0 else 0
+    numbered = [{**row, "id": index} for index, row in enumerate(rows)]
+    expired = _expired_prefix(numbered, policy.cutoff(now), keep_from if keep_from > 0 else None)
+    if not expired:
+        return 0
+    write_archive(archive_dir, [{key: value for key, value in row.items() if key != "id"} for row in expired])
+    kept = rows[len(expired) :]
+    temp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+    temp_path.write_text("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in kept), encoding="utf-8")
+    temp_path.replace(file_path)
+    return len(expired)
+
+
+class RetentionRunner:
+    """Background thread that applies a retention step a batch at a time.
+
+    ``step`` moves one batch and returns how many rows it moved. The runner
+    repeats it with a short ``pause`` between batches, so the live store is
+    never locked for long, until a step returns 0. Then it sleeps for
+    ``interval`` seconds. ``close`` stops it.
+    """
+
+    def __init__(
+        self,
+        step: Callable[[], int],
+        interval: float = 3600.0,
+        pause: float = 0.05,
+        name: str = "nova-history-retention",
+    ) -> None:
+        self._step = step
+        self.interval = max(0.01, interval)
+        self.pause = pause
+        self.moved = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                moved = self._step()
+            except Exception:
+                logging.getLogger("voice_assistant").exception("History retention failed")
+                moved = 0
+            self.moved += moved
+            self._stopped.wait(self.pause if moved else self.interval)
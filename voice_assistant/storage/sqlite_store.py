@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 import json
 from pathlib import Path
 import sqlite3
+import threading
+from typing import Any, Callable, Iterable, Iterator, Mapping
+
+from voice_assistant.storage.migrations import migrate, schema_version
+from voice_assistant.storage.tracking import RowHandle
 
 
 @dataclass
@@ -19,18 +25,112 @@ class MigrationSources:
     events_file: str
 
 
+def _reminder_values(text: object) -> tuple[object, ...]:
+    return (str(text),)
+
+
+def _task_values(task: dict[str, object]) -> tuple[object, ...]:
+    return (str(task.get("text", "")), 1 if bool(task.get("done")) else 0)
+
+
+def _expense_values(item: dict[str, object]) -> tuple[object, ...]:
+    return (
+        float(item.get("amount", 0.0)),  # type: ignore[arg-type]
+        str(item.get("category", "")),
+        str(item.get("date", datetime.now().strftime("%Y-%m-%d"))),
+    )
+
+
+def _event_values(item: dict[str, str]) -> tuple[object, ...]:
+    return (str(item.get("title", "")), str(item.get("when", "")), str(item.get("source", "manual")))
+
+
+RowChanges = Mapping[RowHandle, Any]
+
+
+def _next_position(table: str) -> str:
+    return f"(SELECT COALESCE(MAX(position), 0) + 1 FROM {table})"
+
+
+_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
 class SQLiteStore:
-    def __init__(self, db_path: str, sources: MigrationSources) -> None:
+    """State of the assistant in one SQLite file.
+
+    The database runs in WAL mode, so readers such as the dashboard do not
+    wait for the assistant's writes. With ``persistent_connections`` each
+    thread keeps one open connection, along with its page cache and prepared
+    statements, until ``close``; otherwise every call opens and closes its own.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        sources: MigrationSources,
+        persistent_connections: bool = True,
+        synchronous: str = "NORMAL",
+        cache_size_kb: int = 8192,
+        cached_statements: int = 128,
+    ) -> None:
+        if synchronous.upper() not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"synchronous must be one of {', '.join(_SYNCHRONOUS_MODES)}")
         self.db_path = db_path
         self.sources = sources
+        self.persistent_connections = persistent_connections
+        self.synchronous = synchronous.upper()
+        self.cache_size_kb = cache_size_kb
+        self.cached_statements = cached_statements
+        self._connections: dict[int, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
         self._init_db()
         self._migrate_from_files_if_needed()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,
+        )
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute(f"PRAGMA cache_size={-abs(self.cache_size_kb)}")
         return conn
 
+    def _connection(self) -> sqlite3.Connection:
+        conn = self._connections.get(threading.get_ident())
+        if conn is not None:
+            return conn
+        conn = self._open()
+        with self._connections_lock:
+            # Connections of threads that have exited would otherwise stay
+            # open until close(), e.g. one per request thread of the server.
+            alive = {thread.ident for thread in threading.enumerate()}
+            for ident in [ident for ident in self._connections if ident not in alive]:
+                self._connections.pop(ident).close()
+            self._connections[threading.get_ident()] = conn
+        return conn
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connection for one unit of work; commits on success, rolls back on error."""
+        conn = self._connection() if self.persistent_connections else self._open()
+        try:
+            with conn:
+                yield conn
+        finally:
+            if not self.persistent_connections:
+                conn.close()
+
+    def close(self) -> None:
+        """Close every open connection. The store reconnects if used again."""
+        with self._connections_lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+
     def _init_db(self) -> None:
         with self._connect() as conn:
             conn.executescript(
@@ -82,8 +182,18 @@ class SQLiteStore:
                     key TEXT PRIMARY KEY,
                     value TEXT NOT NULL
                 );
+                CREATE TABLE IF NOT EXISTS undo_journal (
+                    position INTEGER PRIMARY KEY,
+                    stack TEXT NOT NULL,
+                    entry TEXT NOT NULL
+                );
                 """
             )
+            migrate(conn)
+
+    def schema_version(self) -> int:
+        with self._connect() as conn:
+            return schema_version(conn)
 
     def _get_meta(self, key: str) -> str | None:
         with self._connect() as conn:
@@ -207,48 +317,238 @@ class SQLiteStore:
                 [(k, v) for k, v in profile.items()],
             )
 
-    def load_reminders(self) -> list[str]:
+    def _apply_row_changes(
+        self,
+        table: str,
+        columns: tuple[str, ...],
+        encode: Callable[[Any], tuple[object, ...]],
+        changes: RowChanges,
+    ) -> None:
+        """Write only the rows in ``changes``: None deletes, a handle without an id inserts.
+
+        Each written row also stores its handle's position, which orders the table.
+        """
+        columns = (*columns, "position")
+        insert_sql = f"INSERT INTO {table}({', '.join(columns)}) VALUES({', '.join('?' for _ in columns)})"
+        update_sql = f"UPDATE {table} SET {', '.join(f'{column} = ?' for column in columns)} WHERE id = ?"
+        inserted: list[tuple[RowHandle, int]] = []
+        with self._connect() as conn:
+            for handle, value in changes.items():
+                if value is None:
+                    if handle.id is not None:
+                        conn.execute(f"DELETE FROM {table} WHERE id = ?", (handle.id,))
+                elif handle.id is None:
+                    cursor = conn.execute(insert_sql, (*encode(value), handle.position))
+                    inserted.append((handle, int(cursor.lastrowid or 0)))
+                else:
+                    conn.execute(update_sql, (*encode(value), handle.position, handle.id))
+        # Ids are handed out only once the transaction has committed.
+        for handle, row_id in inserted:
+            handle.id = row_id
+
+    def _insert_row(self, table: str, columns: tuple[str, ...], values: tuple[object, ...]) -> int:
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"INSERT INTO {table}({', '.join(columns)}, position) "
+                f"VALUES({', '.join('?' for _ in columns)}, {_next_position(table)})",
+                values,
+            )
+        return int(cursor.lastrowid or 0)
+
+    def _update_row(self, table: str, row_id: int, values: Mapping[str, object]) -> bool:
+        if not values:
+            return False
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"UPDATE {table} SET {', '.join(f'{column} = ?' for column in values)} WHERE id = ?",
+                (*values.values(), row_id),
+            )
+        return cursor.rowcount > 0
+
+    def _delete_row(self, table: str, row_id: int) -> bool:
+        with self._connect() as conn:
+            cursor = conn.execute(f"DELETE FROM {table} WHERE id = ?", (row_id,))
+        return cursor.rowcount > 0
+
+    def _upsert_rows(
+        self,
+        table: str,
+        columns: tuple[str, ...],
+        encode: Callable[[Any], tuple[object, ...]],
+        rows: Iterable[tuple[int | None, Any]],
+    ) -> list[int]:
+        """Insert rows without an id and overwrite rows with one, in one transaction; returns the ids.
+
+        New rows go to the end of the list; overwritten rows keep their position.
+        """
+        sql = (
+            f"INSERT INTO {table}(id, {', '.join(columns)}, position) "
+            f"VALUES(?, {', '.join('?' for _ in columns)}, {_next_position(table)}) "
+            f"ON CONFLICT(id) DO UPDATE SET {', '.join(f'{column} = excluded.{column}' for column in columns)}"
+        )
+        ids: list[int] = []
+        with self._connect() as conn:
+            for row_id, value in rows:
+                cursor = conn.execute(sql, (row_id, *encode(value)))
+                ids.append(int(row_id) if row_id is not None else int(cursor.lastrowid or 0))
+        return ids
+
+    def _row_at(self, table: str, columns: tuple[str, ...], position: int) -> sqlite3.Row | None:
+        """Row number ``position`` (1-based, in list order) without loading the rest of the table."""
+        if position < 1:
+            return None
         with self._connect() as conn:
-            rows = conn.execute("SELECT text FROM reminders ORDER BY id").fetchall()
-        return [str(row["text"]) for row in rows]
+            return conn.execute(
+                f"SELECT id, {', '.join(columns)} FROM {table} ORDER BY position, id LIMIT 1 OFFSET ?",
+                (position - 1,),
+            ).fetchone()
+
+    def _apply_key_changes(self, table: str, key_column: str, value_column: str, changes: Mapping[str, Any]) -> None:
+        with self._connect() as conn:
+            conn.executemany(
+                f"DELETE FROM {table} WHERE {key_column} = ?",
+                [(key,) for key, value in changes.items() if value is None],
+            )
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table}({key_column}, {value_column}) VALUES(?, ?)",
+                [(key, value) for key, value in changes.items() if value is not None],
+            )
+
+    def apply_profile_changes(self, changes: Mapping[str, str | None]) -> None:
+        self._apply_key_changes("profile", "key", "value", changes)
+
+    def reminder_rows(self) -> list[tuple[int, float, str]]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT id, position, text FROM reminders ORDER BY position, id").fetchall()
+        return [(int(row["id"]), float(row["position"]), str(row["text"])) for row in rows]
+
+    def load_reminders(self) -> list[str]:
+        return [text for _, _, text in self.reminder_rows()]
 
     def save_reminders(self, reminders: list[str]) -> None:
         with self._connect() as conn:
             conn.execute("DELETE FROM reminders")
-            conn.executemany("INSERT INTO reminders(text) VALUES(?)", [(r,) for r in reminders])
+            conn.executemany(
+                "INSERT INTO reminders(text, position) VALUES(?, ?)",
+                [(*_reminder_values(r), idx + 1) for idx, r in enumerate(reminders)],
+            )
 
-    def load_tasks(self) -> list[dict[str, object]]:
+    def apply_reminder_changes(self, changes: RowChanges) -> None:
+        self._apply_row_changes("reminders", ("text",), _reminder_values, changes)
+
+    def reminder_at(self, position: int) -> tuple[int, str] | None:
+        row = self._row_at("reminders", ("text",), position)
+        return (int(row["id"]), str(row["text"])) if row else None
+
+    def insert_reminder(self, text: str) -> int:
+        return self._insert_row("reminders", ("text",), _reminder_values(text))
+
+    def update_reminder(self, reminder_id: int, text: str) -> bool:
+        return self._update_row("reminders", reminder_id, {"text": str(text)})
+
+    def delete_reminder(self, reminder_id: int) -> bool:
+        return self._delete_row("reminders", reminder_id)
+
+    def upsert_reminders(self, rows: Iterable[tuple[int | None, str]]) -> list[int]:
+        return self._upsert_rows("reminders", ("text",), _reminder_values, rows)
+
+    def task_rows(self) -> list[tuple[int, float, dict[str, object]]]:
         with self._connect() as conn:
-            rows = conn.execute("SELECT text, done FROM tasks ORDER BY id").fetchall()
-        return [{"text": str(row["text"]), "done": bool(row["done"])} for row in rows]
+            rows = conn.execute("SELECT id, position, text, done FROM tasks ORDER BY position, id").fetchall()
+        return [
+            (int(row["id"]), float(row["position"]), {"text": str(row["text"]), "done": bool(row["done"])})
+            for row in rows
+        ]
+
+    def load_tasks(self) -> list[dict[str, object]]:
+        return [task for _, _, task in self.task_rows()]
 
     def save_tasks(self, tasks: list[dict[str, object]]) -> None:
         with self._connect() as conn:
             conn.execute("DELETE FROM tasks")
             conn.executemany(
-                "INSERT INTO tasks(text, done) VALUES(?, ?)",
-                [(str(task.get("text", "")), 1 if bool(task.get("done")) else 0) for task in tasks],
+                "INSERT INTO tasks(text, done, position) VALUES(?, ?, ?)",
+                [(*_task_values(task), idx + 1) for idx, task in enumerate(tasks)],
             )
 
-    def load_expenses(self) -> list[dict[str, object]]:
+    def apply_task_changes(self, changes: RowChanges) -> None:
+        self._apply_row_changes("tasks", ("text", "done"), _task_values, changes)
+
+    def task_at(self, position: int) -> tuple[int, dict[str, object]] | None:
+        row = self._row_at("tasks", ("text", "done"), position)
+        return (int(row["id"]), {"text": str(row["text"]), "done": bool(row["done"])}) if row else None
+
+    def insert_task(self, task: dict[str, object]) -> int:
+        return self._insert_row("tasks", ("text", "done"), _task_values(task))
+
+    def update_task(self, task_id: int, *, text: str | None = None, done: bool | None = None) -> bool:
+        """Change only the given fields of one task; False if there is no such task."""
+        values: dict[str, object] = {}
+        if text is not None:
+            values["text"] = str(text)
+        if done is not None:
+            values["done"] = 1 if done else 0
+        return self._update_row("tasks", task_id, values)
+
+    def delete_task(self, task_id: int) -> bool:
+        return self._delete_row("tasks", task_id)
+
+    def upsert_tasks(self, rows: Iterable[tuple[int | None, dict[str, object]]]) -> list[int]:
+        return self._upsert_rows("tasks", ("text", "done"), _task_values, rows)
+
+    def expense_rows(self) -> list[tuple[int, float, dict[str, object]]]:
         with self._connect() as conn:
-            rows = conn.execute("SELECT amount, category, date FROM expenses ORDER BY id").fetchall()
+            rows = conn.execute(
+                "SELECT id, position, amount, category, date FROM expenses ORDER BY position, id"
+            ).fetchall()
         return [
-            {"amount": float(row["amount"]), "category": str(row["category"]), "date": str(row["date"])}
+            (
+                int(row["id"]),
+                float(row["position"]),
+                {"amount": float(row["amount"]), "category": str(row["category"]), "date": str(row["date"])},
+            )
             for row in rows
         ]
 
+    def load_expenses(self) -> list[dict[str, object]]:
+        return [item for _, _, item in self.expense_rows()]
+
     def save_expenses(self, expenses: list[dict[str, object]]) -> None:
         with self._connect() as conn:
             conn.execute("DELETE FROM expenses")
             conn.executemany(
-                "INSERT INTO expenses(amount, category, date) VALUES(?, ?, ?)",
-                [
-                    (float(item.get("amount", 0.0)), str(item.get("category", "")), str(item.get("date", datetime.now().strftime("%Y-%m-%d"))))
-                    for item in expenses
-                ],
+                "INSERT INTO expenses(amount, category, date, position) VALUES(?, ?, ?, ?)",
+                [(*_expense_values(item), idx + 1) for idx, item in enumerate(expenses)],
             )
 
+    def apply_expense_changes(self, changes: RowChanges) -> None:
+        self._apply_row_changes("expenses", ("amount", "category", "date"), _expense_values, changes)
+
+    def expense_total(self, start: str, end: str) -> float:
+        """Sum of the expenses dated in ``[start, end)`` (YYYY-MM-DD)."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(amount), 0) AS total FROM expenses WHERE date >= ? AND date < ?",
+                (start, end),
+            ).fetchone()
+        return float(row["total"])
+
+    def top_expense_categories(self, start: str, end: str, limit: int = 3) -> list[tuple[str, float]]:
+        """Categories with the largest spend in ``[start, end)``, largest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT category, SUM(amount) AS total FROM expenses WHERE date >= ? AND date < ? "
+                "GROUP BY category ORDER BY total DESC, category LIMIT ?",
+                (start, end, limit),
+            ).fetchall()
+        return [(str(row["category"]), float(row["total"])) for row in rows]
+
+    def insert_expense(self, item: dict[str, object]) -> int:
+        return self._insert_row("expenses", ("amount", "category", "date"), _expense_values(item))
+
+    def delete_expense(self, expense_id: int) -> bool:
+        return self._delete_row("expenses", expense_id)
+
     def load_habits(self) -> dict[str, int]:
         with self._connect() as conn:
             rows = conn.execute("SELECT name, streak FROM habits ORDER BY name").fetchall()
@@ -262,6 +562,9 @@ class SQLiteStore:
                 [(name, int(streak)) for name, streak in habits.items()],
             )
 
+    def apply_habit_changes(self, changes: Mapping[str, int | None]) -> None:
+        self._apply_key_changes("habits", "name", "streak", changes)
+
     def append_history(self, role: str, text: str) -> None:
         with self._connect() as conn:
             conn.execute(
@@ -290,6 +593,62 @@ class SQLiteStore:
         rows = list(reversed(rows))
         return [{"role": str(row["role"]), "text": str(row["text"])} for row in rows]
 
+    def iter_history(self, role: str | None = None, batch_size: int = 1000) -> Iterator[dict[str, str]]:
+        """Stream history rows oldest first, reading ``batch_size`` rows per query."""
+        last_id = 0
+        while True:
+            with self._connect() as conn:
+                if role is None:
+                    rows = conn.execute(
+                        "SELECT id, role, text, created_at FROM history WHERE id > ? ORDER BY id LIMIT ?",
+                        (last_id, batch_size),
+                    ).fetchall()
+                else:
+                    rows = conn.execute(
+                        "SELECT id, role, text, created_at FROM history WHERE id > ? AND role = ? ORDER BY id LIMIT ?",
+                        (last_id, role, batch_size),
+                    ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield {"role": str(row["role"]), "text": str(row["text"]), "created_at": str(row["created_at"])}
+            last_id = int(rows[-1]["id"])
+
+    def oldest_history(self, limit: int) -> list[dict[str, object]]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, role, text, created_at FROM history ORDER BY id LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [
+            {"id": int(row["id"]), "role": str(row["role"]), "text": str(row["text"]), "created_at": str(row["created_at"])}
+            for row in rows
+        ]
+
+    def history_keep_from_id(self, keep_rows: int) -> int | None:
+        """Rows with a smaller id than this fall outside the newest ``keep_rows``; None if there are none."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT id FROM history ORDER BY id DESC LIMIT 1 OFFSET ?",
+                (keep_rows,),
+            ).fetchone()
+        return int(row["id"]) + 1 if row else None
+
+    def delete_history_through(self, last_id: int) -> int:
+        with self._connect() as conn:
+            cursor = conn.execute("DELETE FROM history WHERE id <= ?", (last_id,))
+        return cursor.rowcount
+
+    def search_history(self, query: str, limit: int = 20) -> list[dict[str, str]]:
+        """Live history entries whose text contains ``query``, newest first."""
+        pattern = "%" + query.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT role, text, created_at FROM history WHERE text LIKE ? ESCAPE '\\' ORDER BY id DESC LIMIT ?",
+                (pattern, limit),
+            ).fetchall()
+        return [{"role": str(row["role"]), "text": str(row["text"]), "created_at": str(row["created_at"])} for row in rows]
+
     def clear_history(self) -> str:
         with self._connect() as conn:
             conn.execute("DELETE FROM history")
@@ -308,21 +667,97 @@ class SQLiteStore:
                 [(name, number) for name, number in contacts.items()],
             )
 
-    def load_events(self) -> list[dict[str, str]]:
+    def apply_contact_changes(self, changes: Mapping[str, str | None]) -> None:
+        self._apply_key_changes("contacts", "name", "number", changes)
+
+    def load_undo_journal(self) -> dict[str, list[object]]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT stack, entry FROM undo_journal ORDER BY position").fetchall()
+        journal: dict[str, list[object]] = {"undo": [], "redo": []}
+        for row in rows:
+            try:
+                journal.setdefault(str(row["stack"]), []).append(json.loads(row["entry"]))
+            except json.JSONDecodeError:
+                continue
+        return journal
+
+    def save_undo_journal(self, journal: dict[str, list[object]]) -> None:
+        """Replace the stored journal; it is bounded by the undo depth, so this stays small."""
+        rows = [
+            (stack, json.dumps(entry))
+            for stack in ("undo", "redo")
+            for entry in journal.get(stack, [])
+        ]
+        with self._connect() as conn:
+            conn.execute("DELETE FROM undo_journal")
+            conn.executemany("INSERT INTO undo_journal(stack, entry) VALUES(?, ?)", rows)
+
+    def apply_undo_journal_changes(self, changes: Mapping[int, tuple[Any, ...]]) -> None:
+        """Replay ``UndoJournal.drain_changes`` operations, so each command writes only its own entry.
+
+        Undo and redo move the newest row of one stack to the top of the other
+        without rewriting the entry.
+        """
+        newest = "SELECT MAX(position) FROM undo_journal WHERE stack = ?"
         with self._connect() as conn:
-            rows = conn.execute("SELECT title, event_when, source FROM events ORDER BY event_when").fetchall()
+            for change in changes.values():
+                op = change[0]
+                if op == "push":
+                    conn.execute(
+                        "INSERT INTO undo_journal(position, stack, entry) "
+                        "VALUES((SELECT COALESCE(MAX(position), 0) + 1 FROM undo_journal), ?, ?)",
+                        (change[1], json.dumps(change[2])),
+                    )
+                elif op == "move":
+                    conn.execute(
+                        "UPDATE undo_journal SET stack = ?, position = (SELECT MAX(position) + 1 FROM undo_journal) "
+                        f"WHERE position = ({newest})",
+                        (change[2], change[1]),
+                    )
+                elif op == "drop_oldest":
+                    conn.execute(
+                        "DELETE FROM undo_journal WHERE position = "
+                        "(SELECT MIN(position) FROM undo_journal WHERE stack = ?)",
+                        (change[1],),
+                    )
+                elif op == "clear":
+                    if change[1] is None:
+                        conn.execute("DELETE FROM undo_journal")
+                    else:
+                        conn.execute("DELETE FROM undo_journal WHERE stack = ?", (change[1],))
+                else:
+                    raise ValueError(f"Unknown journal change: {op}")
+
+    def event_rows(self) -> list[tuple[int, float, dict[str, str]]]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, position, title, event_when, source FROM events ORDER BY position, id"
+            ).fetchall()
         return [
-            {"title": str(row["title"]), "when": str(row["event_when"]), "source": str(row["source"])}
+            (
+                int(row["id"]),
+                float(row["position"]),
+                {"title": str(row["title"]), "when": str(row["event_when"]), "source": str(row["source"])},
+            )
             for row in rows
         ]
 
+    def load_events(self) -> list[dict[str, str]]:
+        return [event for _, _, event in self.event_rows()]
+
     def save_events(self, events: list[dict[str, str]]) -> None:
         with self._connect() as conn:
             conn.execute("DELETE FROM events")
             conn.executemany(
-                "INSERT INTO events(title, event_when, source) VALUES(?, ?, ?)",
-                [
-                    (str(item.get("title", "")), str(item.get("when", "")), str(item.get("source", "manual")))
-                    for item in events
-                ],
+                "INSERT INTO events(title, event_when, source, position) VALUES(?, ?, ?, ?)",
+                [(*_event_values(item), idx + 1) for idx, item in enumerate(events)],
             )
+
+    def apply_event_changes(self, changes: RowChanges) -> None:
+        self._apply_row_changes("events", ("title", "event_when", "source"), _event_values, changes)
+
+    def insert_event(self, item: dict[str, str]) -> int:
+        return self._insert_row("events", ("title", "event_when", "source"), _event_values(item))
+
+    def delete_event(self, event_id: int) -> bool:
+        return self._delete_row("events", event_id)
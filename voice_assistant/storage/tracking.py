@@ -0,0 +1,457 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Iterable
+
+
+class RowHandle:
+    """Identity of one list item in its table; ``id`` is None until the row is inserted.
+
+    ``position`` is the item's sort key: positions increase along the list, and
+    storage orders rows by it, so the list comes back in the same order.
+    """
+
+    __slots__ = ("id", "position")
+
+    def __init__(self, row_id: int | None = None, position: float | None = None) -> None:
+        self.id = row_id
+        self.position = position
+
+    def __repr__(self) -> str:
+        return f"RowHandle({self.id!r}, {self.position!r})"
+
+
+def _spread(low: float | None, high: float | None, count: int) -> list[float] | None:
+    """``count`` increasing positions strictly between ``low`` and ``high`` (None is open-ended)."""
+    if low is None and high is None:
+        return [float(idx + 1) for idx in range(count)]
+    if high is None:
+        return [low + idx + 1 for idx in range(count)]  # type: ignore[operator]
+    if low is None:
+        return [high - count + idx for idx in range(count)]
+    step = (high - low) / (count + 1)
+    keys = [low + step * (idx + 1) for idx in range(count)]
+    # Out of float precision between these neighbours: the caller renumbers.
+    if step <= 0 or not all(low < key < high for key in keys) or len(set(keys)) < count:
+        return None
+    return keys
+
+
+class TrackedRow(dict):
+    """Dict item of a ``TrackedList`` that reports in-place edits to its owner."""
+
+    __slots__ = ("_owner", "_handle")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._owner: TrackedList | None = None
+        self._handle: RowHandle | None = None
+
+    def _changed(self) -> None:
+        if self._owner is not None and self._handle is not None:
+            self._owner._mark(self._handle, self)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other: Any) -> TrackedRow:
+        super().__ior__(other)
+        self._changed()
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    # Copies are plain dicts, detached from the list.
+    def copy(self) -> dict:
+        return dict(self)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (dict(self),))
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict:
+        from copy import deepcopy
+
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+
+class TrackedList(list):
+    """List that records which items were added, changed or removed.
+
+    Every item carries a ``RowHandle``; ``drain_changes`` returns the handles
+    touched since the previous drain, each with a snapshot of its current value
+    or None when it was removed. Dict items are stored as ``TrackedRow`` so
+    in-place edits such as ``tasks[0]["done"] = True`` are recorded too.
+
+    Handles also carry the item's position. Appends and inserts take a
+    position between their neighbours, so only the new row is written. When
+    the order changes wholesale (sort, reverse, or no room left between two
+    neighbours) every item is renumbered and recorded as changed.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Any] = (),
+        ids: Iterable[int | None] | None = None,
+        positions: Iterable[float] | None = None,
+    ) -> None:
+        super().__init__()
+        self._handles: list[RowHandle] = []
+        self._changes: dict[RowHandle, Any] = {}
+        values = list(items)
+        row_ids = list(ids) if ids is not None else [None] * len(values)
+        row_positions = list(positions) if positions is not None else [float(idx + 1) for idx in range(len(values))]
+        if not len(row_ids) == len(row_positions) == len(values):
+            raise ValueError("ids and positions must match items")
+        for value, row_id, position in zip(values, row_ids, row_positions):
+            handle = RowHandle(row_id, position)
+            value = self._adopt(value, handle)
+            list.append(self, value)
+            self._handles.append(handle)
+            if row_id is None:
+                self._changes[handle] = value
+        self._settle_positions()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[int, float, Any]]) -> TrackedList:
+        """Build a clean list from ``(row_id, position, value)`` rows read from storage, in order."""
+        triples = list(rows)
+        return cls(
+            (value for _, _, value in triples),
+            (row_id for row_id, _, _ in triples),
+            (position for _, position, _ in triples),
+        )
+
+    def handles(self) -> list[RowHandle]:
+        return list(self._handles)
+
+    def has_changes(self) -> bool:
+        return bool(self._changes)
+
+    def drain_changes(self) -> dict[RowHandle, Any]:
+        """Return and forget pending changes; values are copies, None means removed."""
+        changes = {
+            handle: (None if value is None else dict(value) if isinstance(value, dict) else value)
+            for handle, value in self._changes.items()
+        }
+        self._changes = {}
+        return changes
+
+    def _adopt(self, value: Any, handle: RowHandle) -> Any:
+        if isinstance(value, dict):
+            if not isinstance(value, TrackedRow) or value._owner not in (None, self):
+                value = TrackedRow(value)
+            value._owner = self
+            value._handle = handle
+        return value
+
+    def _mark(self, handle: RowHandle, value: Any) -> None:
+        self._changes.pop(handle, None)
+        self._changes[handle] = value
+
+    def _release(self, values: Iterable[Any], handles: Iterable[RowHandle]) -> None:
+        for value, handle in zip(values, handles):
+            if isinstance(value, TrackedRow) and value._owner is self:
+                value._owner = None
+            # Recorded even for rows never written: an insert may already be
+            # queued, and the store skips removals of rows without an id.
+            self._mark(handle, None)
+
+    def _new(self, value: Any, position: float | None) -> tuple[Any, RowHandle]:
+        handle = RowHandle(position=position)
+        value = self._adopt(value, handle)
+        self._mark(handle, value)
+        return value, handle
+
+    def _renumber(self) -> None:
+        for idx, handle in enumerate(self._handles):
+            if handle.position != idx + 1:
+                handle.position = float(idx + 1)
+                self._mark(handle, list.__getitem__(self, idx))
+
+    def _settle_positions(self, start: int = 0, stop: int | None = None) -> None:
+        """Give handles without a position one between their neighbours, or renumber if the order is broken.
+
+        Only ``handles[start:stop]`` is walked, so a splice costs its own
+        length rather than the list's; the handles around it are in order.
+        """
+        handles = self._handles
+        stop = len(handles) if stop is None else stop
+        previous = handles[start - 1].position if start > 0 else None
+        idx = start
+        while idx < stop:
+            position = handles[idx].position
+            if position is None:
+                end = idx
+                while end < stop and handles[end].position is None:
+                    end += 1
+                keys = _spread(previous, handles[end].position if end < len(handles) else None, end - idx)
+                if keys is None:
+                    self._renumber()
+                    return
+                for handle, key in zip(handles[idx:end], keys):
+                    handle.position = key
+                previous = keys[-1]
+                idx = end
+                continue
+            if previous is not None and position <= previous:
+                self._renumber()
+                return
+            previous = position
+            idx += 1
+        following = handles[stop].position if stop < len(handles) else None
+        if previous is not None and following is not None and following <= previous:
+            self._renumber()
+
+    def append(self, value: Any) -> None:
+        last = self._handles[-1].position if self._handles else None
+        value, handle = self._new(value, (last + 1) if last is not None else 1.0)
+        list.append(self, value)
+        self._handles.append(handle)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        for value in list(values):
+            self.append(value)
+
+    def __iadd__(self, values: Iterable[Any]) -> TrackedList:  # type: ignore[override]
+        self.extend(values)
+        return self
+
+    def __imul__(self, count: int) -> TrackedList:  # type: ignore[override]
+        values = [dict(value) if isinstance(value, dict) else value for value in self]
+        if count <= 0:
+            self.clear()
+        else:
+            for _ in range(count - 1):
+                self.extend(values)
+        return self
+
+    def insert(self, index: int, value: Any) -> None:
+        size = len(self)
+        index = max(0, min(index + size if index < 0 else index, size))
+        low = self._handles[index - 1].position if index > 0 else None
+        high = self._handles[index].position if index < size else None
+        keys = _spread(low, high, 1)
+        value, handle = self._new(value, keys[0] if keys else None)
+        list.insert(self, index, value)
+        self._handles.insert(index, handle)
+        if keys is None:
+            self._renumber()
+
+    def pop(self, index: int = -1) -> Any:
+        value = list.pop(self, index)
+        handle = self._handles.pop(index)
+        self._release([value], [handle])
+        return value
+
+    def remove(self, value: Any) -> None:
+        index = self.index(value)
+        del self[index]
+
+    def clear(self) -> None:
+        self._release(list(self), self._handles)
+        list.clear(self)
+        self._handles = []
+
+    def __delitem__(self, index: int | slice) -> None:
+        values = list.__getitem__(self, index)
+        handles = self._handles[index]
+        list.__delitem__(self, index)
+        del self._handles[index]
+        if isinstance(index, slice):
+            self._release(values, handles)
+        else:
+            self._release([values], [handles])
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:  # type: ignore[override]
+        if not isinstance(index, slice):
+            old_value = list.__getitem__(self, index)
+            if value is old_value:
+                return
+            handle = self._handles[index]
+            if isinstance(old_value, TrackedRow) and old_value._owner is self:
+                old_value._owner = None
+            value = self._adopt(value, handle)
+            list.__setitem__(self, index, value)
+            self._mark(handle, value)
+            return
+        start, _, step = index.indices(len(self))
+        old_values = list.__getitem__(self, index)
+        old_handles = self._handles[index]
+        # Items that stay in the list keep their handles, so filtering the
+        # list in place only records the removed ones.
+        kept = {id(item): (item, handle) for item, handle in zip(old_values, old_handles)}
+        new_values: list[Any] = []
+        new_handles: list[RowHandle] = []
+        for item in list(value):
+            reused = kept.pop(id(item), None)
+            if reused is None:
+                handle = RowHandle()
+                new_values.append(self._adopt(item, handle))
+                new_handles.append(handle)
+            else:
+                new_values.append(item)
+                new_handles.append(reused[1])
+        list.__setitem__(self, index, new_values)
+        self._handles[index] = new_handles
+        for item, handle in zip(new_values, new_handles):
+            if handle.id is None and handle not in self._changes:
+                self._mark(handle, item)
+        dropped = list(kept.values())
+        self._release([item for item, _ in dropped], [handle for _, handle in dropped])
+        if step == 1:
+            self._settle_positions(start, start + len(new_handles))
+        else:
+            self._settle_positions()
+
+    def sort(self, *, key: Any = None, reverse: bool = False) -> None:
+        order = sorted(
+            range(len(self)),
+            key=(lambda idx: key(list.__getitem__(self, idx))) if key else (lambda idx: list.__getitem__(self, idx)),
+            reverse=reverse,
+        )
+        values = [list.__getitem__(self, idx) for idx in order]
+        self._handles = [self._handles[idx] for idx in order]
+        list.__setitem__(self, slice(None), values)
+        self._renumber()
+
+    def reverse(self) -> None:
+        list.reverse(self)
+        self._handles.reverse()
+        self._renumber()
+
+    def __copy__(self) -> list:
+        return [dict(value) if isinstance(value, dict) else value for value in self]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (list, (self.__copy__(),))
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list:
+        from copy import deepcopy
+
+        return [deepcopy(value, memo) for value in self]
+
+
+class TrackedDict(dict):
+    """Dict that records which keys were set or deleted since the last drain."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._changes: dict[Any, Any] = {}
+
+    def has_changes(self) -> bool:
+        return bool(self._changes)
+
+    def drain_changes(self) -> dict[Any, Any]:
+        """Return and forget pending changes: key -> new value, or None when deleted."""
+        changes, self._changes = self._changes, {}
+        return changes
+
+    def _mark(self, key: Any) -> None:
+        self._changes.pop(key, None)
+        self._changes[key] = dict.get(self, key) if key in self else None
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._mark(key)
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._mark(key)
+
+    def __ior__(self, other: Any) -> TrackedDict:
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        if key not in self:
+            return super().pop(key, *default)
+        value = super().pop(key)
+        self._mark(key)
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        key, value = super().popitem()
+        self._mark(key)
+        return key, value
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def clear(self) -> None:
+        keys = list(self)
+        super().clear()
+        for key in keys:
+            self._mark(key)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (dict(self),))
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict:
+        from copy import deepcopy
+
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+
+class PendingChanges:
+    """Changes drained from tracked collections and not yet written, per key.
+
+    Later changes to the same row or key replace earlier ones, so a burst of
+    edits is written once. ``restore`` puts back a batch whose write failed
+    without overriding anything recorded since.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._changes: dict[str, dict[Any, Any]] = {}
+
+    def add(self, key: str, changes: dict[Any, Any]) -> None:
+        with self._lock:
+            pending = self._changes.setdefault(key, {})
+            for item, value in changes.items():
+                pending.pop(item, None)
+                pending[item] = value
+
+    def take(self, key: str) -> dict[Any, Any]:
+        with self._lock:
+            return self._changes.pop(key, {})
+
+    def restore(self, key: str, changes: dict[Any, Any]) -> None:
+        with self._lock:
+            newer = self._changes.get(key, {})
+            merged = {item: value for item, value in changes.items() if item not in newer}
+            merged.update(newer)
+            self._changes[key] = merged
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from typing import Callable
+
+
+class WriteBehindQueue:
+    """Background writer that coalesces persistence jobs by key.
+
+    ``submit`` returns immediately. A worker thread waits ``delay`` seconds
+    after the first pending job so that a burst of changes to the same state
+    collapses into one write: only the latest job per key runs. ``flush``
+    blocks until everything submitted so far is written, and ``close`` (also
+    registered with ``atexit``) flushes and stops the worker.
+    """
+
+    def __init__(
+        self,
+        delay: float = 0.05,
+        on_error: Callable[[str, Exception], None] | None = None,
+        name: str = "nova-write-behind",
+    ) -> None:
+        self.delay = max(0.0, delay)
+        self._on_error = on_error
+        self._pending: dict[str, Callable[[], None]] = {}
+        self._condition = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._flushing = 0
+        self.submitted = 0
+        self.written = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, key: str, job: Callable[[], None]) -> None:
+        """Schedule ``job``; it replaces any job still pending under ``key``."""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("write-behind queue is closed")
+            self._pending.pop(key, None)
+            self._pending[key] = job
+            self.submitted += 1
+            self._condition.notify_all()
+
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._pending) + (1 if self._busy else 0)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every submitted job has run. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                while self._pending or self._busy:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+                return True
+            finally:
+                self._flushing -= 1
+
+    def close(self, timeout: float | None = None) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+
+    def _take_batch(self) -> list[tuple[str, Callable[[], None]]] | None:
+        with self._condition:
+            while not self._pending and not self._closed:
+                self._condition.wait()
+            if not self._pending:
+                return None
+            # Let a burst finish; flush() and close() cut the wait short.
+            deadline = time.monotonic() + self.delay
+            while not self._closed and not self._flushing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            batch = list(self._pending.items())
+            self._pending.clear()
+            self._busy = True
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if batch is None:
+                return
+            for key, job in batch:
+                try:
+                    job()
+                except Exception as exc:
+                    if self._on_error is not None:
+                        self._on_error(key, exc)
+                    else:
+                        logging.getLogger("voice_assistant").exception("Write-behind job %s failed", key)
+            with self._condition:
+                self.written += len(batch)
+                self._busy = False
+                self._condition.notify_all()
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from itertools import count
+import json
+from pathlib import Path
+from typing import Any, Iterable
+
+
+def _copy(value: Any) -> Any:
+    return dict(value) if isinstance(value, dict) else value
+
+
+@dataclass(frozen=True)
+class Delta:
+    """One reversible change to a named collection of the assistant.
+
+    ``splice`` replaces ``before`` (a list of items) at position ``key`` of a
+    list with ``after``; inserts and deletes are splices with one side empty.
+    ``update`` changes some fields of the dict item at position ``key``, with
+    ``before``/``after`` holding only those fields. ``put`` sets ``key`` of a
+    dict, where None stands for an absent key.
+    """
+
+    collection: str
+    op: str
+    key: int | str
+    before: Any = None
+    after: Any = None
+
+    def inverse(self) -> Delta:
+        return Delta(self.collection, self.op, self.key, self.after, self.before)
+
+    def as_list(self) -> list[Any]:
+        return [self.collection, self.op, self.key, self.before, self.after]
+
+
+def inserted(collection: str, position: int, items: Iterable[Any]) -> Delta:
+    return Delta(collection, "splice", position, [], [_copy(item) for item in items])
+
+
+def removed(collection: str, position: int, items: Iterable[Any]) -> Delta:
+    return Delta(collection, "splice", position, [_copy(item) for item in items], [])
+
+
+def updated(collection: str, position: int, before: dict[str, Any], after: dict[str, Any]) -> Delta:
+    return Delta(collection, "update", position, dict(before), dict(after))
+
+
+def put(collection: str, key: str, before: Any, after: Any) -> Delta:
+    return Delta(collection, "put", key, before, after)
+
+
+class JournalConflict(Exception):
+    """The collection no longer looks the way the journal expects."""
+
+
+def _apply(state: Any, delta: Delta) -> None:
+    """Apply ``delta`` to ``getattr(state, delta.collection)``, checking the current value first.
+
+    The check only looks at the positions the delta touches, so applying
+    costs the size of the delta, not of the collection.
+    """
+    target = getattr(state, delta.collection)
+    if delta.op == "splice":
+        start = int(delta.key)
+        end = start + len(delta.before)
+        if end > len(target) or list(target[start:end]) != delta.before:
+            raise JournalConflict(delta.collection)
+        target[start:end] = [_copy(item) for item in delta.after]
+    elif delta.op == "update":
+        index = int(delta.key)
+        if index >= len(target) or any(target[index].get(name) != value for name, value in delta.before.items()):
+            raise JournalConflict(delta.collection)
+        target[index].update(delta.after)
+    elif delta.op == "put":
+        if target.get(delta.key) != delta.before:
+            raise JournalConflict(delta.collection)
+        if delta.after is None:
+            target.pop(delta.key, None)
+        else:
+            target[delta.key] = delta.after
+    else:
+        raise ValueError(f"Unknown journal operation: {delta.op}")
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    label: str
+    deltas: tuple[Delta, ...]
+
+    @property
+    def collections(self) -> list[str]:
+        return list(dict.fromkeys(delta.collection for delta in self.deltas))
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"label": self.label, "deltas": [delta.as_list() for delta in self.deltas]}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> JournalEntry:
+        return cls(str(data["label"]), tuple(Delta(*item) for item in data["deltas"]))
+
+
+class UndoJournal:
+    """Bounded undo/redo history of the changes made by commands.
+
+    ``record`` pushes an entry and forgets anything that could be redone;
+    ``undo`` and ``redo`` apply an entry's deltas (reversed for undo) to the
+    collections on ``state`` and move it to the other stack. Only the newest
+    ``depth`` entries are kept.
+
+    Each of those steps is also recorded as a small storage operation, so a
+    store can keep its copy in sync without rewriting the whole journal:
+    ``("push", stack, entry)``, ``("move", from_stack, to_stack)`` (the newest
+    entry changes stacks), ``("drop_oldest", stack)`` and ``("clear", None)``.
+    ``drain_changes`` returns them keyed by sequence number, in order.
+    """
+
+    def __init__(self, depth: int = 20) -> None:
+        self.depth = max(1, depth)
+        self._undo: deque[JournalEntry] = deque(maxlen=self.depth)
+        self._redo: deque[JournalEntry] = deque(maxlen=self.depth)
+        self._sequence = count()
+        self._changes: dict[int, tuple[Any, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def record(self, label: str, deltas: Iterable[Delta]) -> None:
+        changes = tuple(deltas)
+        if not changes:
+            return
+        entry = JournalEntry(label, changes)
+        self._push(self._undo, "undo", entry)
+        self._log("push", "undo", entry.as_dict())
+        if self._redo:
+            self._redo.clear()
+            self._log("clear", "redo")
+
+    def undo(self, state: Any) -> JournalEntry | None:
+        """Revert the newest entry. Raises ``JournalConflict`` (and clears the journal) if it no longer applies."""
+        if not self._undo:
+            return None
+        entry = self._undo[-1]
+        self._replay(state, [delta.inverse() for delta in reversed(entry.deltas)])
+        self._undo.pop()
+        self._push(self._redo, "redo", entry)
+        self._log("move", "undo", "redo")
+        return entry
+
+    def redo(self, state: Any) -> JournalEntry | None:
+        if not self._redo:
+            return None
+        entry = self._redo[-1]
+        self._replay(state, list(entry.deltas))
+        self._redo.pop()
+        self._push(self._undo, "undo", entry)
+        self._log("move", "redo", "undo")
+        return entry
+
+    def _push(self, stack: deque[JournalEntry], name: str, entry: JournalEntry) -> None:
+        if len(stack) == self.depth:
+            self._log("drop_oldest", name)
+        stack.append(entry)
+
+    def _log(self, *change: Any) -> None:
+        self._changes[next(self._sequence)] = change
+
+    def drain_changes(self) -> dict[int, tuple[Any, ...]]:
+        """Return and forget the storage operations recorded since the last drain."""
+        changes, self._changes = self._changes, {}
+        return changes
+
+    def _replay(self, state: Any, deltas: list[Delta]) -> None:
+        applied: list[Delta] = []
+        try:
+            for delta in deltas:
+                _apply(state, delta)
+                applied.append(delta)
+        except JournalConflict:
+            for delta in reversed(applied):
+                _apply(state, delta.inverse())
+            self.clear()
+            raise
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+        self._log("clear", None)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "undo": [entry.as_dict() for entry in self._undo],
+            "redo": [entry.as_dict() for entry in self._redo],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Any, depth: int = 20) -> UndoJournal:
+        journal = cls(depth)
+        if not isinstance(data, dict):
+            return journal
+        try:
+            undo = [JournalEntry.from_dict(item) for item in data.get("undo", [])]
+            redo = [JournalEntry.from_dict(item) for item in data.get("redo", [])]
+        except (KeyError, TypeError):
+            journal.clear()
+            return journal
+        journal._undo.extend(undo)
+        journal._redo.extend(redo)
+        if len(journal._undo) < len(undo) or len(journal._redo) < len(redo):
+            # Saved with a larger depth: have the store keep only what is loaded.
+            journal._log("clear", None)
+            for name, stack in (("undo", journal._undo), ("redo", journal._redo)):
+                for entry in stack:
+                    journal._log("push", name, entry.as_dict())
+        return journal
+
+
+def load_journal(path: str) -> dict[str, Any]:
+    file_path = Path(path)
+    if not file_path.exists():
+        return {}
+    try:
+        data = json.loads(file_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_journal(path: str, data: dict[str, Any]) -> None:
+    Path(path).write_text(json.dumps(data), encoding="utf-8")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import atexit
 import os
 import secrets
 from datetime import timedelta
@@ -7,9 +8,11 @@ from functools import wraps
 from flask import Flask, redirect, render_template_string, request, session, url_for, flash
 
 from voice_assistant.config import Settings
+from voice_assistant.intents import rank_intents
+from voice_assistant.skills.expenses import expense_report_text, month_range
 from voice_assistant.skills.contacts import add_contact, list_contacts_text, resolve_contact_number
 from voice_assistant.skills.phone import make_call, send_sms, send_whatsapp_message
-from voice_assistant.skills.tasks import complete_task, delete_task, list_tasks_text, add_task
+from voice_assistant.skills.tasks import list_tasks_text, add_task
 from voice_assistant.skills.reminders import load_reminders
 from voice_assistant.skills.calendar_tools import add_event, show_schedule_text
 from voice_assistant.skills.tasks import load_tasks
@@ -38,7 +41,11 @@ store = SQLiteStore(
         contacts_file=settings.contacts_file,
         events_file=settings.events_file,
     ),
+    persistent_connections=settings.sqlite_persistent_connections,
+    synchronous=settings.sqlite_synchronous,
+    cache_size_kb=settings.sqlite_cache_kb,
 )
+atexit.register(store.close)
 
 
 def login_required(view):
@@ -64,6 +71,12 @@ def root() -> str:
     events = load_events(settings.events_file) if not store else store.load_events()
     tasks_text = list_tasks_text(tasks)
     events_text = show_schedule_text(events)
+    month_start, month_end = month_range()
+    expense_text = expense_report_text(
+        store.expense_total(month_start, month_end), store.top_expense_categories(month_start, month_end)
+    )
+    command = request.args.get("command", "").strip()
+    candidates = rank_intents(command, k=5) if command else []
     return render_template_string(
         """
         <h2>Nova Assistant Dashboard</h2>
@@ -126,6 +139,8 @@ def root() -> str:
             <input type="hidden" name="csrf" value="{{ csrf }}">
             <button type="submit">Clear Reminders</button>
         </form>
+        <h3>Expenses</h3>
+        <p>{{ expense_text }}</p>
         <h3>Schedule</h3>
         <p>{{ events_text }}</p>
         <form method="post" action="{{ url_for('add_event_route') }}">
@@ -134,6 +149,21 @@ def root() -> str:
             <input type="hidden" name="csrf" value="{{ csrf }}">
             <button type="submit">Add Event</button>
         </form>
+        <h3>Intent Check</h3>
+        <form method="get" action="{{ url_for('root') }}">
+            Command: <input name="command" value="{{ command }}">
+            <button type="submit">Rank Intents</button>
+        </form>
+        {% if command %}
+          <ol>
+          {% for candidate in candidates %}
+            <li>{{ candidate.intent.intent_type.value }}{% if candidate.intent.payload %} ({{ candidate.intent.payload }}){% endif %}
+              - {{ "%.2f"|format(candidate.confidence) }} {{ candidate.evidence }}{% if candidate.matched %} "{{ candidate.matched }}"{% endif %}</li>
+          {% else %}
+            <li>No intent matched.</li>
+          {% endfor %}
+          </ol>
+        {% endif %}
         <p><a href="{{ url_for('logout') }}">Logout</a></p>
         {% with messages = get_flashed_messages() %}
           {% if messages %}
@@ -149,6 +179,9 @@ def root() -> str:
         tasks_text=tasks_text,
         reminders=", ".join(reminders),
         events_text=events_text,
+        expense_text=expense_text,
+        command=command,
+        candidates=candidates,
         csrf=session.get("csrf", ""),
     )
 
@@ -272,9 +305,10 @@ def add_task_route():
         flash("CSRF token mismatch.")
         return redirect(url_for("root"))
     task = request.form.get("task", "")
-    tasks = store.load_tasks()
-    msg = add_task(tasks, task)
-    store.save_tasks(tasks)
+    added: list[dict[str, object]] = []
+    msg = add_task(added, task)
+    for item in added:
+        store.insert_task(item)
     flash(msg)
     return redirect(url_for("root"))
 
@@ -286,12 +320,14 @@ def complete_task_route():
         flash("CSRF token mismatch.")
         return redirect(url_for("root"))
     index = request.form.get("index", "")
-    tasks = store.load_tasks()
     try:
-        idx = int(index)
-        msg = complete_task(tasks, idx)
-        store.save_tasks(tasks)
-        flash(msg)
+        row = store.task_at(int(index))
+        if row is None:
+            flash("Task number is out of range.")
+        else:
+            task_id, task = row
+            store.update_task(task_id, done=True)
+            flash(f"Task marked done: {task['text']}")
     except Exception as exc:
         flash(f"Could not complete task: {exc}")
     return redirect(url_for("root"))
@@ -304,12 +340,14 @@ def delete_task_route():
         flash("CSRF token mismatch.")
         return redirect(url_for("root"))
     index = request.form.get("index", "")
-    tasks = store.load_tasks()
     try:
-        idx = int(index)
-        msg = delete_task(tasks, idx)
-        store.save_tasks(tasks)
-        flash(msg)
+        row = store.task_at(int(index))
+        if row is None:
+            flash("Task number is out of range.")
+        else:
+            task_id, task = row
+            store.delete_task(task_id)
+            flash(f"Deleted task: {task['text']}")
     except Exception as exc:
         flash(f"Could not delete task: {exc}")
     return redirect(url_for("root"))
@@ -322,9 +360,7 @@ def add_reminder_route():
         flash("CSRF token mismatch.")
         return redirect(url_for("root"))
     text = request.form.get("text", "")
-    reminders = store.load_reminders()
-    reminders.append(text)
-    store.save_reminders(reminders)
+    store.insert_reminder(text)
     flash("Reminder added.")
     return redirect(url_for("root"))
 
@@ -336,12 +372,10 @@ def delete_reminder_route():
         flash("CSRF token mismatch.")
         return redirect(url_for("root"))
     index = request.form.get("index", "")
-    reminders = store.load_reminders()
     try:
-        idx = int(index)
-        if 1 <= idx <= len(reminders):
-            reminders.pop(idx - 1)
-            store.save_reminders(reminders)
+        row = store.reminder_at(int(index))
+        if row is not None:
+            store.delete_reminder(row[0])
             flash("Reminder deleted.")
         else:
             flash("Index out of range.")
@@ -369,9 +403,10 @@ def add_event_route():
         return redirect(url_for("root"))
     title = request.form.get("title", "")
     when = request.form.get("when", "")
-    events = store.load_events()
-    msg = add_event(events, title, when)
-    store.save_events(events)
+    added: list[dict[str, str]] = []
+    msg = add_event(added, title, when)
+    for item in added:
+        store.insert_event(item)
     flash(msg)
     return redirect(url_for("root"))
 